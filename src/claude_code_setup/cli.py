@@ -410,9 +410,11 @@ def remove(
     # Load and execute the remove command
     from .commands.remove import run_remove_command
     
+    # The top-level command only removes templates, so skip the type prompt
     run_remove_command(
         ctx=ctx,
-        templates=templates,
+        items=templates,
+        type="template",
         all=all,
         permission=permission,
         test_dir=test_dir,
@@ -629,10 +631,17 @@ def settings(
 
 
 @cli.group()
+@click.option(
+    "--batch",
+    is_flag=True,
+    envvar="CLAUDE_SETUP_BATCH",
+    help="Never prompt; fail when a required argument is missing",
+)
 @click.pass_context
-def plugins(ctx: click.Context) -> None:
+def plugins(ctx: click.Context, batch: bool) -> None:
     """🔌 Manage Claude Code Setup plugins."""
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj["batch"] = batch
 
 
 @plugins.command("list")
@@ -640,7 +649,7 @@ def plugins(ctx: click.Context) -> None:
     "--status",
     type=click.Choice(["all", "available", "installed", "active"]),
     default="all",
-    help="Filter plugins by status",
+    help="Filter plugins by status (installed and active skip plugin discovery)",
 )
 @click.option(
     "-t",
@@ -659,24 +668,11 @@ def plugins_list(
     no_interactive: bool,
 ) -> None:
     """List available and installed plugins."""
-    from .commands.plugins import plugins_group
+    from .commands.plugins import invoke_plugin_command, list_plugins
     
-    # Create a new context for the plugins group with test_dir
-    plugins_ctx = plugins_group.make_context(
-        'plugins', 
-        ['--test-dir', test_dir] if test_dir else [],
-        parent=ctx
+    invoke_plugin_command(
+        ctx, test_dir, list_plugins, status=status, no_interactive=no_interactive
     )
-    
-    # Now invoke the list command
-    with plugins_ctx:
-        list_cmd = plugins_group.commands['list']
-        list_cmd.invoke(click.Context(
-            list_cmd,
-            parent=plugins_ctx,
-            info_name='list',
-            obj=plugins_ctx.obj
-        ), status=status, no_interactive=no_interactive)
 
 
 @plugins.command("add")
@@ -706,23 +702,16 @@ def plugins_add(
     test_dir: Optional[str],
 ) -> None:
     """Install a plugin."""
-    from .commands.plugins import plugins_group, add_plugin
+    from .commands.plugins import invoke_plugin_command, add_plugin
     
-    # Create a new context for the plugins group with test_dir
-    plugins_ctx = plugins_group.make_context(
-        'plugins', 
-        ['--test-dir', test_dir] if test_dir else [],
-        parent=ctx
+    invoke_plugin_command(
+        ctx,
+        test_dir,
+        add_plugin,
+        plugin_name=plugin_name,
+        from_file=Path(from_file) if from_file else None,
+        activate=activate,
     )
-    
-    # Now invoke the add command
-    with plugins_ctx:
-        add_plugin.invoke(click.Context(
-            add_plugin,
-            parent=plugins_ctx,
-            info_name='add',
-            obj=plugins_ctx.obj
-        ), plugin_name=plugin_name, from_file=Path(from_file) if from_file else None, activate=activate)
 
 
 @plugins.command("remove")
@@ -747,23 +736,11 @@ def plugins_remove(
     test_dir: Optional[str],
 ) -> None:
     """Remove an installed plugin."""
-    from .commands.plugins import plugins_group, remove_plugin
+    from .commands.plugins import invoke_plugin_command, remove_plugin
     
-    # Create a new context for the plugins group with test_dir
-    plugins_ctx = plugins_group.make_context(
-        'plugins', 
-        ['--test-dir', test_dir] if test_dir else [],
-        parent=ctx
+    invoke_plugin_command(
+        ctx, test_dir, remove_plugin, plugin_name=plugin_name, force=force
     )
-    
-    # Now invoke the remove command
-    with plugins_ctx:
-        remove_plugin.invoke(click.Context(
-            remove_plugin,
-            parent=plugins_ctx,
-            info_name='remove',
-            obj=plugins_ctx.obj
-        ), plugin_name=plugin_name, force=force)
 
 
 @plugins.command("info")
@@ -781,23 +758,9 @@ def plugins_info(
     test_dir: Optional[str],
 ) -> None:
     """Show detailed information about a plugin."""
-    from .commands.plugins import plugins_group, plugin_info
-    
-    # Create a new context for the plugins group with test_dir
-    plugins_ctx = plugins_group.make_context(
-        'plugins', 
-        ['--test-dir', test_dir] if test_dir else [],
-        parent=ctx
-    )
+    from .commands.plugins import invoke_plugin_command, plugin_info
     
-    # Now invoke the info command
-    with plugins_ctx:
-        plugin_info.invoke(click.Context(
-            plugin_info,
-            parent=plugins_ctx,
-            info_name='info',
-            obj=plugins_ctx.obj
-        ), plugin_name=plugin_name)
+    invoke_plugin_command(ctx, test_dir, plugin_info, plugin_name=plugin_name)
 
 
 def load_commands() -> None:
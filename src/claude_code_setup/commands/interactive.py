@@ -1,10 +1,15 @@
 """Interactive command workflows for claude-code-setup."""
 
+import os
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 
 import click
-from rich.console import Console
+from rich.align import Align
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.columns import Columns
@@ -22,81 +27,172 @@ from ..core.registry import get_registry
 
 console = Console()
 
+# Menu options shown by the interactive menus: (icon, title, description)
+_MAIN_MENU_OPTIONS = (
+    ("🚀", "Quick Setup", "Initialize with recommended settings"),
+    ("📝", "Manage Templates", "Add, update, or remove templates"),
+    ("🛡️", "Manage Hooks", "Configure automation and security hooks"),
+    ("⚙️", "Configure Settings", "Customize themes and permissions"),
+    ("📋", "View Configuration", "List installed templates and settings"),
+    ("🔄", "Update All", "Update all installed templates"),
+    ("❌", "Exit", "Exit interactive mode"),
+)
 
-def show_main_menu() -> Optional[str]:
-    """Show the main interactive menu.
+_TEMPLATE_MENU_OPTIONS = (
+    ("➕", "Add Templates", "Install new templates"),
+    ("🔄", "Update Templates", "Update installed templates"),
+    ("➖", "Remove Templates", "Remove installed templates"),
+    ("🔍", "Search Templates", "Search for specific templates"),
+    ("👁️", "Preview Template", "View template content before installing"),
+    ("⬅️", "Back to Main Menu", "Return to main menu"),
+)
+
+_SETTINGS_MENU_OPTIONS = (
+    ("🎨", "Change Theme", "Select a different UI theme"),
+    ("🔑", "Manage Permissions", "Add or remove tool permissions"),
+    ("🌍", "Environment Variables", "Configure environment variables"),
+    ("💾", "Export Settings", "Export settings to share"),
+    ("📥", "Import Settings", "Import settings from file"),
+    ("🔄", "Reset to Defaults", "Reset all settings to defaults"),
+    ("⬅️", "Back to Main Menu", "Return to main menu"),
+)
+
+
+def _build_menu_table(
+    options: Tuple[Tuple[str, str, str], ...],
+    icon_color: str,
+    expand: bool = False,
+) -> Table:
+    """Build the options table for a menu.
     
+    Args:
+        options: Menu options as (icon, title, description) tuples
+        icon_color: Rich color used for the option icons
+        expand: Whether the table should fill the available width
+        
     Returns:
-        Selected action or None if cancelled
+        Rich table listing the menu options
     """
-    # Create header
-    header = create_gradient_text(
-        "Claude Code Setup - Interactive Mode",
-        style="bold",
-    )
-    console.print("\n")
-    console.print(header, justify="center")
-    console.print("\n")
-    
-    # Create menu options
-    options = [
-        ("🚀", "Quick Setup", "Initialize with recommended settings"),
-        ("📝", "Manage Templates", "Add, update, or remove templates"),
-        ("🛡️", "Manage Hooks", "Configure automation and security hooks"),
-        ("⚙️", "Configure Settings", "Customize themes and permissions"),
-        ("📋", "View Configuration", "List installed templates and settings"),
-        ("🔄", "Update All", "Update all installed templates"),
-        ("❌", "Exit", "Exit interactive mode"),
-    ]
-    
-    # Create options table
     table = Table(
         show_header=False,
         box=None,
         padding=(0, 2),
-        expand=True,
+        expand=expand,
     )
     
     for icon, title, description in options:
         table.add_row(
-            f"[cyan]{icon}[/cyan]",
+            f"[{icon_color}]{icon}[/{icon_color}]",
             f"[bold]{title}[/bold]",
             f"[dim]{description}[/dim]",
         )
     
+    return table
+
+
+def _digit_range_validator(
+    low: int, high: int
+) -> Callable[[str], Tuple[bool, Optional[str]]]:
+    """Create a validator accepting whole numbers within an inclusive range.
+    
+    Args:
+        low: Smallest accepted number
+        high: Largest accepted number
+        
+    Returns:
+        Validator returning (is_valid, error_message) for ValidatedPrompt
+    """
+    error_message = f"Please enter a number between {low}-{high}"
+    
+    def validate(value: str) -> Tuple[bool, Optional[str]]:
+        if value.isdigit() and low <= int(value) <= high:
+            return True, None
+        return False, error_message
+    
+    return validate
+
+
+_VALIDATE_1_6 = _digit_range_validator(1, 6)
+_VALIDATE_1_7 = _digit_range_validator(1, 7)
+
+# Actions indexed by the validated menu number (index 0 is never selected)
+_MAIN_MENU_ACTIONS: Tuple[Optional[str], ...] = (
+    None,
+    "quick-setup",
+    "manage-templates",
+    "manage-hooks",
+    "configure-settings",
+    "view-config",
+    "update-all",
+    None,
+)
+
+_TEMPLATE_MENU_ACTIONS: Tuple[Optional[str], ...] = (
+    None,
+    "add-templates",
+    "update-templates",
+    "remove-templates",
+    "search-templates",
+    "preview-template",
+    "main-menu",
+)
+
+_SETTINGS_MENU_ACTIONS: Tuple[Optional[str], ...] = (
+    None,
+    "change-theme",
+    "manage-permissions",
+    "env-variables",
+    "export-settings",
+    "import-settings",
+    "reset-settings",
+    "main-menu",
+)
+
+# Menu renderables never change, so build them once at import and reuse
+# them on every redraw of the interactive loop.
+_MAIN_MENU_PANEL = Panel(
+    _build_menu_table(_MAIN_MENU_OPTIONS, "cyan", expand=True),
+    title="What would you like to do?",
+    border_style="cyan",
+    padding=(1, 2),
+)
+_TEMPLATE_MENU_TABLE = _build_menu_table(_TEMPLATE_MENU_OPTIONS, "yellow")
+_SETTINGS_MENU_TABLE = _build_menu_table(_SETTINGS_MENU_OPTIONS, "green")
+
+# Gradient banners assign a style per character; compute them once as well.
+_MAIN_MENU_HEADER = create_gradient_text(
+    "Claude Code Setup - Interactive Mode",
+    style="bold",
+)
+_WELCOME_BANNER = create_gradient_text(
+    "Welcome to Claude Code Setup Interactive Mode",
+    style="bold",
+)
+
+
+def show_main_menu() -> Optional[str]:
+    """Show the main interactive menu.
+    
+    Returns:
+        Selected action or None if cancelled
+    """
     console.print(
-        Panel(
-            table,
-            title="What would you like to do?",
-            border_style="cyan",
-            padding=(1, 2),
+        Group(
+            Text("\n"), Align.center(_MAIN_MENU_HEADER), Text("\n"), _MAIN_MENU_PANEL
         )
     )
     
     # Create prompt
     prompt = ValidatedPrompt(
         message="Select an option (1-7)",
-        validator=lambda x: (
-            x.isdigit() and 1 <= int(x) <= 7,
-            None if x.isdigit() and 1 <= int(x) <= 7 else "Please enter a number between 1-7"
-        ),
+        validator=_VALIDATE_1_7,
     )
     
     choice = prompt.ask()
     if not choice:
         return None
         
-    action_map = {
-        "1": "quick-setup",
-        "2": "manage-templates",
-        "3": "manage-hooks",
-        "4": "configure-settings",
-        "5": "view-config",
-        "6": "update-all",
-        "7": None,
-    }
-    
-    return action_map.get(choice)
+    return _MAIN_MENU_ACTIONS[int(choice)]
 
 
 def template_management_menu() -> Optional[str]:
@@ -105,55 +201,23 @@ def template_management_menu() -> Optional[str]:
     Returns:
         Selected action or None if cancelled
     """
-    console.print("\n[bold cyan]Template Management[/bold cyan]\n")
-    
-    options = [
-        ("➕", "Add Templates", "Install new templates"),
-        ("🔄", "Update Templates", "Update installed templates"),
-        ("➖", "Remove Templates", "Remove installed templates"),
-        ("🔍", "Search Templates", "Search for specific templates"),
-        ("👁️", "Preview Template", "View template content before installing"),
-        ("⬅️", "Back to Main Menu", "Return to main menu"),
-    ]
-    
-    # Create options table
-    table = Table(
-        show_header=False,
-        box=None,
-        padding=(0, 2),
-    )
-    
-    for icon, title, description in options:
-        table.add_row(
-            f"[yellow]{icon}[/yellow]",
-            f"[bold]{title}[/bold]",
-            f"[dim]{description}[/dim]",
+    console.print(
+        Group(
+            Text.from_markup("\n[bold cyan]Template Management[/bold cyan]\n"),
+            _TEMPLATE_MENU_TABLE,
         )
-    
-    console.print(table)
+    )
     
     prompt = ValidatedPrompt(
         message="Select an option (1-6)",
-        validator=lambda x: (
-            x.isdigit() and 1 <= int(x) <= 6,
-            None if x.isdigit() and 1 <= int(x) <= 6 else "Please enter a number between 1-6"
-        ),
+        validator=_VALIDATE_1_6,
     )
     
     choice = prompt.ask()
     if not choice:
         return None
         
-    action_map = {
-        "1": "add-templates",
-        "2": "update-templates",
-        "3": "remove-templates",
-        "4": "search-templates",
-        "5": "preview-template",
-        "6": "main-menu",
-    }
-    
-    return action_map.get(choice)
+    return _TEMPLATE_MENU_ACTIONS[int(choice)]
 
 
 def settings_configuration_menu() -> Optional[str]:
@@ -162,68 +226,98 @@ def settings_configuration_menu() -> Optional[str]:
     Returns:
         Selected action or None if cancelled
     """
-    console.print("\n[bold cyan]Settings Configuration[/bold cyan]\n")
-    
-    options = [
-        ("🎨", "Change Theme", "Select a different UI theme"),
-        ("🔑", "Manage Permissions", "Add or remove tool permissions"),
-        ("🌍", "Environment Variables", "Configure environment variables"),
-        ("💾", "Export Settings", "Export settings to share"),
-        ("📥", "Import Settings", "Import settings from file"),
-        ("🔄", "Reset to Defaults", "Reset all settings to defaults"),
-        ("⬅️", "Back to Main Menu", "Return to main menu"),
-    ]
-    
-    # Create options table
-    table = Table(
-        show_header=False,
-        box=None,
-        padding=(0, 2),
-    )
-    
-    for icon, title, description in options:
-        table.add_row(
-            f"[green]{icon}[/green]",
-            f"[bold]{title}[/bold]",
-            f"[dim]{description}[/dim]",
+    console.print(
+        Group(
+            Text.from_markup("\n[bold cyan]Settings Configuration[/bold cyan]\n"),
+            _SETTINGS_MENU_TABLE,
         )
-    
-    console.print(table)
+    )
     
     prompt = ValidatedPrompt(
         message="Select an option (1-7)",
-        validator=lambda x: (
-            x.isdigit() and 1 <= int(x) <= 7,
-            None if x.isdigit() and 1 <= int(x) <= 7 else "Please enter a number between 1-7"
-        ),
+        validator=_VALIDATE_1_7,
     )
     
     choice = prompt.ask()
     if not choice:
         return None
         
-    action_map = {
-        "1": "change-theme",
-        "2": "manage-permissions",
-        "3": "env-variables",
-        "4": "export-settings",
-        "5": "import-settings",
-        "6": "reset-settings",
-        "7": "main-menu",
-    }
+    return _SETTINGS_MENU_ACTIONS[int(choice)]
+
+
+@dataclass
+class TemplateIndex:
+    """Precomputed views of the available templates for interactive browsing."""
+    templates: List[Any]
+    sorted_templates: List[Any]
+    by_category: Dict[str, List[Any]]
+    search_keys: Dict[str, List[Tuple[Any, str, str, str]]]
+    max_name_len: int = 0
+    max_description_len: int = 0
+    max_category_len: int = 0
+    
+    @property
+    def max_field_len(self) -> int:
+        """Length of the longest searchable field across all templates."""
+        return max(
+            self.max_name_len, self.max_description_len, self.max_category_len
+        )
+
+
+def build_template_index(templates: List[Any]) -> TemplateIndex:
+    """Sort and group templates once so menus can reuse the result.
+    
+    Args:
+        templates: List of available templates
+        
+    Returns:
+        TemplateIndex with templates sorted by (category, name) and grouped
+        by category in sorted order
+    """
+    sorted_templates = sorted(templates, key=lambda t: (t.category, t.name))
     
-    return action_map.get(choice)
+    # Case-folded (template, name, description, category) rows per category,
+    # computed once so searches don't re-normalize every field
+    by_category: Dict[str, List[Any]] = defaultdict(list)
+    search_keys: Dict[str, List[Tuple[Any, str, str, str]]] = defaultdict(list)
+    for template in sorted_templates:
+        by_category[template.category].append(template)
+        search_keys[template.category].append((
+            template,
+            template.name.casefold(),
+            template.description.casefold(),
+            template.category.casefold(),
+        ))
+    
+    rows = [row for category_rows in search_keys.values() for row in category_rows]
+    
+    return TemplateIndex(
+        templates=list(templates),
+        sorted_templates=sorted_templates,
+        by_category=dict(by_category),
+        search_keys=dict(search_keys),
+        max_name_len=max((len(row[1]) for row in rows), default=0),
+        max_description_len=max((len(row[2]) for row in rows), default=0),
+        max_category_len=max((len(row[3]) for row in rows), default=0),
+    )
 
 
-def search_templates_interactive(templates: List[Any]) -> Optional[List[str]]:
+def search_templates_interactive(
+    templates: List[Any],
+    index: Optional[TemplateIndex] = None,
+) -> Optional[List[str]]:
     """Interactive template search with filtering.
     
     Args:
         templates: List of available templates
+        index: Prebuilt index of templates (built from templates if omitted)
         
     Returns:
         Selected template names or None if cancelled
     """
+    if index is None:
+        index = build_template_index(templates)
+    
     console.print("\n[bold cyan]Search Templates[/bold cyan]\n")
     
     # Get search query
@@ -237,35 +331,43 @@ def search_templates_interactive(templates: List[Any]) -> Optional[List[str]]:
     if query is None:
         return None
         
-    # Filter templates
-    filtered_templates = []
-    query_lower = query.lower()
-    
-    for template in templates:
-        if not query or (
-            query_lower in template.name.lower() or
-            query_lower in template.description.lower() or
-            query_lower in template.category.lower()
-        ):
-            filtered_templates.append(template)
-    
-    if not filtered_templates:
+    # Filter templates within each presorted category; an empty query
+    # browses everything, so skip the per-template checks entirely
+    if not query:
+        by_category = index.by_category
+    else:
+        by_category = {}
+        query_key = query.casefold()
+        query_len = len(query_key)
+        check_name = query_len <= index.max_name_len
+        check_description = query_len <= index.max_description_len
+        check_category = query_len <= index.max_category_len
+        
+        # A query longer than every searchable field cannot match anything
+        if query_len <= index.max_field_len:
+            for category, rows in index.search_keys.items():
+                matches = [
+                    template for template, name, description, category_key in rows
+                    if (check_name and query_key in name)
+                    or (check_description and query_key in description)
+                    or (check_category and query_key in category_key)
+                ]
+                if matches:
+                    by_category[category] = matches
+    
+    if not by_category:
         warning("No templates found matching your search.")
         return None
-        
-    # Group by category
-    by_category = {}
-    for template in filtered_templates:
-        if template.category not in by_category:
-            by_category[template.category] = []
-        by_category[template.category].append(template)
     
-    # Create selection choices
+    # Create selection choices, remembering which template each row names
     choices = []
-    for category in sorted(by_category.keys()):
+    choice_to_name: Dict[str, str] = {}
+    for category, category_templates in by_category.items():
         choices.append(f"[dim]{category.upper()}[/dim]")
-        for template in sorted(by_category[category], key=lambda t: t.name):
-            choices.append(f"  {template.name} - {template.description}")
+        for template in category_templates:
+            choice = f"  {template.name} - {template.description}"
+            choices.append(choice)
+            choice_to_name[choice] = template.name
     
     # Show multi-select
     prompt = MultiSelectPrompt(
@@ -278,21 +380,19 @@ def search_templates_interactive(templates: List[Any]) -> Optional[List[str]]:
     if not selected:
         return None
         
-    # Extract template names
-    template_names = []
-    for choice in selected:
-        if choice.startswith("  "):
-            name = choice[2:].split(" - ")[0]
-            template_names.append(name)
-            
-    return template_names
+    # Map selected rows back to template names; category headers are skipped
+    return [choice_to_name[choice] for choice in selected if choice in choice_to_name]
 
 
-def preview_template_interactive(templates: List[Any]) -> bool:
+def preview_template_interactive(
+    templates: List[Any],
+    index: Optional[TemplateIndex] = None,
+) -> bool:
     """Show template content preview.
     
     Args:
         templates: List of available templates
+        index: Prebuilt index of templates (built from templates if omitted)
         
     Returns:
         True to continue browsing, False to exit
@@ -318,7 +418,10 @@ def preview_template_interactive(templates: List[Any]) -> bool:
         table.add_column("Category", style="yellow")
         table.add_column("Description", style="dim")
         
-        for template in sorted(templates, key=lambda t: (t.category, t.name)):
+        if index is None:
+            index = build_template_index(templates)
+        
+        for template in index.sorted_templates:
             table.add_row(
                 template.name,
                 template.category,
@@ -361,6 +464,50 @@ def preview_template_interactive(templates: List[Any]) -> bool:
     return True
 
 
+# Configuration summaries per target directory, with the signature they were
+# built from
+_summary_cache: Dict[Path, Tuple[Tuple[Any, ...], Panel]] = {}
+
+
+def _configuration_signature(target_dir: Path) -> Tuple[Any, ...]:
+    """Build a cheap change signature for a configuration directory.
+    
+    Installing or removing a template updates the mtime of its category
+    directory, and settings changes update settings.json, so these stats
+    are enough to tell whether a cached summary is stale.
+    
+    Args:
+        target_dir: Target directory for configuration
+        
+    Returns:
+        Tuple of stat results for settings.json and the commands directories
+    """
+    def stat_key(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+    
+    commands_dir = target_dir / "commands"
+    signature: List[Any] = [
+        stat_key(target_dir / "settings.json"),
+        stat_key(commands_dir),
+    ]
+    
+    try:
+        with os.scandir(commands_dir) as entries:
+            signature.extend(sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.is_dir()
+            ))
+    except OSError:
+        pass
+    
+    return tuple(signature)
+
+
 def create_configuration_summary(target_dir: Path) -> Panel:
     """Create a summary panel of current configuration.
     
@@ -373,6 +520,12 @@ def create_configuration_summary(target_dir: Path) -> Panel:
     from ..utils.settings import read_settings_sync
     from ..commands.remove import find_installed_templates_for_removal
     
+    # Reuse the previous panel while nothing on disk has changed
+    signature = _configuration_signature(target_dir)
+    cached = _summary_cache.get(target_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
     # Read settings
     settings = read_settings_sync(target_dir / "settings.json")
     
@@ -384,16 +537,11 @@ def create_configuration_summary(target_dir: Path) -> Panel:
     
     # Settings info
     if settings:
-        theme = getattr(settings, 'theme', 'default')
+        theme = settings.theme or "default"
         summary_parts.append(f"[cyan]Theme:[/cyan] {theme}")
         
-        # Count permissions
-        permission_count = 0
-        if hasattr(settings, 'permissions') and settings.permissions:
-            permission_count = len(getattr(settings.permissions, 'allow', []))
-        elif hasattr(settings, 'allowedTools'):
-            permission_count = len(settings.allowedTools)
-            
+        # ClaudeSettings always provides a permissions model
+        permission_count = len(settings.permissions.allow)
         summary_parts.append(f"[cyan]Permissions:[/cyan] {permission_count} allowed tools")
     
     # Template info
@@ -401,25 +549,60 @@ def create_configuration_summary(target_dir: Path) -> Panel:
     summary_parts.append(f"[cyan]Templates:[/cyan] {template_count} installed")
     
     if installed:
-        # Group by category
-        by_category = {}
-        for name, category, _ in installed:
-            if category not in by_category:
-                by_category[category] = 0
-            by_category[category] += 1
-            
+        # Count templates per category
+        by_category = Counter(category for _, category, _ in installed)
+        
         category_summary = ", ".join(
             f"{cat}: {count}" for cat, count in sorted(by_category.items())
         )
         summary_parts.append(f"[dim]Categories: {category_summary}[/dim]")
     
     # Create panel
-    return Panel(
+    panel = Panel(
         "\n".join(summary_parts),
         title="Current Configuration",
         border_style="green",
         padding=(1, 2),
     )
+    _summary_cache[target_dir] = (signature, panel)
+    return panel
+
+
+# Settings actions currently only point users at the equivalent CLI commands
+_SETTINGS_MENU_HANDLERS: Dict[str, Callable[[], None]] = {
+    "change-theme": lambda: info(
+        "Use 'claude-setup init --theme <name>' to change theme."
+    ),
+    "manage-permissions": lambda: info(
+        "Use 'claude-setup add --permission' or 'remove --permission' to manage permissions."
+    ),
+    "env-variables": lambda: info("Feature 'env-variables' coming soon!"),
+    "export-settings": lambda: info("Feature 'export-settings' coming soon!"),
+    "import-settings": lambda: info("Feature 'import-settings' coming soon!"),
+    "reset-settings": lambda: warning(
+        "This will reset all settings to defaults. Use 'claude-setup init --force' to reset."
+    ),
+}
+
+
+def _run_submenu(
+    menu: Callable[[], Optional[str]],
+    handlers: Dict[str, Callable[[], None]],
+) -> None:
+    """Show a submenu repeatedly and dispatch selections until the user leaves.
+    
+    Args:
+        menu: Menu function returning the selected action
+        handlers: Mapping of action names to their handlers
+    """
+    while True:
+        sub_action = menu()
+        if not sub_action or sub_action == "main-menu":
+            break
+        
+        handler = handlers.get(sub_action)
+        if handler:
+            handler()
 
 
 def run_interactive_mode(ctx: click.Context, target_dir: Path) -> None:
@@ -429,17 +612,138 @@ def run_interactive_mode(ctx: click.Context, target_dir: Path) -> None:
         ctx: Click context
         target_dir: Target directory for operations
     """
-    # Show welcome
-    welcome = create_gradient_text(
-        "Welcome to Claude Code Setup Interactive Mode",
-        style="bold",
+    # Resolve the global config location once; commands take test_dir=None
+    # when operating on it
+    is_global = target_dir == Path.home() / ".claude"
+    test_dir_arg = None if is_global else target_dir
+    test_dir_str = None if is_global else str(target_dir)
+    
+    # Show welcome and current configuration in a single render
+    console.print(
+        Group(
+            Text("\n"),
+            Align.center(_WELCOME_BANNER),
+            Text("\n"),
+            create_configuration_summary(target_dir),
+        )
     )
-    console.print("\n")
-    console.print(welcome, justify="center")
-    console.print("\n")
     
-    # Show current configuration
-    console.print(create_configuration_summary(target_dir))
+    # Available templates are loaded and indexed once per session and reused
+    # across submenus; the cache is dropped after templates are added,
+    # updated or removed.
+    templates_cache: Optional[TemplateIndex] = None
+    
+    def get_session_templates() -> TemplateIndex:
+        nonlocal templates_cache
+        if templates_cache is None:
+            from ..utils.template import get_all_templates_sync
+            templates_cache = build_template_index(
+                list(get_all_templates_sync().templates.values())
+            )
+        return templates_cache
+    
+    def quick_setup() -> None:
+        from .init import run_init_command
+        run_init_command(
+            quick=True,
+            force=False,
+            dry_run=False,
+            test_dir=test_dir_str,
+            global_config=is_global,
+            permissions="python,node,git,shell,package-managers",
+            theme="default",
+            no_check=False,
+            interactive=True,
+        )
+    
+    def add_templates() -> None:
+        nonlocal templates_cache
+        from .add import run_add_command
+        run_add_command(
+            type_arg="template",
+            value=None,
+            extra_value=None,
+            test_dir=test_dir_str,
+            global_config=is_global,
+            force=False,
+        )
+        templates_cache = None
+    
+    def update_templates(update_all: bool = False) -> None:
+        nonlocal templates_cache
+        from .update import run_update_command
+        run_update_command(
+            ctx=ctx,
+            templates=(),
+            all=update_all,
+            force=False,
+            test_dir=test_dir_arg,
+            dry_run=False,
+            settings=False,
+            global_settings=False,
+        )
+        templates_cache = None
+    
+    def remove_templates() -> None:
+        nonlocal templates_cache
+        from .remove import run_remove_command
+        run_remove_command(
+            ctx=ctx,
+            items=(),
+            type="template",
+            all=False,
+            permission=None,
+            test_dir=test_dir_arg,
+            dry_run=False,
+            force=False,
+        )
+        templates_cache = None
+    
+    def search_templates() -> None:
+        index = get_session_templates()
+        selected = search_templates_interactive(index.templates, index)
+        if selected:
+            info(f"Selected {len(selected)} template(s) for installation.")
+            # Could trigger add command with selected templates
+    
+    def preview_templates() -> None:
+        index = get_session_templates()
+        while preview_template_interactive(index.templates, index):
+            pass
+    
+    def view_config() -> None:
+        from .list import run_list_command
+        run_list_command(
+            resource_type=None,
+            category=None,
+            installed=False,
+            test_dir=test_dir_str,
+            global_config=is_global,
+            interactive=False,
+        )
+    
+    template_handlers: Dict[str, Callable[[], None]] = {
+        "add-templates": add_templates,
+        "update-templates": update_templates,
+        "remove-templates": remove_templates,
+        "search-templates": search_templates,
+        "preview-template": preview_templates,
+    }
+    
+    main_handlers: Dict[str, Callable[[], None]] = {
+        "quick-setup": quick_setup,
+        "manage-templates": partial(
+            _run_submenu, template_management_menu, template_handlers
+        ),
+        "manage-hooks": lambda: warning(
+            "Hook management will be available in Phase 8."
+        ),
+        "configure-settings": partial(
+            _run_submenu, settings_configuration_menu, _SETTINGS_MENU_HANDLERS
+        ),
+        "view-config": view_config,
+        "update-all": partial(update_templates, update_all=True),
+    }
     
     # Main loop
     while True:
@@ -447,127 +751,10 @@ def run_interactive_mode(ctx: click.Context, target_dir: Path) -> None:
         
         if not action:
             break
-            
-        if action == "quick-setup":
-            # Run init command
-            from .init import run_init_command
-            run_init_command(
-                ctx=ctx,
-                quick=True,
-                force=False,
-                test_dir=None,
-                global_config=target_dir == Path.home() / ".claude",
-                permissions=None,
-                theme=None,
-                no_check=False,
-                no_interactive=False,
-                dry_run=False,
-            )
-            
-        elif action == "manage-templates":
-            # Template submenu
-            while True:
-                sub_action = template_management_menu()
-                if not sub_action or sub_action == "main-menu":
-                    break
-                    
-                if sub_action == "add-templates":
-                    from .add import run_add_command
-                    run_add_command(
-                        ctx=ctx,
-                        resource_type=None,
-                        names=(),
-                        test_dir=target_dir if target_dir != Path.home() / ".claude" else None,
-                        force=False,
-                        dry_run=False,
-                    )
-                    
-                elif sub_action == "update-templates":
-                    from .update import run_update_command
-                    run_update_command(
-                        ctx=ctx,
-                        templates=(),
-                        all=False,
-                        force=False,
-                        test_dir=target_dir if target_dir != Path.home() / ".claude" else None,
-                        dry_run=False,
-                        settings=False,
-                        global_settings=False,
-                    )
-                    
-                elif sub_action == "remove-templates":
-                    from .remove import run_remove_command
-                    run_remove_command(
-                        ctx=ctx,
-                        templates=(),
-                        all=False,
-                        permission=None,
-                        test_dir=target_dir if target_dir != Path.home() / ".claude" else None,
-                        dry_run=False,
-                        force=False,
-                    )
-                    
-                elif sub_action == "search-templates":
-                    from ..utils.template import get_all_templates_sync
-                    templates = get_all_templates_sync()
-                    selected = search_templates_interactive(
-                        list(templates.templates.values())
-                    )
-                    if selected:
-                        info(f"Selected {len(selected)} template(s) for installation.")
-                        # Could trigger add command with selected templates
-                        
-                elif sub_action == "preview-template":
-                    from ..utils.template import get_all_templates_sync
-                    templates = get_all_templates_sync()
-                    while preview_template_interactive(
-                        list(templates.templates.values())
-                    ):
-                        pass
-                        
-        elif action == "manage-hooks":
-            warning("Hook management will be available in Phase 8.")
-            
-        elif action == "configure-settings":
-            # Settings submenu
-            while True:
-                sub_action = settings_configuration_menu()
-                if not sub_action or sub_action == "main-menu":
-                    break
-                    
-                if sub_action == "change-theme":
-                    info("Use 'claude-setup init --theme <name>' to change theme.")
-                elif sub_action == "manage-permissions":
-                    info("Use 'claude-setup add --permission' or 'remove --permission' to manage permissions.")
-                elif sub_action == "reset-settings":
-                    warning("This will reset all settings to defaults. Use 'claude-setup init --force' to reset.")
-                else:
-                    info(f"Feature '{sub_action}' coming soon!")
-                    
-        elif action == "view-config":
-            from .list import run_list_command
-            run_list_command(
-                ctx=ctx,
-                resource_type=None,
-                category=None,
-                installed=False,
-                test_dir=target_dir if target_dir != Path.home() / ".claude" else None,
-                global_config=False,
-                no_interactive=True,
-            )
-            
-        elif action == "update-all":
-            from .update import run_update_command
-            run_update_command(
-                ctx=ctx,
-                templates=(),
-                all=True,
-                force=False,
-                test_dir=target_dir if target_dir != Path.home() / ".claude" else None,
-                dry_run=False,
-                settings=False,
-                global_settings=False,
-            )
+        
+        handler = main_handlers.get(action)
+        if handler:
+            handler()
     
     # Show outro
     console.print("\n")
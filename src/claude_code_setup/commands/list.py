@@ -4,11 +4,14 @@ This module implements the list command, converted from TypeScript list.ts.
 Displays available templates, hooks, and settings with rich formatting and interactive options.
 """
 
+import os
 import sys
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set, Union
 
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.console import Group, RenderableType
 
 from ..utils import (
     info,
@@ -20,12 +23,13 @@ from ..utils import (
 from ..utils.template import (
     get_all_templates_sync,
     get_template_categories_sync,
+    get_cache_info as get_template_cache_info,
 )
 from ..utils.settings import (
     get_available_themes_sync,
     get_available_permission_sets_sync,
 )
-from ..types import TemplateCategory
+from ..types import Template, TemplateCategory
 
 # Import styled console and components from centralized styles
 from ..ui.styles import (
@@ -33,9 +37,6 @@ from ..ui.styles import (
     error_console,
     create_table,
     create_panel,
-    create_error_banner,
-    format_error,
-    create_command_error,
     COLORS,
     BOX_STYLES,
     style_header,
@@ -43,6 +44,43 @@ from ..ui.styles import (
 )
 
 
+# Example hooks from the codebase structure: (category, name, description)
+_EXAMPLE_HOOKS = (
+    ("security", "file-change-limiter", "Limits the number of files that can be modified"),
+    ("security", "command-validator", "Validates commands before execution"),
+    ("security", "sensitive-file-protector", "Protects sensitive files from modification"),
+    ("aws", "deployment-guard", "Guards against unsafe AWS deployments"),
+    ("testing", "test-enforcement", "Enforces running tests on changes"),
+)
+
+
+_DESCRIPTION_WIDTH = 60
+
+# Category lookups; the enum never changes, so build these once
+_CATEGORIES_BY_VALUE: Dict[str, TemplateCategory] = {c.value: c for c in TemplateCategory}
+_CATEGORY_VALUES_STR = ", ".join(_CATEGORIES_BY_VALUE)
+
+# Status cell markup shared by every table row
+_STATUS_INSTALLED = "[green]✓ installed[/green]"
+_STATUS_NOT_INSTALLED = "[dim]not installed[/dim]"
+_STATUS_AVAILABLE = "[green]✓ available[/green]"
+_STATUS_AVAILABLE_DIM = "[dim]available[/dim]"
+
+
+def _truncate(text: str, limit: int = _DESCRIPTION_WIDTH) -> str:
+    """Shorten text to the given limit, marking truncation with an ellipsis."""
+    return f"{text[:limit]}..." if len(text) > limit else text
+
+
+def _list_directory(directory: Union[str, Path]) -> Set[str]:
+    """Return the entry names in a directory, or an empty set if it is missing."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
 def determine_target_directory(test_dir: Optional[str], global_config: bool) -> Path:
     """Determine the target directory for checking installed items."""
     if test_dir:
@@ -52,70 +90,98 @@ def determine_target_directory(test_dir: Optional[str], global_config: bool) ->
         target_home = CLAUDE_HOME
         info(f"Using global directory: {target_home}")
     else:
-        target_home = Path.cwd() / ".claude"
+        # Build the path in one step; the working directory is not cached
+        # because callers (and tests) may chdir between invocations
+        target_home = Path(os.getcwd(), ".claude")
         info(f"Using local directory: {target_home}")
     
     return target_home
 
 
-def show_templates(
+def build_templates_view(
     category_filter: Optional[str] = None,
     installed_only: bool = False,
     target_dir: Optional[Path] = None,
-) -> None:
-    """Show available templates with installation status."""
+) -> Optional[RenderableType]:
+    """Build the templates section without printing it.
+    
+    Args:
+        category_filter: Only include templates from this category
+        installed_only: Only include templates installed in target_dir
+        target_dir: Claude directory to check installation status against
+        
+    Returns:
+        Renderable for the section, or None if there is nothing to show
+    """
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Loading templates...", total=None)
-            
-            # Get all templates
+        # Get all templates; only show a spinner when they must be read from
+        # disk, since a cached registry returns immediately
+        if get_template_cache_info().get("valid"):
             template_registry = get_all_templates_sync()
-            templates = template_registry.templates
-            
-            progress.stop()
-            
+        else:
+            with console.status("Loading templates..."):
+                template_registry = get_all_templates_sync()
+        templates = template_registry.templates
+        
         if not templates:
             warning("No templates found. Please ensure template files exist.")
-            return
+            return None
         
-        # Get all categories
-        categories = set(template.category for template in templates.values())
+        # Group templates by category in a single pass over a name-sorted
+        # list, so every bucket is already in display order
+        templates_by_category: Dict[TemplateCategory, List[Template]] = defaultdict(list)
+        for template in sorted(templates.values(), key=attrgetter("name")):
+            templates_by_category[template.category].append(template)
+        
+        categories = set(templates_by_category)
         
         # Filter by category if specified
         if category_filter:
-            try:
-                category_enum = TemplateCategory(category_filter.lower())
-                filtered_categories = {category_enum}
-            except ValueError:
+            category_enum = _CATEGORIES_BY_VALUE.get(category_filter.lower())
+            if category_enum is None:
+                from ..ui.styles import create_error_banner
+                
                 error_panel = create_error_banner(
                     title="⚠️  Invalid Category",
                     message=f"'{category_filter}' is not a valid category",
                     suggestions=[
-                        f"Available categories: {', '.join(c.value for c in TemplateCategory)}",
+                        f"Available categories: {_CATEGORY_VALUES_STR}",
                         "Run 'claude-setup list' without category filter to see all templates",
                     ],
                 )
-                console.print(error_panel)
-                return
+                return error_panel
+            filtered_categories = {category_enum}
         else:
             filtered_categories = categories
         
         if not filtered_categories:
             warning(f"No templates found for category: {category_filter}")
-            return
+            return None
         
-        # Display templates by category
-        console.print("\n[bold cyan]📄 Available Templates[/bold cyan]")
+        # Collect output and render it in a single print
+        renderables: List[RenderableType] = [
+            "\n[bold cyan]📄 Available Templates[/bold cyan]"
+        ]
         
-        for category in sorted(filtered_categories, key=lambda x: x.value):
-            category_templates = [
-                template for template in templates.values()
-                if template.category == category
-            ]
+        # Resolve the commands directory once as a string for cheap joins
+        commands_dir = os.path.join(target_dir, "commands") if target_dir else None
+        
+        # Display templates by category
+        for category in sorted(filtered_categories, key=attrgetter("value")):
+            category_templates = templates_by_category.get(category, [])
+            
+            # List the category directory once instead of stat'ing each template
+            installed_files = (
+                _list_directory(os.path.join(commands_dir, category.value))
+                if commands_dir else set()
+            )
+            
+            # Narrow to installed templates up front when only those are shown
+            if installed_only:
+                category_templates = [
+                    template for template in category_templates
+                    if f"{template.name}.md" in installed_files
+                ]
             
             if not category_templates:
                 continue
@@ -131,40 +197,35 @@ def show_templates(
             table.add_column("Status", width=12, justify="center")
             table.add_column("Description", style="dim")
             
-            has_templates = False
-            
-            for template in sorted(category_templates, key=lambda x: x.name):
-                # Check if template is installed
-                if target_dir:
-                    commands_dir = target_dir / "commands"
-                    template_path = commands_dir / category.value / f"{template.name}.md"
-                    is_installed = template_path.exists()
-                else:
-                    is_installed = False
-                
-                # Skip if showing only installed and this one isn't
-                if installed_only and not is_installed:
-                    continue
-                
-                # Format installation status
-                status = "[green]✓ installed[/green]" if is_installed else "[dim]not installed[/dim]"
-                
-                table.add_row(
+            # Build every row first, then add them in one tight loop
+            rows = [
+                (
                     template.name,
-                    status,
-                    template.description[:60] + "..." if len(template.description) > 60 else template.description
+                    # Format installation status
+                    _STATUS_INSTALLED
+                    if installed_only or f"{template.name}.md" in installed_files
+                    else _STATUS_NOT_INSTALLED,
+                    _truncate(template.description),
                 )
-                has_templates = True
+                for template in category_templates
+            ]
+            add_row = table.add_row
+            for row in rows:
+                add_row(*row)
             
-            if has_templates:
-                console.print(table)
-                console.print()
+            renderables.extend((table, ""))
         
         # Show usage information
-        console.print("[dim]💡 To add a template, run:[/dim]")
-        console.print("[blue]  claude-setup add template <template-name>[/blue]")
+        renderables.extend((
+            "[dim]💡 To add a template, run:[/dim]",
+            "[blue]  claude-setup add template <template-name>[/blue]",
+        ))
+        return Group(*renderables)
         
     except Exception as e:
+        # Error rendering helpers are only needed on failure
+        from ..ui.styles import create_command_error
+        
         error_panel = create_command_error(
             "list",
             e,
@@ -177,10 +238,26 @@ def show_templates(
         sys.exit(1)
 
 
-def show_hooks(target_dir: Optional[Path] = None) -> None:
-    """Show available hooks with installation status."""
-    console.print("\n[bold magenta]🛡️ Available Hooks[/bold magenta]")
+def show_templates(
+    category_filter: Optional[str] = None,
+    installed_only: bool = False,
+    target_dir: Optional[Path] = None,
+) -> None:
+    """Show available templates with installation status."""
+    view = build_templates_view(category_filter, installed_only, target_dir)
+    if view is not None:
+        console.print(view)
+
+
+def build_hooks_view(target_dir: Optional[Path] = None) -> RenderableType:
+    """Build the hooks section without printing it.
     
+    Args:
+        target_dir: Claude directory to check installation status against
+        
+    Returns:
+        Renderable for the section
+    """
     # For now, show a placeholder as hooks aren't fully implemented yet
     table = create_table(
         show_header=True,
@@ -192,34 +269,50 @@ def show_hooks(target_dir: Optional[Path] = None) -> None:
     table.add_column("Status", width=12, justify="center")
     table.add_column("Description", style="dim")
     
-    # Add some example hooks from the codebase structure
-    hooks_data = [
-        ("security", "file-change-limiter", False, "Limits the number of files that can be modified"),
-        ("security", "command-validator", False, "Validates commands before execution"),
-        ("security", "sensitive-file-protector", False, "Protects sensitive files from modification"),
-        ("aws", "deployment-guard", False, "Guards against unsafe AWS deployments"),
-        ("testing", "test-enforcement", False, "Enforces running tests on changes"),
-    ]
+    # List each hook category directory once
+    hooks_dir = os.path.join(target_dir, "hooks") if target_dir else None
+    installed_hooks: Dict[str, Set[str]] = {}
+    rows = []
     
-    for category, hook_name, is_installed, description in hooks_data:
-        if target_dir:
-            hooks_dir = target_dir / "hooks" / category
-            hook_path = hooks_dir / hook_name
-            is_installed = hook_path.exists()
+    for category, hook_name, description in _EXAMPLE_HOOKS:
+        is_installed = False
+        if hooks_dir:
+            if category not in installed_hooks:
+                installed_hooks[category] = _list_directory(os.path.join(hooks_dir, category))
+            is_installed = hook_name in installed_hooks[category]
         
-        status = "[green]✓ installed[/green]" if is_installed else "[dim]not installed[/dim]"
-        table.add_row(category, hook_name, status, description)
+        status = _STATUS_INSTALLED if is_installed else _STATUS_NOT_INSTALLED
+        rows.append((category, hook_name, status, description))
     
-    console.print(table)
-    console.print()
+    for row in rows:
+        table.add_row(*row)
     
-    console.print("[dim]💡 To add hooks, run:[/dim]")
-    console.print("[blue]  claude-setup hooks add <hook-name>[/blue]")
+    return Group(
+        "\n[bold magenta]🛡️ Available Hooks[/bold magenta]",
+        table,
+        "",
+        "[dim]💡 To add hooks, run:[/dim]",
+        "[blue]  claude-setup hooks add <hook-name>[/blue]",
+    )
 
 
-def show_settings(target_dir: Optional[Path] = None) -> None:
-    """Show available settings and themes."""
-    console.print("\n[bold yellow]⚙️  Available Settings[/bold yellow]")
+def show_hooks(target_dir: Optional[Path] = None) -> None:
+    """Show available hooks with installation status."""
+    console.print(build_hooks_view(target_dir))
+
+
+def build_settings_view(target_dir: Optional[Path] = None) -> RenderableType:
+    """Build the settings section without printing it.
+    
+    Args:
+        target_dir: Claude directory to check for configured settings
+        
+    Returns:
+        Renderable for the section
+    """
+    renderables: List[RenderableType] = [
+        "\n[bold yellow]⚙️  Available Settings[/bold yellow]"
+    ]
     
     try:
         # Get available themes
@@ -237,42 +330,43 @@ def show_settings(target_dir: Optional[Path] = None) -> None:
         table.add_column("Status", width=12, justify="center")
         table.add_column("Description", style="dim")
         
+        # Check for configured settings once for all themes and the footer
+        settings_file = target_dir / "settings.json" if target_dir else None
+        is_configured = settings_file is not None and settings_file.exists()
+        
         # Show themes
+        status = _STATUS_AVAILABLE if is_configured else _STATUS_AVAILABLE_DIM
         for theme in themes:
-            if target_dir:
-                settings_file = target_dir / "settings.json"
-                is_configured = settings_file.exists()
-            else:
-                is_configured = False
-            
-            status = "[green]✓ available[/green]" if is_configured else "[dim]available[/dim]"
             description = f"Theme configuration for {theme} styling"
             table.add_row("theme", theme, status, description)
         
         # Show permission sets
         for perm_set in permission_sets[:5]:  # Show first 5 to avoid clutter
-            status = "[green]✓ available[/green]"
             description = f"Permission set for {perm_set} commands"
-            table.add_row("permissions", perm_set, status, description)
+            table.add_row("permissions", perm_set, _STATUS_AVAILABLE, description)
         
         if len(permission_sets) > 5:
             table.add_row("permissions", f"... and {len(permission_sets) - 5} more", "", "")
         
-        console.print(table)
-        console.print()
+        renderables.extend((table, ""))
         
         # Show current settings status
-        if target_dir:
-            settings_file = target_dir / "settings.json"
-            if settings_file.exists():
-                console.print(f"[green]✓ Settings configured at: {settings_file}[/green]")
+        if settings_file is not None:
+            if is_configured:
+                renderables.append(f"[green]✓ Settings configured at: {settings_file}[/green]")
             else:
-                console.print(f"[dim]Settings not yet configured. Run 'claude-setup init' to set up.[/dim]")
+                renderables.append("[dim]Settings not yet configured. Run 'claude-setup init' to set up.[/dim]")
         
-        console.print("\n[dim]💡 To configure settings, run:[/dim]")
-        console.print("[blue]  claude-setup init[/blue]")
+        renderables.extend((
+            "\n[dim]💡 To configure settings, run:[/dim]",
+            "[blue]  claude-setup init[/blue]",
+        ))
+        return Group(*renderables)
         
     except Exception as e:
+        # Error rendering helpers are only needed on failure
+        from ..ui.styles import create_command_error
+        
         error_panel = create_command_error(
             "list",
             e,
@@ -285,33 +379,41 @@ def show_settings(target_dir: Optional[Path] = None) -> None:
         sys.exit(1)
 
 
+def show_settings(target_dir: Optional[Path] = None) -> None:
+    """Show available settings and themes."""
+    console.print(build_settings_view(target_dir))
+
+
 def show_all_resources(
     category_filter: Optional[str] = None,
     installed_only: bool = False,
     target_dir: Optional[Path] = None,
 ) -> None:
     """Show all available resources (templates, hooks, settings)."""
-    console.print()
-    console.print(create_panel(
-        f"[{COLORS['header']}]📋 Claude Code Resources Overview[/{COLORS['header']}]\n"
-        f"[{COLORS['muted']}]Available templates, hooks, and settings for your project[/{COLORS['muted']}]",
-        border_style=COLORS["primary"],
-        padding=(1, 2),
-    ))
-    
-    # Show templates
-    show_templates(category_filter, installed_only, target_dir)
-    
-    # Show hooks
-    show_hooks(target_dir)
+    # Build every section first so the whole overview renders in one print
+    renderables: List[RenderableType] = [
+        "",
+        create_panel(
+            f"[{COLORS['header']}]📋 Claude Code Resources Overview[/{COLORS['header']}]\n"
+            f"[{COLORS['muted']}]Available templates, hooks, and settings for your project[/{COLORS['muted']}]",
+            border_style=COLORS["primary"],
+            padding=(1, 2),
+        ),
+    ]
     
-    # Show settings
-    show_settings(target_dir)
+    templates_view = build_templates_view(category_filter, installed_only, target_dir)
+    if templates_view is not None:
+        renderables.append(templates_view)
     
-    console.print("\n[dim]For more details on any section, use:[/dim]")
-    console.print("[blue]  claude-setup list templates[/blue]")
-    console.print("[blue]  claude-setup list hooks[/blue]")
-    console.print("[blue]  claude-setup list settings[/blue]")
+    renderables.extend((
+        build_hooks_view(target_dir),
+        build_settings_view(target_dir),
+        "\n[dim]For more details on any section, use:[/dim]",
+        "[blue]  claude-setup list templates[/blue]",
+        "[blue]  claude-setup list hooks[/blue]",
+        "[blue]  claude-setup list settings[/blue]",
+    ))
+    console.print(Group(*renderables))
 
 
 def run_list_command(
@@ -340,19 +442,21 @@ def run_list_command(
         
         # Interactive actions (if enabled)
         if interactive and resource_type != "settings":
-            console.print()
-            console.print("[dim]💡 Tip: Use --no-interactive to skip interactive prompts[/dim]")
+            console.print("\n[dim]💡 Tip: Use --no-interactive to skip interactive prompts[/dim]")
             # TODO: Add interactive actions in future enhancement
         
     except KeyboardInterrupt:
-        console.print("\n")
+        from ..ui.styles import create_error_banner
+        
         interrupted_panel = create_error_banner(
             title="⌨️  Operation Cancelled",
             message="List operation was interrupted by user",
         )
-        console.print(interrupted_panel)
+        console.print(Group("\n", interrupted_panel))
         sys.exit(1)
     except Exception as e:
+        from ..ui.styles import format_error
+        
         error_panel = format_error(
             e,
             title="Unexpected Error",
@@ -5,32 +5,45 @@ installing, removing, and getting information about plugins.
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 import click
-import questionary
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-from ..constants import CLAUDE_DIR_NAME, EXIT_CODES
-from ..utils.fs import get_claude_home
-from ..plugins.loader import PluginLoader
-from ..plugins.registry import PluginRegistry
-from ..plugins.types import PluginStatus
-from ..ui.progress import create_progress_spinner
-from ..ui.styles import (
-    CLAUDE_PURPLE,
-    ERROR_STYLE,
-    INFO_STYLE,
-    SUCCESS_STYLE,
-    WARNING_STYLE,
-)
-from ..utils.fs import get_claude_home
-from ..utils.logger import error, info, success, warning
+
+from ..constants import EXIT_ERROR
+from ..ui.styles import COLORS, console
+from ..utils.logger import error, success
+
+if TYPE_CHECKING:
+    from ..plugins.loader import PluginLoader
+    from ..plugins.registry import PluginRegistry
+    from ..plugins.types import Plugin, PluginCapabilities, PluginStatus
+
+
+# Table markup for each plugin status, keyed by status value so this module
+# does not need the plugin types at import time
+_STATUS_DISPLAY: Dict[str, str] = {
+    "available": "[dim]Available[/dim]",
+    "installed": "[yellow]Installed[/yellow]",
+    "active": "[green]Active[/green]",
+    "disabled": "[red]Disabled[/red]",
+    "error": "[red]Error[/red]",
+}
+
+# Capability fields in display order
+_CAPABILITY_FIELDS = ("templates", "hooks", "agents", "workflows", "commands")
 
 
-console = Console()
+def _capability_items(caps: "PluginCapabilities") -> List[Tuple[str, List[str]]]:
+    """Return the non-empty capabilities of a plugin.
+    
+    Args:
+        caps: Plugin capabilities from the manifest
+        
+    Returns:
+        List of (field name, provided names) in display order
+    """
+    items_by_field = ((field, getattr(caps, field)) for field in _CAPABILITY_FIELDS)
+    return [(field, items) for field, items in items_by_field if items]
 
 
 @click.group(name="plugins", help="Manage Claude Code Setup plugins")
@@ -39,15 +52,157 @@ console = Console()
     type=click.Path(path_type=Path),
     help="Use a test directory instead of the actual directory",
 )
+@click.option(
+    "--batch",
+    is_flag=True,
+    envvar="CLAUDE_SETUP_BATCH",
+    help="Never prompt; fail when a required argument is missing",
+)
 @click.pass_context
-def plugins_group(ctx: click.Context, test_dir: Optional[Path]) -> None:
+def plugins_group(ctx: click.Context, test_dir: Optional[Path], batch: bool) -> None:
     """Plugin management commands."""
     # Store config path in context for subcommands
     ctx.ensure_object(dict)
+    # The top-level --no-interactive flag implies batch mode as well
+    ctx.obj["batch"] = batch or ctx.obj.get("no_interactive", False)
     if test_dir:
-        ctx.obj["config_path"] = test_dir / CLAUDE_DIR_NAME
+        ctx.obj["config_path"] = test_dir / ".claude"
     else:
-        ctx.obj["config_path"] = Path.cwd() / CLAUDE_DIR_NAME
+        ctx.obj["config_path"] = Path.cwd() / ".claude"
+    ctx.obj["plugin_dir"] = ctx.obj["config_path"] / "plugins"
+    
+    # The registry and loader are created on first use and then shared, so
+    # subcommands chained with ctx.invoke reuse the already-synced registry
+    ctx.obj.pop("registry", None)
+    ctx.obj.pop("loader", None)
+
+
+def _get_registry(ctx: click.Context) -> "PluginRegistry":
+    """Return the plugin registry shared by the plugins subcommands.
+    
+    Args:
+        ctx: Click context populated by plugins_group
+        
+    Returns:
+        Plugin registry for the configured plugin directory
+    """
+    registry: Optional["PluginRegistry"] = ctx.obj.get("registry")
+    if registry is None:
+        from ..plugins.registry import PluginRegistry
+        
+        registry = PluginRegistry(ctx.obj["plugin_dir"] / "registry.json")
+        ctx.obj["registry"] = registry
+    return registry
+
+
+def _get_loader(ctx: click.Context, lazy: bool = False) -> "PluginLoader":
+    """Return the plugin loader shared by the plugins subcommands.
+    
+    Args:
+        ctx: Click context populated by plugins_group
+        lazy: Defer creating the plugin directories when the loader is built
+        
+    Returns:
+        Plugin loader bound to the shared registry
+    """
+    loader: Optional["PluginLoader"] = ctx.obj.get("loader")
+    if loader is None:
+        from ..plugins.loader import PluginLoader
+        
+        loader = PluginLoader(ctx.obj["plugin_dir"], _get_registry(ctx), lazy=lazy)
+        ctx.obj["loader"] = loader
+    return loader
+
+
+def _render_provides(caps: "PluginCapabilities") -> List[str]:
+    """Format each non-empty capability as an indented "Label: names" line.
+    
+    Args:
+        caps: Plugin capabilities from the manifest
+        
+    Returns:
+        Lines describing what the plugin provides
+    """
+    return [
+        f"  {field.title()}: {', '.join(items)}"
+        for field, items in _capability_items(caps)
+    ]
+
+
+def _with_cancel(names: Iterable[str]) -> List[str]:
+    """Build picker choices from plugin names with a trailing Cancel entry.
+    
+    Args:
+        names: Plugin names, typically a plugin mapping
+        
+    Returns:
+        List of choices ending with "Cancel"
+    """
+    choices = list(names)
+    choices.append("Cancel")
+    return choices
+
+
+def _open_registry(ctx: click.Context) -> Tuple["PluginRegistry", "PluginLoader"]:
+    """Return the shared registry and loader for a plugins subcommand.
+    
+    Args:
+        ctx: Click context populated by plugins_group
+        
+    Returns:
+        Tuple of (registry, loader)
+    """
+    return _get_registry(ctx), _get_loader(ctx)
+
+
+def _bucket_by_status(
+    plugins: Dict[str, "Plugin"],
+) -> Dict["PluginStatus", Dict[str, "Plugin"]]:
+    """Group plugins by status in a single pass.
+    
+    Args:
+        plugins: Plugins by name
+        
+    Returns:
+        Plugins by name for every status, including empty buckets
+    """
+    from ..plugins.types import PluginStatus
+    
+    buckets: Dict[PluginStatus, Dict[str, Plugin]] = {s: {} for s in PluginStatus}
+    for name, plugin in plugins.items():
+        buckets[plugin.status][name] = plugin
+    return buckets
+
+
+def invoke_plugin_command(
+    parent: click.Context,
+    test_dir: Optional[str],
+    command: click.Command,
+    **kwargs: Any,
+) -> Any:
+    """Invoke a plugins subcommand from the top-level CLI.
+    
+    Runs the plugins group callback first so the subcommand finds the
+    config path and shared registry in the context object. A --batch flag
+    given to the top-level plugins group is forwarded to it.
+    
+    Args:
+        parent: Context of the calling command
+        test_dir: Optional test directory to use instead of the cwd
+        command: Plugins subcommand to invoke
+        **kwargs: Parameters for the subcommand
+        
+    Returns:
+        The subcommand's return value
+    """
+    args = ["--test-dir", test_dir] if test_dir else []
+    if (parent.obj or {}).get("batch"):
+        args.append("--batch")
+    plugins_ctx = plugins_group.make_context("plugins", args, parent=parent)
+    assert plugins_group.callback is not None
+    with plugins_ctx:
+        plugins_ctx.invoke(plugins_group.callback, **plugins_ctx.params)
+        return plugins_ctx.invoke(command, **kwargs)
 
 
 @plugins_group.command(name="list")
@@ -55,7 +210,7 @@ def plugins_group(ctx: click.Context, test_dir: Optional[Path]) -> None:
     "--status",
     type=click.Choice(["all", "available", "installed", "active"]),
     default="all",
-    help="Filter plugins by status",
+    help="Filter plugins by status (installed and active skip plugin discovery)",
 )
 @click.option(
     "--no-interactive",
@@ -69,33 +224,43 @@ def list_plugins(
     no_interactive: bool,
 ) -> None:
     """List available and installed plugins."""
-    config_path = ctx.obj["config_path"]
-    plugin_dir = config_path / "plugins"
+    from rich.table import Table
+    
+    from ..plugins.types import PluginStatus
     
-    # Initialize registry and loader
-    registry_path = plugin_dir / "registry.json"
-    registry = PluginRegistry(registry_path)
-    loader = PluginLoader(plugin_dir, registry)
+    registry, loader = _open_registry(ctx)
     
-    # Sync plugins with registry
-    with create_progress_spinner("Discovering plugins..."):
-        loader.sync_with_registry()
+    # Installed and active plugins are recorded in the registry file, so
+    # only scan the plugin directories when available plugins are listed
+    synced = status in ("all", "available")
+    if synced:
+        with console.status("Discovering plugins..."):
+            loader.sync_with_registry_if_changed()
+    
+    # Bucket plugins by status once; filters, stats and the interactive
+    # follow-ups below all read from these buckets
+    registry.load()
+    all_plugins = dict(registry._plugins)
+    buckets = _bucket_by_status(all_plugins)
+    available = buckets[PluginStatus.AVAILABLE]
+    installed = {
+        **buckets[PluginStatus.INSTALLED],
+        **buckets[PluginStatus.ACTIVE],
+        **buckets[PluginStatus.DISABLED],
+    }
     
     # Get plugins based on filter
     if status == "available":
-        plugins = registry.get_available_plugins()
+        plugins = available
     elif status == "installed":
-        plugins = registry.get_installed_plugins()
+        plugins = installed
     elif status == "active":
-        plugins = registry.get_active_plugins()
+        plugins = buckets[PluginStatus.ACTIVE]
     else:  # all
-        plugins = {
-            name: plugin
-            for name, plugin in registry._plugins.items()
-        }
+        plugins = all_plugins
     
     if not plugins:
-        console.print(f"No {status} plugins found", style=WARNING_STYLE)
+        console.print(f"No {status} plugins found", style=COLORS["warning"])
         return
     
     # Create table
@@ -105,7 +270,7 @@ def list_plugins(
         header_style="bold",
     )
     
-    table.add_column("Plugin", style=CLAUDE_PURPLE, no_wrap=True)
+    table.add_column("Plugin", style=COLORS["secondary"], no_wrap=True)
     table.add_column("Version", style="cyan")
     table.add_column("Status", style="green")
     table.add_column("Description")
@@ -115,52 +280,34 @@ def list_plugins(
     sorted_plugins = sorted(plugins.items(), key=lambda x: x[0])
     
     for name, plugin in sorted_plugins:
-        # Format status
-        status_display = {
-            PluginStatus.AVAILABLE: "[dim]Available[/dim]",
-            PluginStatus.INSTALLED: "[yellow]Installed[/yellow]",
-            PluginStatus.ACTIVE: "[green]Active[/green]",
-            PluginStatus.DISABLED: "[red]Disabled[/red]",
-            PluginStatus.ERROR: "[red]Error[/red]",
-        }.get(plugin.status, plugin.status.value)
-        
         # Format capabilities
-        provides = []
-        caps = plugin.manifest.provides
-        if caps.templates:
-            provides.append(f"{len(caps.templates)} templates")
-        if caps.hooks:
-            provides.append(f"{len(caps.hooks)} hooks")
-        if caps.agents:
-            provides.append(f"{len(caps.agents)} agents")
-        if caps.workflows:
-            provides.append(f"{len(caps.workflows)} workflows")
-        if caps.commands:
-            provides.append(f"{len(caps.commands)} commands")
-        
-        provides_str = ", ".join(provides) if provides else "[dim]None[/dim]"
+        provides = [
+            f"{len(items)} {field}"
+            for field, items in _capability_items(plugin.manifest.provides)
+        ]
         
         table.add_row(
             plugin.manifest.metadata.display_name,
             plugin.version,
-            status_display,
+            _STATUS_DISPLAY.get(plugin.status.value, plugin.status.value),
             plugin.manifest.metadata.description,
-            provides_str,
+            ", ".join(provides) if provides else "[dim]None[/dim]",
         )
     
     console.print(table)
     
     # Show stats
-    stats = registry.get_stats()
     console.print(
-        f"\nTotal: {stats['total']} plugins, "
-        f"{stats['installed']} installed, "
-        f"{stats['active']} active",
+        f"\nTotal: {len(all_plugins)} plugins, "
+        f"{len(buckets[PluginStatus.INSTALLED])} installed, "
+        f"{len(buckets[PluginStatus.ACTIVE])} active",
         style="dim",
     )
     
     # Interactive mode
-    if not no_interactive and plugins:
+    if not (no_interactive or ctx.obj["batch"]) and plugins:
+        import questionary
+        
         console.print()
         action = questionary.select(
             "What would you like to do?",
@@ -173,40 +320,43 @@ def list_plugins(
         ).ask()
         
         if action == "Install a plugin":
-            available = registry.get_available_plugins()
+            if not synced:
+                with console.status("Discovering plugins..."):
+                    loader.sync_with_registry_if_changed()
+                available = registry.get_available_plugins()
+            
             if not available:
-                console.print("No plugins available to install", style=WARNING_STYLE)
+                console.print("No plugins available to install", style=COLORS["warning"])
                 return
             
             plugin_name = questionary.select(
                 "Select a plugin to install:",
-                choices=list(available.keys()) + ["Cancel"],
+                choices=_with_cancel(available),
             ).ask()
             
-            if plugin_name != "Cancel":
+            if plugin_name and plugin_name != "Cancel":
                 ctx.invoke(add_plugin, plugin_name=plugin_name)
         
         elif action == "Remove a plugin":
-            installed = registry.get_installed_plugins()
             if not installed:
-                console.print("No plugins installed", style=WARNING_STYLE)
+                console.print("No plugins installed", style=COLORS["warning"])
                 return
             
             plugin_name = questionary.select(
                 "Select a plugin to remove:",
-                choices=list(installed.keys()) + ["Cancel"],
+                choices=_with_cancel(installed),
             ).ask()
             
-            if plugin_name != "Cancel":
+            if plugin_name and plugin_name != "Cancel":
                 ctx.invoke(remove_plugin, plugin_name=plugin_name)
         
         elif action == "Get plugin info":
             plugin_name = questionary.select(
                 "Select a plugin:",
-                choices=list(plugins.keys()) + ["Cancel"],
+                choices=_with_cancel(plugins),
             ).ask()
             
-            if plugin_name != "Cancel":
+            if plugin_name and plugin_name != "Cancel":
                 ctx.invoke(plugin_info, plugin_name=plugin_name)
 
 
@@ -230,18 +380,16 @@ def add_plugin(
     activate: bool,
 ) -> None:
     """Install a plugin."""
-    config_path = ctx.obj["config_path"]
-    plugin_dir = config_path / "plugins"
+    if not plugin_name and not from_file and ctx.obj["batch"]:
+        error("A plugin name or --from-file is required in batch mode")
+        raise click.exceptions.Exit(EXIT_ERROR)
     
-    # Initialize registry and loader
-    registry_path = plugin_dir / "registry.json"
-    registry = PluginRegistry(registry_path)
-    loader = PluginLoader(plugin_dir, registry)
+    registry, loader = _open_registry(ctx)
     
     try:
         if from_file:
             # Install from file
-            with create_progress_spinner(f"Installing plugin from {from_file}..."):
+            with console.status(f"Installing plugin from {from_file}..."):
                 plugin = loader.install_from_file(from_file)
             
             success(f"Installed plugin: {plugin.name} v{plugin.version}")
@@ -250,13 +398,15 @@ def add_plugin(
             # Install from repository
             if not plugin_name:
                 # Interactive selection
-                loader.sync_with_registry()
+                loader.sync_with_registry_if_changed()
                 available = registry.get_available_plugins()
                 
                 if not available:
-                    console.print("No plugins available to install", style=WARNING_STYLE)
+                    console.print("No plugins available to install", style=COLORS["warning"])
                     return
                 
+                import questionary
+                
                 plugin_name = questionary.select(
                     "Select a plugin to install:",
                     choices=list(available.keys()),
@@ -265,14 +415,14 @@ def add_plugin(
                 if not plugin_name:
                     return
             
-            with create_progress_spinner(f"Installing {plugin_name}..."):
+            with console.status(f"Installing {plugin_name}..."):
                 plugin = loader.install_plugin(plugin_name)
             
             success(f"Installed plugin: {plugin_name} v{plugin.version}")
         
         # Activate if requested
         if activate:
-            with create_progress_spinner(f"Activating {plugin.name}..."):
+            with console.status(f"Activating {plugin.name}..."):
                 loader.activate_plugin(plugin.name)
             
             success(f"Activated plugin: {plugin.name}")
@@ -280,22 +430,14 @@ def add_plugin(
         # Show what the plugin provides
         caps = plugin.manifest.provides
         if not caps.is_empty():
-            console.print("\nThis plugin provides:", style=INFO_STYLE)
+            console.print("\nThis plugin provides:", style=COLORS["info"])
             
-            if caps.templates:
-                console.print(f"  Templates: {', '.join(caps.templates)}")
-            if caps.hooks:
-                console.print(f"  Hooks: {', '.join(caps.hooks)}")
-            if caps.agents:
-                console.print(f"  Agents: {', '.join(caps.agents)}")
-            if caps.workflows:
-                console.print(f"  Workflows: {', '.join(caps.workflows)}")
-            if caps.commands:
-                console.print(f"  Commands: {', '.join(caps.commands)}")
+            for line in _render_provides(caps):
+                click.echo(line)
         
     except Exception as e:
         error(f"Failed to install plugin: {e}")
-        raise click.Exit(EXIT_CODES.ERROR)
+        raise click.exceptions.Exit(EXIT_ERROR)
 
 
 @plugins_group.command(name="remove")
@@ -312,22 +454,22 @@ def remove_plugin(
     force: bool,
 ) -> None:
     """Remove an installed plugin."""
-    config_path = ctx.obj["config_path"]
-    plugin_dir = config_path / "plugins"
-    
-    # Initialize registry and loader
-    registry_path = plugin_dir / "registry.json"
-    registry = PluginRegistry(registry_path)
-    loader = PluginLoader(plugin_dir, registry)
+    registry, loader = _open_registry(ctx)
     
     if not plugin_name:
+        if ctx.obj["batch"]:
+            error("A plugin name is required in batch mode")
+            raise click.exceptions.Exit(EXIT_ERROR)
+        
         # Interactive selection
         installed = registry.get_installed_plugins()
         
         if not installed:
-            console.print("No plugins installed", style=WARNING_STYLE)
+            console.print("No plugins installed", style=COLORS["warning"])
             return
         
+        import questionary
+        
         plugin_name = questionary.select(
             "Select a plugin to remove:",
             choices=list(installed.keys()),
@@ -340,7 +482,7 @@ def remove_plugin(
     plugin = registry.get_plugin(plugin_name)
     if not plugin or not plugin.is_installed:
         error(f"Plugin {plugin_name} is not installed")
-        raise click.Exit(EXIT_CODES.ERROR)
+        raise click.exceptions.Exit(EXIT_ERROR)
     
     # Confirm removal
     if not force:
@@ -349,29 +491,37 @@ def remove_plugin(
         if dependents:
             console.print(
                 f"\n[yellow]Warning:[/yellow] The following plugins depend on {plugin_name}:",
-                style=WARNING_STYLE,
+                style=COLORS["warning"],
             )
             for dep in dependents:
-                console.print(f"  - {dep.name}")
+                click.echo(f"  - {dep.name}")
             console.print()
+            
+            if ctx.obj["batch"]:
+                error("Use --force to remove a plugin other plugins depend on")
+                raise click.exceptions.Exit(EXIT_ERROR)
         
-        confirm = questionary.confirm(
-            f"Remove plugin {plugin_name}?",
-            default=False,
-        ).ask()
-        
-        if not confirm:
-            return
+        # Batch mode removes without asking when nothing depends on the plugin
+        if not ctx.obj["batch"]:
+            import questionary
+            
+            confirm = questionary.confirm(
+                f"Remove plugin {plugin_name}?",
+                default=False,
+            ).ask()
+            
+            if not confirm:
+                return
     
     try:
-        with create_progress_spinner(f"Removing {plugin_name}..."):
+        with console.status(f"Removing {plugin_name}..."):
             loader.uninstall_plugin(plugin_name, force=force)
         
         success(f"Removed plugin: {plugin_name}")
         
     except Exception as e:
         error(f"Failed to remove plugin: {e}")
-        raise click.Exit(EXIT_CODES.ERROR)
+        raise click.exceptions.Exit(EXIT_ERROR)
 
 
 @plugins_group.command(name="info")
@@ -379,19 +529,17 @@ def remove_plugin(
 @click.pass_context
 def plugin_info(ctx: click.Context, plugin_name: str) -> None:
     """Show detailed information about a plugin."""
-    config_path = ctx.obj["config_path"]
-    plugin_dir = config_path / "plugins"
+    from rich.panel import Panel
+    from rich.text import Text
     
-    # Initialize registry
-    registry_path = plugin_dir / "registry.json"
-    registry = PluginRegistry(registry_path)
+    registry = _get_registry(ctx)
     registry.load()
     
     # Get plugin
     plugin = registry.get_plugin(plugin_name)
     if not plugin:
         error(f"Plugin {plugin_name} not found")
-        raise click.Exit(EXIT_CODES.ERROR)
+        raise click.exceptions.Exit(EXIT_ERROR)
     
     # Create info panel
     metadata = plugin.manifest.metadata
@@ -431,17 +579,7 @@ def plugin_info(ctx: click.Context, plugin_name: str) -> None:
     caps = plugin.manifest.provides
     if not caps.is_empty():
         info_lines.extend(["", "[bold]Provides:[/bold]"])
-        
-        if caps.templates:
-            info_lines.append(f"  Templates: {', '.join(caps.templates)}")
-        if caps.hooks:
-            info_lines.append(f"  Hooks: {', '.join(caps.hooks)}")
-        if caps.agents:
-            info_lines.append(f"  Agents: {', '.join(caps.agents)}")
-        if caps.workflows:
-            info_lines.append(f"  Workflows: {', '.join(caps.workflows)}")
-        if caps.commands:
-            info_lines.append(f"  Commands: {', '.join(caps.commands)}")
+        info_lines.extend(_render_provides(caps))
     
     # Errors
     if plugin.errors:
@@ -449,10 +587,11 @@ def plugin_info(ctx: click.Context, plugin_name: str) -> None:
         for err in plugin.errors:
             info_lines.append(f"  - {err}")
     
+    # Build the Text up front so Rich skips its repr highlighter pass
     panel = Panel(
-        "\n".join(info_lines),
+        Text.from_markup("\n".join(info_lines)),
         title=f"Plugin: {plugin_name}",
-        border_style=CLAUDE_PURPLE,
+        border_style=COLORS["secondary"],
     )
     
     console.print(panel)
@@ -463,23 +602,18 @@ def plugin_info(ctx: click.Context, plugin_name: str) -> None:
 @click.pass_context
 def activate_plugin(ctx: click.Context, plugin_name: str) -> None:
     """Activate an installed plugin."""
-    config_path = ctx.obj["config_path"]
-    plugin_dir = config_path / "plugins"
-    
-    # Initialize registry and loader
-    registry_path = plugin_dir / "registry.json"
-    registry = PluginRegistry(registry_path)
-    loader = PluginLoader(plugin_dir, registry)
+    # Activation only updates the registry and settings, not the plugin tree
+    loader = _get_loader(ctx, lazy=True)
     
     try:
-        with create_progress_spinner(f"Activating {plugin_name}..."):
+        with console.status(f"Activating {plugin_name}..."):
             loader.activate_plugin(plugin_name)
         
         success(f"Activated plugin: {plugin_name}")
         
     except Exception as e:
         error(f"Failed to activate plugin: {e}")
-        raise click.Exit(EXIT_CODES.ERROR)
+        raise click.exceptions.Exit(EXIT_ERROR)
 
 
 @plugins_group.command(name="deactivate")
@@ -487,23 +621,17 @@ def activate_plugin(ctx: click.Context, plugin_name: str) -> None:
 @click.pass_context
 def deactivate_plugin(ctx: click.Context, plugin_name: str) -> None:
     """Deactivate a plugin."""
-    config_path = ctx.obj["config_path"]
-    plugin_dir = config_path / "plugins"
-    
-    # Initialize registry and loader
-    registry_path = plugin_dir / "registry.json"
-    registry = PluginRegistry(registry_path)
-    loader = PluginLoader(plugin_dir, registry)
+    loader = _get_loader(ctx, lazy=True)
     
     try:
-        with create_progress_spinner(f"Deactivating {plugin_name}..."):
+        with console.status(f"Deactivating {plugin_name}..."):
             loader.deactivate_plugin(plugin_name)
         
         success(f"Deactivated plugin: {plugin_name}")
         
     except Exception as e:
         error(f"Failed to deactivate plugin: {e}")
-        raise click.Exit(EXIT_CODES.ERROR)
+        raise click.exceptions.Exit(EXIT_ERROR)
 
 
 def run_plugins_command(
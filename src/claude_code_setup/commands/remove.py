@@ -1,24 +1,22 @@
 """Remove command implementation for claude-code-setup."""
 
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import click
-from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 
 from ..core.registry import register_command
-from ..utils.fs import template_exists_sync, ensure_claude_directories_sync
+from ..ui.styles import console, create_error_banner
 from ..utils.logger import error, info, success, warning
-from ..utils.settings import read_settings_sync, save_settings_sync
-from ..utils.hook_installer import create_hook_installer
-from ..ui.prompts import MultiSelectPrompt, ConfirmationDialog
-from ..ui.progress import MultiStepProgress, ProgressStep
-from ..ui.styles import create_error_banner, create_panel
 
-console = Console()
+# Upper bound on concurrent unlinks when removing templates
+_MAX_REMOVAL_WORKERS = 16
 
 
 def find_installed_templates_for_removal(target_dir: Path) -> List[Tuple[str, str, Path]]:
@@ -31,22 +29,29 @@ def find_installed_templates_for_removal(target_dir: Path) -> List[Tuple[str, st
         List of tuples (template_name, category, file_path)
     """
     installed = []
-    commands_dir = target_dir / "commands"
+    commands_dir = os.path.join(target_dir, "commands")
     
-    if not commands_dir.exists():
+    try:
+        category_entries = os.scandir(commands_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return installed
         
-    # Scan all category directories
-    for category_dir in commands_dir.iterdir():
-        if not category_dir.is_dir():
-            continue
+    # Scan all category directories, using the cached DirEntry file types
+    with category_entries:
+        for category_entry in category_entries:
+            if not category_entry.is_dir():
+                continue
+                
+            category = category_entry.name
             
-        category = category_dir.name
-        
-        # Find all template files
-        for template_file in category_dir.glob("*.md"):
-            template_name = template_file.stem
-            installed.append((template_name, category, template_file))
+            # Find all template files
+            with os.scandir(category_entry.path) as template_entries:
+                for template_entry in template_entries:
+                    name = template_entry.name
+                    if not name.endswith(".md") or not template_entry.is_file():
+                        continue
+                        
+                    installed.append((name[:-3], category, Path(template_entry.path)))
             
     return installed
 
@@ -61,37 +66,46 @@ def find_installed_hooks_for_removal(target_dir: Path) -> List[Tuple[str, str, P
         List of tuples (hook_name, category, directory_path)
     """
     installed = []
-    hooks_dir = target_dir / "hooks"
+    hooks_dir = os.path.join(target_dir, "hooks")
     
-    if not hooks_dir.exists():
+    try:
+        category_entries = os.scandir(hooks_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return installed
         
-    # Scan all category directories
-    for category_dir in hooks_dir.iterdir():
-        if not category_dir.is_dir():
-            continue
-            
-        category = category_dir.name
-        
-        # Find all hook directories
-        for hook_dir in category_dir.iterdir():
-            if not hook_dir.is_dir():
+    # Scan all category directories, using the cached DirEntry file types
+    with category_entries:
+        for category_entry in category_entries:
+            if not category_entry.is_dir():
                 continue
                 
-            hook_name = hook_dir.name
-            # Check if it has metadata.json to confirm it's a hook
-            if (hook_dir / "metadata.json").exists():
-                installed.append((hook_name, category, hook_dir))
+            category = category_entry.name
+            
+            # Find all hook directories
+            with os.scandir(category_entry.path) as hook_entries:
+                for hook_entry in hook_entries:
+                    if not hook_entry.is_dir():
+                        continue
+                        
+                    # Check if it has metadata.json to confirm it's a hook
+                    if os.path.exists(os.path.join(hook_entry.path, "metadata.json")):
+                        installed.append((hook_entry.name, category, Path(hook_entry.path)))
             
     return installed
 
 
-def remove_template_file(template_path: Path, dry_run: bool = False) -> bool:
+def remove_template_file(
+    template_path: Path,
+    dry_run: bool = False,
+    prune_empty_dir: bool = True,
+) -> bool:
     """Remove a template file from the filesystem.
     
     Args:
         template_path: Path to the template file
         dry_run: Whether to perform a dry run
+        prune_empty_dir: Whether to remove the category directory if this
+            was its last template
         
     Returns:
         True if removal was successful
@@ -107,7 +121,7 @@ def remove_template_file(template_path: Path, dry_run: bool = False) -> bool:
             
             # Remove empty category directory
             category_dir = template_path.parent
-            if category_dir.is_dir() and not list(category_dir.iterdir()):
+            if prune_empty_dir and category_dir.is_dir() and _is_empty(category_dir):
                 category_dir.rmdir()
                 info(f"Removed empty category directory: {category_dir.name}")
                 
@@ -134,22 +148,130 @@ def remove_templates_batch(
     Returns:
         Tuple of (successes, errors)
     """
-    successes = []
-    errors = []
+    successes: List[str] = []
+    errors: List[str] = []
+    
+    if dry_run:
+        for template_name, category, file_path in templates:
+            info(f"[DRY RUN] Would remove: {file_path}")
+            successes.append(f"{template_name} ({category})")
+        return successes, errors
+    
+    # Group by category directory so each one is opened and checked once
+    by_directory: Dict[str, List[Tuple[str, str, Path]]] = {}
+    for template in templates:
+        by_directory.setdefault(os.path.dirname(template[2]), []).append(template)
     
-    for template_name, category, file_path in templates:
-        try:
-            if remove_template_file(file_path, dry_run):
-                successes.append(f"{template_name} ({category})")
+    for category_dir, group in by_directory.items():
+        outcomes = _unlink_in_directory(category_dir, [file_path for _, _, file_path in group])
+        for (template_name, category, _), outcome in zip(group, outcomes):
+            label = f"{template_name} ({category})"
+            if outcome is None:
+                successes.append(label)
             else:
-                errors.append(f"{template_name} ({category}): File not found")
-                
-        except Exception as e:
-            errors.append(f"{template_name} ({category}): {str(e)}")
+                errors.append(f"{label}: {outcome}")
+        
+        _remove_empty_category_dir(category_dir)
             
     return successes, errors
 
 
+def _unlink_in_directory(
+    category_dir: str,
+    file_paths: List[Path],
+    dry_run: bool = False,
+) -> List[Optional[str]]:
+    """Remove template files that share one category directory.
+    
+    The directory is opened once and files are unlinked relative to it
+    where the platform supports dir_fd.
+    
+    Args:
+        category_dir: Directory containing every file in file_paths
+        file_paths: Template files to remove
+        dry_run: Whether to perform a dry run
+        
+    Returns:
+        One entry per file: None if removed, otherwise the failure reason
+    """
+    if dry_run:
+        for file_path in file_paths:
+            info(f"[DRY RUN] Would remove: {file_path}")
+        return [None] * len(file_paths)
+    
+    outcomes: List[Optional[str]] = []
+    dir_fd = _open_directory(category_dir)
+    try:
+        for file_path in file_paths:
+            file_name = os.path.basename(file_path)
+            try:
+                if dir_fd is None:
+                    os.unlink(file_path)
+                else:
+                    os.unlink(file_name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                warning(f"Template file not found: {file_path}")
+                outcomes.append("File not found")
+            except OSError as e:
+                error(f"Failed to remove template: {e}")
+                outcomes.append(str(e))
+            else:
+                success(f"Removed template: {file_name}")
+                outcomes.append(None)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    
+    return outcomes
+
+
+def _open_directory(path: str) -> Optional[int]:
+    """Open a directory for dir_fd-relative unlinks where supported.
+    
+    Args:
+        path: Directory to open
+        
+    Returns:
+        Directory file descriptor, or None if unsupported or not openable
+    """
+    if os.unlink not in os.supports_dir_fd:
+        return None
+    
+    try:
+        return os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return None
+
+
+def _is_empty(directory: Union[str, Path]) -> bool:
+    """Check whether a directory is empty, stopping at the first entry.
+    
+    Args:
+        directory: Directory to check
+        
+    Returns:
+        True if the directory has no entries
+    """
+    with os.scandir(directory) as entries:
+        return next(entries, None) is None
+
+
+def _remove_empty_category_dir(category_dir: str) -> None:
+    """Remove a category directory once its last template is gone.
+    
+    Args:
+        category_dir: Category directory to check
+    """
+    try:
+        if not _is_empty(category_dir):
+            return
+        os.rmdir(category_dir)
+    except OSError:
+        return
+    
+    info(f"Removed empty category directory: {os.path.basename(category_dir)}")
+
+
 def remove_permission_from_settings(
     permission: str,
     target_dir: Path,
@@ -173,41 +295,44 @@ def remove_permission_from_settings(
             warning("No settings file found")
             return False
             
-        import json
         with open(settings_path) as f:
             settings_dict = json.load(f)
             
-        # Check for permissions in different formats
-        allowed_tools = []
-        permission_found = False
+        # Locate the permission list in either settings format
+        permissions_container: Optional[Dict[str, Any]] = None
+        permissions_key = ""
         
         # Check TypeScript format (flat array)
         if "allowedTools" in settings_dict:
-            allowed_tools = settings_dict.get("allowedTools", [])
-            if permission in allowed_tools:
-                permission_found = True
-                allowed_tools.remove(permission)
-                settings_dict["allowedTools"] = allowed_tools
+            permissions_container, permissions_key = settings_dict, "allowedTools"
                 
         # Check Python format (nested permissions.allow)
         elif "permissions" in settings_dict and "allow" in settings_dict["permissions"]:
-            allowed_tools = settings_dict["permissions"]["allow"]
-            if permission in allowed_tools:
-                permission_found = True
-                allowed_tools.remove(permission)
-                settings_dict["permissions"]["allow"] = allowed_tools
-                
-        if not permission_found:
+            permissions_container, permissions_key = settings_dict["permissions"], "allow"
+        
+        if permissions_container is None:
             warning(f"Permission not found: {permission}")
             return False
-            
+        allowed_tools: List[str] = permissions_container[permissions_key] or []
+        
+        # A dry run only needs to know whether the permission is present
         if dry_run:
+            if permission not in allowed_tools:
+                warning(f"Permission not found: {permission}")
+                return False
             info(f"[DRY RUN] Would remove permission: {permission}")
             return True
+        
+        # Drop the permission in a single pass over the list
+        remaining = [tool for tool in allowed_tools if tool != permission]
+        if len(remaining) == len(allowed_tools):
+            warning(f"Permission not found: {permission}")
+            return False
+        permissions_container[permissions_key] = remaining
             
-        # Save updated settings
+        # Save updated settings, serialized up front for a single write
         with open(settings_path, 'w') as f:
-            json.dump(settings_dict, f, indent=2)
+            f.write(json.dumps(settings_dict, indent=2))
             
         success(f"Removed permission: {permission}")
         return True
@@ -228,26 +353,38 @@ def show_removal_selection(
     Returns:
         Selected templates or None if cancelled
     """
-    # Group by category
-    by_category = {}
-    for name, category, path in installed:
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append((name, path))
-    
-    # Create choices
+    return _select_items_for_removal(installed, "templates")
+
+
+def _select_items_for_removal(
+    installed: List[Tuple[str, str, Path]],
+    item_label: str,
+) -> Optional[List[Tuple[str, str, Path]]]:
+    """Prompt for installed items to remove, grouped under category headers.
+    
+    Args:
+        installed: List of (name, category, path) tuples
+        item_label: Plural item name used in the prompt
+        
+    Returns:
+        Selected items or None if cancelled
+    """
+    from ..ui.prompts import MultiSelectPrompt
+    
+    # Sort once by category then name, and build the choices in one pass
     choices = []
     choice_map = {}
     
-    for category in sorted(by_category.keys()):
+    ordered = sorted(installed, key=itemgetter(1, 0))
+    for category, entries in groupby(ordered, key=itemgetter(1)):
         choices.append(f"[dim]{category.upper()}[/dim]")
-        for name, path in sorted(by_category[category]):
-            choice_key = f"  {name}"
+        for entry in entries:
+            choice_key = f"  {entry[0]}"
             choices.append(choice_key)
-            choice_map[choice_key] = (name, category, path)
+            choice_map[choice_key] = entry
     
     prompt = MultiSelectPrompt(
-        "Select templates to remove:",
+        f"Select {item_label} to remove:",
         choices=choices,
         default_selected=[],  # Don't select anything by default
     )
@@ -256,14 +393,8 @@ def show_removal_selection(
     if not selected:
         return None
         
-    # Parse selected templates
-    result = []
-    for item in selected:
-        if item.startswith("  "):
-            if item in choice_map:
-                result.append(choice_map[item])
-                
-    return result
+    # Headers are not in choice_map, so only items are returned
+    return [choice_map[item] for item in selected if item in choice_map]
 
 
 def handle_template_removal(
@@ -274,65 +405,16 @@ def handle_template_removal(
     dry_run: bool
 ) -> List[Tuple[str, str, Path]]:
     """Handle template removal logic."""
-    items_to_remove = []
-    
-    if all:
-        # Remove all items
-        items_to_remove = installed
-        
-    elif items:
-        # Remove specific items
-        item_set = set(items)
-        for name, category, path in installed:
-            if name in item_set:
-                items_to_remove.append((name, category, path))
-                
-        # Check for items that weren't found
-        found_names = {t[0] for t in items_to_remove}
-        not_found = item_set - found_names
-        if not_found:
-            console.print(
-                create_error_banner(
-                    "Templates Not Found",
-                    f"The following templates are not installed: {', '.join(not_found)}"
-                )
-            )
-            
-    else:
-        # Interactive selection
-        selected = show_removal_selection(installed)
-        if not selected:
-            console.print("[yellow]Removal cancelled.[/yellow]")
-            return []
-        items_to_remove = selected
-        
-    if not items_to_remove:
-        console.print("[yellow]No templates selected for removal.[/yellow]")
-        return []
-        
-    # Confirm removal (unless --force or --dry-run)
-    if not force and not dry_run:
-        # Create confirmation message
-        item_list = "\n".join(
-            f"  • {name} ({category})" 
-            for name, category, _ in items_to_remove
-        )
-        
-        confirm = ConfirmationDialog(
-            title="Confirm Removal",
-            message=f"Are you sure you want to remove {len(items_to_remove)} template(s)?",
-            details={"Templates": item_list},
-            default=False,
-            danger=True,
-        )
-        
-        if not confirm.ask():
-            console.print("[yellow]Removal cancelled.[/yellow]")
-            return []
-            
-    # Perform removal with progress tracking
-    perform_template_removal(items_to_remove, dry_run)
-    return items_to_remove
+    return _handle_removal(
+        "template",
+        installed,
+        items,
+        all,
+        force,
+        dry_run,
+        select=show_removal_selection,
+        perform=lambda selected: perform_template_removal(selected, dry_run),
+    )
 
 
 def handle_hook_removal(
@@ -344,44 +426,83 @@ def handle_hook_removal(
     target_dir: Path
 ) -> List[Tuple[str, str, Path]]:
     """Handle hook removal logic."""
+    return _handle_removal(
+        "hook",
+        installed,
+        items,
+        all,
+        force,
+        dry_run,
+        select=show_hook_removal_selection,
+        perform=lambda selected: perform_hook_removal(selected, target_dir, dry_run),
+    )
+
+
+def _handle_removal(
+    item_type: str,
+    installed: List[Tuple[str, str, Path]],
+    items: Tuple[str, ...],
+    all: bool,
+    force: bool,
+    dry_run: bool,
+    select: Callable[[List[Tuple[str, str, Path]]], Optional[List[Tuple[str, str, Path]]]],
+    perform: Callable[[List[Tuple[str, str, Path]]], None],
+) -> List[Tuple[str, str, Path]]:
+    """Pick, confirm and remove installed items of one type.
+    
+    Args:
+        item_type: Singular item name ("template" or "hook") used in messages
+        installed: List of installed (name, category, path) tuples
+        items: Names given on the command line
+        all: Whether to remove every installed item
+        force: Whether to skip the confirmation prompt
+        dry_run: Whether to perform a dry run
+        select: Interactive picker used when no names are given
+        perform: Callback that removes the chosen items
+        
+    Returns:
+        Items that were passed to perform, or an empty list if cancelled
+    """
     items_to_remove = []
+    plural = f"{item_type}s"
     
     if all:
         # Remove all items
         items_to_remove = installed
         
     elif items:
-        # Remove specific items
+        # Remove specific items, crossing off names as they are matched
         item_set = set(items)
+        not_found = set(item_set)
         for name, category, path in installed:
             if name in item_set:
                 items_to_remove.append((name, category, path))
+                not_found.discard(name)
                 
-        # Check for items that weren't found
-        found_names = {t[0] for t in items_to_remove}
-        not_found = item_set - found_names
         if not_found:
             console.print(
                 create_error_banner(
-                    "Hooks Not Found",
-                    f"The following hooks are not installed: {', '.join(not_found)}"
+                    f"{plural.title()} Not Found",
+                    f"The following {plural} are not installed: {', '.join(not_found)}"
                 )
             )
             
     else:
         # Interactive selection
-        selected = show_hook_removal_selection(installed)
+        selected = select(installed)
         if not selected:
             console.print("[yellow]Removal cancelled.[/yellow]")
             return []
         items_to_remove = selected
         
     if not items_to_remove:
-        console.print("[yellow]No hooks selected for removal.[/yellow]")
+        console.print(f"[yellow]No {plural} selected for removal.[/yellow]")
         return []
         
     # Confirm removal (unless --force or --dry-run)
     if not force and not dry_run:
+        from ..ui.prompts import ConfirmationDialog
+        
         # Create confirmation message
         item_list = "\n".join(
             f"  • {name} ({category})" 
@@ -390,8 +511,8 @@ def handle_hook_removal(
         
         confirm = ConfirmationDialog(
             title="Confirm Removal",
-            message=f"Are you sure you want to remove {len(items_to_remove)} hook(s)?",
-            details={"Hooks": item_list},
+            message=f"Are you sure you want to remove {len(items_to_remove)} {item_type}(s)?",
+            details={plural.title(): item_list},
             default=False,
             danger=True,
         )
@@ -401,7 +522,7 @@ def handle_hook_removal(
             return []
             
     # Perform removal with progress tracking
-    perform_hook_removal(items_to_remove, target_dir, dry_run)
+    perform(items_to_remove)
     return items_to_remove
 
 
@@ -409,46 +530,13 @@ def show_hook_removal_selection(
     installed: List[Tuple[str, str, Path]]
 ) -> Optional[List[Tuple[str, str, Path]]]:
     """Show interactive hook selection for removal."""
-    # Group by category
-    by_category = {}
-    for name, category, path in installed:
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append((name, path))
-    
-    # Create choices
-    choices = []
-    choice_map = {}
-    
-    for category in sorted(by_category.keys()):
-        choices.append(f"[dim]{category.upper()}[/dim]")
-        for name, path in sorted(by_category[category]):
-            choice_key = f"  {name}"
-            choices.append(choice_key)
-            choice_map[choice_key] = (name, category, path)
-    
-    prompt = MultiSelectPrompt(
-        "Select hooks to remove:",
-        choices=choices,
-        default_selected=[],  # Don't select anything by default
-    )
-    
-    selected = prompt.ask()
-    if not selected:
-        return None
-        
-    # Parse selected hooks
-    result = []
-    for item in selected:
-        if item.startswith("  "):
-            if item in choice_map:
-                result.append(choice_map[item])
-                
-    return result
+    return _select_items_for_removal(installed, "hooks")
 
 
 def perform_template_removal(items_to_remove: List[Tuple[str, str, Path]], dry_run: bool):
     """Perform template removal with progress tracking."""
+    from ..ui.progress import MultiStepProgress, ProgressStep
+    
     # Create progress steps
     steps = [
         ProgressStep(f"remove_{i}", f"Remove {name} from {cat}")
@@ -462,35 +550,64 @@ def perform_template_removal(items_to_remove: List[Tuple[str, str, Path]], dry_r
         console_obj=console,
     )
     
-    # Perform removal with progress tracking
-    with progress.live_display() as (live, update):
-        successes = []
-        errors = []
-        
-        for i, (item_name, category, file_path) in enumerate(items_to_remove):
-            step_id = f"remove_{i}"
-            progress.start_step(step_id)
+    # Each category directory is opened once and its files unlinked together;
+    # directories are independent, so they run on a small thread pool
+    by_directory: Dict[str, List[int]] = {}
+    for index, (_, _, file_path) in enumerate(items_to_remove):
+        by_directory.setdefault(os.path.dirname(file_path), []).append(index)
+    
+    outcomes: List[Optional[str]] = [None] * len(items_to_remove)
+    max_workers = min(_MAX_REMOVAL_WORKERS, len(by_directory)) or 1
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with progress.live_display() as (live, update):
+            futures = {}
+            for category_dir, indices in by_directory.items():
+                for index in indices:
+                    progress.start_step(steps[index].id)
+                future = executor.submit(
+                    _unlink_in_directory,
+                    category_dir,
+                    [items_to_remove[index][2] for index in indices],
+                    dry_run,
+                )
+                futures[future] = indices
             update()
             
-            try:
-                if remove_template_file(file_path, dry_run):
+            # Update progress from this thread as each directory finishes
+            for future in as_completed(futures):
+                indices = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    results = [str(e)] * len(indices)
+                
+                for index, outcome in zip(indices, results):
+                    outcomes[index] = outcome
+                    progress.complete_step(steps[index].id, success=outcome is None)
+                update()
+            
+            # Prune emptied category directories serially once all files are gone
+            if not dry_run:
+                for category_dir in by_directory:
+                    _remove_empty_category_dir(category_dir)
+            
+            successes = []
+            errors = []
+            for (item_name, category, _), outcome in zip(items_to_remove, outcomes):
+                if outcome is None:
                     successes.append(f"{item_name} ({category})")
-                    progress.complete_step(step_id, success=True)
                 else:
-                    errors.append(f"{item_name} ({category}): File not found")
-                    progress.complete_step(step_id, success=False)
-                    
-            except Exception as e:
-                errors.append(f"{item_name} ({category}): {str(e)}")
-                progress.complete_step(step_id, success=False)
+                    errors.append(f"{item_name} ({category}): {outcome}")
             
-            update()
-        
-        show_removal_summary(successes, errors, "template")
+            show_removal_summary(successes, errors, "template")
 
 
 def perform_hook_removal(items_to_remove: List[Tuple[str, str, Path]], target_dir: Path, dry_run: bool):
     """Perform hook removal with progress tracking."""
+    from ..ui.progress import MultiStepProgress, ProgressStep
+    from ..utils.hook_installer import create_hook_installer
+    
     # Create hook installer for removal
     installer = create_hook_installer(
         target_dir=target_dir,
@@ -518,13 +635,13 @@ def perform_hook_removal(items_to_remove: List[Tuple[str, str, Path]], target_di
         successes = []
         errors = []
         
-        for i, (hook_name, category, hook_path) in enumerate(items_to_remove):
-            step_id = f"remove_{i}"
+        for step, (hook_name, category, hook_path) in zip(steps, items_to_remove):
+            step_id = step.id
             progress.start_step(step_id)
             update()
             
             try:
-                result = installer.uninstall_hook(hook_name)
+                result = installer.uninstall_hook(hook_name, path_hint=hook_path)
                 if result.success:
                     successes.append(f"{hook_name} ({category})")
                     progress.complete_step(step_id, success=True)
@@ -544,21 +661,22 @@ def perform_hook_removal(items_to_remove: List[Tuple[str, str, Path]], target_di
 def show_removal_summary(successes: List[str], errors: List[str], item_type: str):
     """Show removal summary."""
     if successes or errors:
-        # Create summary panel
-        summary_text = ""
+        # Create summary panel from collected lines
+        summary_lines = []
         
         if successes:
-            summary_text += f"[green]✓ Successfully removed {len(successes)} {item_type}(s)[/green]\n"
+            summary_lines.append(
+                f"[green]✓ Successfully removed {len(successes)} {item_type}(s)[/green]"
+            )
             
         if errors:
-            summary_text += f"[red]✗ Failed to remove {len(errors)} {item_type}(s)[/red]\n"
-            for err in errors:
-                summary_text += f"  • {err}\n"
+            summary_lines.append(f"[red]✗ Failed to remove {len(errors)} {item_type}(s)[/red]")
+            summary_lines.extend(f"  • {err}" for err in errors)
                 
         console.print("\n")
         console.print(
             Panel(
-                summary_text.strip(),
+                "\n".join(summary_lines).strip(),
                 title="Removal Summary",
                 border_style="green" if not errors else "red",
             )
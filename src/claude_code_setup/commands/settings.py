@@ -4,16 +4,19 @@ This module implements the settings command which allows users to manage
 their Claude Code configuration including themes, permissions, and environment variables.
 """
 
-import json
+import os
 import sys
+from functools import wraps
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Iterable, List, Optional, Dict, Tuple
 
+from rich.console import Group
+from rich.highlighter import ReprHighlighter
 from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
-from rich.table import Table
+from rich.text import Text
 
 from ..core.registry import register_command
+from ..types import ClaudeSettings
 from ..utils.logger import error, info, success, warning
 from ..utils.settings import (
     read_settings_sync,
@@ -23,19 +26,147 @@ from ..utils.settings import (
     get_settings_sync,
     merge_settings_sync,
 )
-from ..utils.fs import CLAUDE_SETTINGS_FILE
-from ..ui.prompts import MultiSelectPrompt, ConfirmationDialog, SelectOption
 from ..ui.styles import (
     console,
-    create_panel,
     create_table,
-    create_command_error,
-    create_success_banner,
     COLORS,
     BOX_STYLES,
 )
 
 
+_highlighter = ReprHighlighter()
+
+
+def _render_markup(markup: str) -> Text:
+    """Parse console markup once, highlighted as console.print would."""
+    return _highlighter(Text.from_markup(markup))
+
+
+def _section_header(title: str) -> Text:
+    """Build a section heading in the header colour, preceded by a blank line."""
+    return _render_markup(f"\n[bold {COLORS['header']}]{title}[/bold {COLORS['header']}]")
+
+
+# Headings and action menus are parsed from markup once, at import
+_CURRENT_SETTINGS_HEADER = _section_header("Current Settings")
+_THEME_HEADER = _section_header("Theme Management")
+_ENV_HEADER = _section_header("Environment Variables")
+_PERMISSION_HEADER = _section_header("Permission Management")
+
+_SETTINGS_MENU = "\n".join((
+    "[bold]Available Actions:[/bold]",
+    "  1. 📋 View current settings",
+    "  2. 🎨 Manage themes",
+    "  3. 🌍 Manage environment variables",
+    "  4. 🔐 Manage permissions",
+    "  5. 📁 Show settings file location",
+    "  6. ❌ Exit",
+))
+
+_ENV_MENU = _render_markup("\n".join((
+    "\n[bold]Environment Variable Actions:[/bold]",
+    "  1. Add/Update variable",
+    "  2. Remove variable",
+    "  3. Clear all variables",
+    "  4. Back to main menu",
+)))
+
+_PERMISSION_MENU = _render_markup("\n".join((
+    "\n[bold]Permission Actions:[/bold]",
+    "  1. Add permission set",
+    "  2. Add custom permission",
+    "  3. Remove permissions",
+    "  4. Reset to defaults",
+    "  5. Back to main menu",
+)))
+
+
+# Parsed settings per file, keyed on the (mtime_ns, size) they were read at
+_settings_cache: Dict[Path, Tuple[Tuple[int, int], ClaudeSettings]] = {}
+
+# Rendered settings views per file, keyed the same way
+_view_cache: Dict[Path, Tuple[Tuple[int, int], Group]] = {}
+
+
+def _settings_signature(settings_path: Path) -> Optional[Tuple[int, int]]:
+    """Return the (mtime_ns, size) of a settings file, or None if missing."""
+    try:
+        stat_result = os.stat(settings_path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _read_settings_cached(
+    settings_path: Path,
+    signature: Optional[Tuple[int, int]] = None,
+) -> Optional[ClaudeSettings]:
+    """Read settings, reusing the parsed model while the file is unchanged.
+    
+    Callers get their own copy, so edits that are never saved cannot leak
+    into later reads.
+    
+    Args:
+        settings_path: Path to the settings file
+        signature: Signature the caller just took of the file, to skip
+            another stat
+        
+    Returns:
+        ClaudeSettings object, or None if the file is missing or invalid
+    """
+    if signature is None:
+        signature = _settings_signature(settings_path)
+    cached = _settings_cache.get(settings_path)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1].model_copy(deep=True)
+    
+    settings = read_settings_sync(settings_path)
+    if settings is not None and signature is not None:
+        _settings_cache[settings_path] = (signature, settings.model_copy(deep=True))
+    return settings
+
+
+def _save_settings(settings: ClaudeSettings, settings_path: Path) -> None:
+    """Save settings and remember them as the current contents of the file.
+    
+    Args:
+        settings: Settings to save
+        settings_path: Path to the settings file
+    """
+    save_settings_sync(settings, settings_path)
+    _view_cache.pop(settings_path, None)
+    
+    signature = _settings_signature(settings_path)
+    if signature is None:
+        _settings_cache.pop(settings_path, None)
+    else:
+        _settings_cache[settings_path] = (signature, settings.model_copy(deep=True))
+
+
+def _report_failure(action: str) -> Callable[[Callable[..., bool]], Callable[..., bool]]:
+    """Report unexpected errors from a settings action and return False.
+    
+    KeyboardInterrupt is not caught, so cancelling still reaches the menu
+    or command that started the action.
+    
+    Args:
+        action: What the action does, used in the error message
+        
+    Returns:
+        Decorator wrapping a settings action
+    """
+    def decorator(func: Callable[..., bool]) -> Callable[..., bool]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> bool:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                error(f"Failed to {action}: {e}")
+                return False
+        return wrapper
+    return decorator
+
+
 def determine_settings_path(test_dir: Optional[str], global_config: bool) -> Path:
     """Determine the settings file path based on options."""
     if test_dir:
@@ -53,21 +184,33 @@ def determine_settings_path(test_dir: Optional[str], global_config: bool) -> Pat
 
 def show_current_settings(settings_path: Path) -> None:
     """Display current settings in a formatted table."""
-    console.print(f"\n[bold {COLORS['header']}]Current Settings[/bold {COLORS['header']}]")
-    console.print(f"[dim]Location: {settings_path}[/dim]\n")
+    # The header is printed together with the body in a single render
+    header = (
+        _CURRENT_SETTINGS_HEADER,
+        f"[dim]Location: {settings_path}[/dim]\n",
+    )
     
-    if not settings_path.exists():
-        console.print(Panel(
+    signature = _settings_signature(settings_path)
+    if signature is None:
+        from rich.panel import Panel
+        
+        console.print(Group(*header, Panel(
             "[yellow]No settings file found.[/yellow]\n"
             "Use [cyan]claude-setup init[/cyan] to create initial configuration.",
             title="Settings Not Found",
             border_style="yellow"
-        ))
+        )))
+        return
+    
+    cached_view = _view_cache.get(settings_path)
+    if cached_view is not None and cached_view[0] == signature:
+        console.print(cached_view[1])
         return
     
     try:
-        settings = read_settings_sync(settings_path)
+        settings = _read_settings_cached(settings_path, signature)
         if not settings:
+            console.print(Group(*header))
             error("Failed to read settings file")
             return
         
@@ -80,287 +223,289 @@ def show_current_settings(settings_path: Path) -> None:
         table.add_column("Setting", style=COLORS["primary"], width=20)
         table.add_column("Value", style="white")
         
-        # Add basic settings
-        table.add_row("Theme", settings.theme or "default")
-        table.add_row("Auto Updater", "Enabled" if settings.autoUpdaterStatus else "Disabled")
-        table.add_row("Notifications", settings.preferredNotifChannel or "terminal")
-        table.add_row("Verbose Logging", "Enabled" if settings.verbose else "Disabled")
-        
-        # Add permissions count
         perm_count = len(settings.permissions.allow) if settings.permissions else 0
-        table.add_row("Permissions", f"{perm_count} allowed")
-        
-        # Add environment variables count
         env_count = len(settings.env) if settings.env else 0
-        table.add_row("Environment Variables", f"{env_count} defined")
+        ignore_count = len(settings.ignorePatterns) if settings.ignorePatterns else 0
         
-        # Add hooks count
         hooks_count = 0
         if settings.hooks:
-            hooks_dict = settings.hooks.model_dump()
-            for event_hooks in hooks_dict.values():
-                if event_hooks:
-                    for hook_group in event_hooks:
-                        hooks_count += len(hook_group.get('hooks', []))
-        table.add_row("Hooks", f"{hooks_count} registered")
+            for event_name in type(settings.hooks).model_fields:
+                for hook_group in getattr(settings.hooks, event_name) or []:
+                    hooks_count += len(hook_group.hooks)
         
-        # Add ignore patterns count
-        ignore_count = len(settings.ignorePatterns) if settings.ignorePatterns else 0
-        table.add_row("Ignore Patterns", f"{ignore_count} patterns")
+        rows = [
+            ("Theme", settings.theme or "default"),
+            ("Auto Updater", "Enabled" if settings.autoUpdaterStatus else "Disabled"),
+            ("Notifications", settings.preferredNotifChannel or "terminal"),
+            ("Verbose Logging", "Enabled" if settings.verbose else "Disabled"),
+            ("Permissions", f"{perm_count} allowed"),
+            ("Environment Variables", f"{env_count} defined"),
+            ("Hooks", f"{hooks_count} registered"),
+            ("Ignore Patterns", f"{ignore_count} patterns"),
+        ]
+        for label, value in rows:
+            table.add_row(label, value)
         
-        console.print(table)
+        view = Group(*header, table)
+        _view_cache[settings_path] = (signature, view)
+        console.print(view)
         
     except Exception as e:
+        console.print(Group(*header))
         error(f"Error reading settings: {e}")
 
 
+@_report_failure("update theme")
 def manage_theme(settings_path: Path) -> bool:
     """Manage theme selection."""
-    console.print(f"\n[bold {COLORS['header']}]Theme Management[/bold {COLORS['header']}]")
+    console.print(_THEME_HEADER)
     
     # Get available themes
-    try:
-        available_themes = get_available_themes_sync()
-        if not available_themes:
-            warning("No themes available")
-            return False
-        
-        # Get current theme
-        current_settings = read_settings_sync(settings_path)
-        current_theme = current_settings.theme if current_settings else "default"
-        
-        console.print(f"Current theme: [bold {COLORS['primary']}]{current_theme}[/bold {COLORS['primary']}]")
-        console.print(f"Available themes: {', '.join(available_themes)}")
-        
-        # Prompt for new theme
-        new_theme = Prompt.ask(
-            "Select new theme",
-            choices=available_themes,
-            default=current_theme
-        )
-        
-        if new_theme == current_theme:
-            info("Theme unchanged")
-            return False
-        
-        # Update settings
-        if current_settings:
-            current_settings.theme = new_theme
-            save_settings_sync(current_settings, settings_path)
-        else:
-            # Create new settings with theme
-            new_settings = get_settings_sync(theme=new_theme)
-            save_settings_sync(new_settings, settings_path)
-        
-        success(f"Theme updated to: {new_theme}")
-        return True
-        
-    except Exception as e:
-        error(f"Failed to update theme: {e}")
+    available_themes = get_available_themes_sync()
+    if not available_themes:
+        warning("No themes available")
+        return False
+    
+    # Get current theme
+    current_settings = _read_settings_cached(settings_path)
+    current_theme = current_settings.theme if current_settings else "default"
+    
+    console.print(f"Current theme: [bold {COLORS['primary']}]{current_theme}[/bold {COLORS['primary']}]")
+    console.print(f"Available themes: {', '.join(available_themes)}")
+    
+    # Prompt for new theme
+    new_theme = Prompt.ask(
+        "Select new theme",
+        choices=available_themes,
+        default=current_theme
+    )
+    
+    if new_theme == current_theme:
+        info("Theme unchanged")
         return False
+    
+    # Update settings
+    if current_settings:
+        current_settings.theme = new_theme
+        _save_settings(current_settings, settings_path)
+    else:
+        # Create new settings with theme
+        new_settings = get_settings_sync(theme=new_theme)
+        _save_settings(new_settings, settings_path)
+    
+    success(f"Theme updated to: {new_theme}")
+    return True
 
 
+@_report_failure("manage environment variables")
 def manage_environment_variables(settings_path: Path) -> bool:
     """Manage environment variables."""
-    console.print(f"\n[bold {COLORS['header']}]Environment Variables[/bold {COLORS['header']}]")
+    console.print(_ENV_HEADER)
     
-    try:
-        current_settings = read_settings_sync(settings_path)
-        if not current_settings:
-            warning("No settings file found")
-            return False
+    current_settings = _read_settings_cached(settings_path)
+    if not current_settings:
+        warning("No settings file found")
+        return False
+    
+    env_vars = current_settings.env or {}
+    dirty = False
+    
+    # Show current environment variables
+    if env_vars:
+        table = create_table(
+            title="Current Environment Variables",
+            show_header=True,
+            box=BOX_STYLES["minimal"],
+        )
+        table.add_column("Variable", style=COLORS["primary"])
+        table.add_column("Value", style="white")
         
-        env_vars = current_settings.env or {}
+        # Mask sensitive values
+        masked_rows = [
+            (key, value if len(value) <= 20 else f"{value[:10]}...{value[-5:]}")
+            for key, value in env_vars.items()
+        ]
+        for key, display_value in masked_rows:
+            table.add_row(key, display_value)
         
-        # Show current environment variables
-        if env_vars:
-            table = create_table(
-                title="Current Environment Variables",
-                show_header=True,
-                box=BOX_STYLES["minimal"],
-            )
-            table.add_column("Variable", style=COLORS["primary"])
-            table.add_column("Value", style="white")
+        console.print(table)
+    else:
+        console.print("[dim]No environment variables defined[/dim]")
+    
+    # Environment variable management menu
+    while True:
+        console.print(_ENV_MENU)
+        
+        choice = Prompt.ask("Choose action", choices=["1", "2", "3", "4"], default="4")
+        
+        if choice == "1":
+            # Add/Update variable
+            var_name = Prompt.ask("Variable name")
+            if not var_name.strip():
+                warning("Variable name cannot be empty")
+                continue
             
-            for key, value in env_vars.items():
-                # Mask sensitive values
-                display_value = value if len(value) <= 20 else f"{value[:10]}...{value[-5:]}"
-                table.add_row(key, display_value)
+            var_value = Prompt.ask("Variable value")
+            env_vars[var_name] = var_value
+            dirty = True
+            success(f"Set {var_name} = {var_value}")
             
-            console.print(table)
-        else:
-            console.print("[dim]No environment variables defined[/dim]")
-        
-        # Environment variable management menu
-        while True:
-            console.print("\n[bold]Environment Variable Actions:[/bold]")
-            console.print("  1. Add/Update variable")
-            console.print("  2. Remove variable")
-            console.print("  3. Clear all variables")
-            console.print("  4. Back to main menu")
+        elif choice == "2":
+            # Remove variable
+            if not env_vars:
+                warning("No variables to remove")
+                continue
             
-            choice = Prompt.ask("Choose action", choices=["1", "2", "3", "4"], default="4")
+            var_name = Prompt.ask(
+                "Variable to remove",
+                choices=list(env_vars.keys())
+            )
+            if var_name in env_vars:
+                del env_vars[var_name]
+                dirty = True
+                success(f"Removed variable: {var_name}")
             
-            if choice == "1":
-                # Add/Update variable
-                var_name = Prompt.ask("Variable name")
-                if not var_name.strip():
-                    warning("Variable name cannot be empty")
-                    continue
-                
-                var_value = Prompt.ask("Variable value")
-                env_vars[var_name] = var_value
-                success(f"Set {var_name} = {var_value}")
-                
-            elif choice == "2":
-                # Remove variable
-                if not env_vars:
-                    warning("No variables to remove")
-                    continue
-                
-                var_name = Prompt.ask(
-                    "Variable to remove",
-                    choices=list(env_vars.keys())
-                )
-                if var_name in env_vars:
-                    del env_vars[var_name]
-                    success(f"Removed variable: {var_name}")
-                
-            elif choice == "3":
-                # Clear all variables
-                if env_vars and Confirm.ask("Clear all environment variables?"):
-                    env_vars.clear()
-                    success("Cleared all environment variables")
-                
-            elif choice == "4":
-                break
-        
-        # Save updated settings
+        elif choice == "3":
+            # Clear all variables
+            if env_vars and Confirm.ask("Clear all environment variables?"):
+                env_vars.clear()
+                dirty = True
+                success("Cleared all environment variables")
+            
+        elif choice == "4":
+            break
+    
+    # Save updated settings, unless the variables were only viewed
+    if dirty:
         current_settings.env = env_vars if env_vars else None
-        save_settings_sync(current_settings, settings_path)
-        
-        return True
+        _save_settings(current_settings, settings_path)
+    
+    return True
+
+
+def _group_permissions(permissions: Iterable[str]) -> Dict[str, List[str]]:
+    """Group Bash permissions by command prefix.
+    
+    Permissions without a ``:`` pattern are grouped under ``misc``;
+    non-Bash permissions are skipped.
+    
+    Args:
+        permissions: Permission strings such as ``Bash(git:*)``
         
-    except Exception as e:
-        error(f"Failed to manage environment variables: {e}")
-        return False
+    Returns:
+        Mapping of prefix to permissions, in first-seen order
+    """
+    groups: Dict[str, List[str]] = {}
+    for perm in permissions:
+        if perm.startswith("Bash(") and perm.endswith(")"):
+            command, sep, _ = perm[5:-1].partition(":")
+            groups.setdefault(command if sep else "misc", []).append(perm)
+    return groups
 
 
+@_report_failure("manage permissions")
 def manage_permissions(settings_path: Path) -> bool:
     """Manage permission sets."""
-    console.print(f"\n[bold {COLORS['header']}]Permission Management[/bold {COLORS['header']}]")
+    from ..ui.prompts import MultiSelectPrompt, SelectOption
     
-    try:
-        current_settings = read_settings_sync(settings_path)
-        if not current_settings:
-            warning("No settings file found")
-            return False
+    console.print(_PERMISSION_HEADER)
+    
+    current_settings = _read_settings_cached(settings_path)
+    if not current_settings:
+        warning("No settings file found")
+        return False
+    
+    current_permissions = current_settings.permissions.allow if current_settings.permissions else []
+    allow_set = set(current_permissions)
+    available_permission_sets = get_available_permission_sets_sync()
+    
+    # Show current permissions
+    console.print(f"Current permissions: {len(current_permissions)} allowed")
+    if current_permissions:
+        for group, perms in _group_permissions(current_permissions).items():
+            console.print(f"  [bold {COLORS['primary']}]{group}[/bold {COLORS['primary']}]: {len(perms)} permissions")
+    
+    # Permission management menu
+    while True:
+        console.print(_PERMISSION_MENU)
         
-        current_permissions = current_settings.permissions.allow if current_settings.permissions else []
-        available_permission_sets = get_available_permission_sets_sync()
+        choice = Prompt.ask("Choose action", choices=["1", "2", "3", "4", "5"], default="5")
         
-        # Show current permissions
-        console.print(f"Current permissions: {len(current_permissions)} allowed")
-        if current_permissions:
-            # Group by permission set
-            permission_groups = {}
-            for perm in current_permissions:
-                if perm.startswith("Bash(") and perm.endswith(")"):
-                    prefix = perm.split("(")[1].split(":")[0] if ":" in perm else "misc"
-                    if prefix not in permission_groups:
-                        permission_groups[prefix] = []
-                    permission_groups[prefix].append(perm)
+        if choice == "1":
+            # Add permission set
+            console.print(f"Available permission sets: {', '.join(available_permission_sets)}")
+            options = [SelectOption(value=pset, label=pset) for pset in available_permission_sets]
+            selected_sets = MultiSelectPrompt(
+                "Select permission sets to add",
+                options=options
+            ).ask()
             
-            for group, perms in permission_groups.items():
-                console.print(f"  [bold {COLORS['primary']}]{group}[/bold {COLORS['primary']}]: {len(perms)} permissions")
-        
-        # Permission management menu
-        while True:
-            console.print("\n[bold]Permission Actions:[/bold]")
-            console.print("  1. Add permission set")
-            console.print("  2. Add custom permission")
-            console.print("  3. Remove permissions")
-            console.print("  4. Reset to defaults")
-            console.print("  5. Back to main menu")
+            if selected_sets:
+                # Generate new settings with selected permission sets
+                new_settings = get_settings_sync(permission_sets=selected_sets)
+                merged_settings = merge_settings_sync(current_settings, new_settings)
+                _save_settings(merged_settings, settings_path)
+                success(f"Added permission sets: {', '.join(selected_sets)}")
+                return True
+                
+        elif choice == "2":
+            # Add custom permission
+            custom_perm = Prompt.ask("Enter custom permission (e.g., 'Bash(docker:*)')").strip()
+            if custom_perm in allow_set:
+                warning(f"Permission already allowed: {custom_perm}")
+            elif custom_perm:
+                current_settings.permissions.allow.append(custom_perm)
+                allow_set.add(custom_perm)
+                _save_settings(current_settings, settings_path)
+                success(f"Added custom permission: {custom_perm}")
+                
+        elif choice == "3":
+            # Remove permissions
+            if not allow_set:
+                warning("No permissions to remove")
+                continue
             
-            choice = Prompt.ask("Choose action", choices=["1", "2", "3", "4", "5"], default="5")
+            options = [SelectOption(value=perm, label=perm) for perm in current_settings.permissions.allow]
+            selected_perms = MultiSelectPrompt(
+                "Select permissions to remove",
+                options=options
+            ).ask()
             
-            if choice == "1":
-                # Add permission set
-                console.print(f"Available permission sets: {', '.join(available_permission_sets)}")
-                options = [SelectOption(value=pset, label=pset) for pset in available_permission_sets]
-                selected_sets = MultiSelectPrompt(
-                    "Select permission sets to add",
-                    options=options
-                ).ask()
-                
-                if selected_sets:
-                    # Generate new settings with selected permission sets
-                    new_settings = get_settings_sync(permission_sets=selected_sets)
-                    merged_settings = merge_settings_sync(current_settings, new_settings)
-                    save_settings_sync(merged_settings, settings_path)
-                    success(f"Added permission sets: {', '.join(selected_sets)}")
-                    return True
-                    
-            elif choice == "2":
-                # Add custom permission
-                custom_perm = Prompt.ask("Enter custom permission (e.g., 'Bash(docker:*)')")
-                if custom_perm.strip():
-                    current_settings.permissions.allow.append(custom_perm.strip())
-                    current_settings.permissions.allow = list(set(current_settings.permissions.allow))  # Dedupe
-                    save_settings_sync(current_settings, settings_path)
-                    success(f"Added custom permission: {custom_perm}")
-                    
-            elif choice == "3":
-                # Remove permissions
-                if not current_permissions:
-                    warning("No permissions to remove")
-                    continue
+            if selected_perms:
+                to_remove = set(selected_perms)
+                current_settings.permissions.allow = [
+                    perm for perm in current_settings.permissions.allow
+                    if perm not in to_remove
+                ]
+                allow_set -= to_remove
+                _save_settings(current_settings, settings_path)
+                success(f"Removed {len(selected_perms)} permissions")
                 
-                options = [SelectOption(value=perm, label=perm) for perm in current_permissions]
-                selected_perms = MultiSelectPrompt(
-                    "Select permissions to remove",
-                    options=options
-                ).ask()
+        elif choice == "4":
+            # Reset to defaults
+            if Confirm.ask("Reset permissions to default set?"):
+                default_settings = get_settings_sync()
+                current_settings.permissions = default_settings.permissions
+                allow_set = set(current_settings.permissions.allow)
+                _save_settings(current_settings, settings_path)
+                success("Reset permissions to defaults")
                 
-                if selected_perms:
-                    for perm in selected_perms:
-                        if perm in current_settings.permissions.allow:
-                            current_settings.permissions.allow.remove(perm)
-                    save_settings_sync(current_settings, settings_path)
-                    success(f"Removed {len(selected_perms)} permissions")
-                    
-            elif choice == "4":
-                # Reset to defaults
-                if Confirm.ask("Reset permissions to default set?"):
-                    default_settings = get_settings_sync()
-                    current_settings.permissions = default_settings.permissions
-                    save_settings_sync(current_settings, settings_path)
-                    success("Reset permissions to defaults")
-                    
-            elif choice == "5":
-                break
-        
-        return True
-        
-    except Exception as e:
-        error(f"Failed to manage permissions: {e}")
-        return False
+        elif choice == "5":
+            break
+    
+    return True
 
 
 def show_settings_menu(settings_path: Path) -> None:
     """Show interactive settings management menu."""
+    menu = _render_markup("\n".join((
+        f"\n[bold {COLORS['header']}]Settings Management[/bold {COLORS['header']}]",
+        f"[dim]Configuration: {settings_path}[/dim]\n",
+        _SETTINGS_MENU,
+    )))
+    
     while True:
-        console.print(f"\n[bold {COLORS['header']}]Settings Management[/bold {COLORS['header']}]")
-        console.print(f"[dim]Configuration: {settings_path}[/dim]\n")
-        
-        console.print("[bold]Available Actions:[/bold]")
-        console.print("  1. 📋 View current settings")
-        console.print("  2. 🎨 Manage themes")
-        console.print("  3. 🌍 Manage environment variables")
-        console.print("  4. 🔐 Manage permissions")
-        console.print("  5. 📁 Show settings file location")
-        console.print("  6. ❌ Exit")
+        console.print(menu)
         
         choice = Prompt.ask("Choose action", choices=["1", "2", "3", "4", "5", "6"], default="1")
         
@@ -380,9 +525,11 @@ def show_settings_menu(settings_path: Path) -> None:
             elif choice == "5":
                 console.print(f"\n[bold]Settings File Location:[/bold]")
                 console.print(f"  {settings_path}")
-                if settings_path.exists():
+                # One stat answers both whether the file exists and its size
+                signature = _settings_signature(settings_path)
+                if signature is not None:
                     console.print(f"  [green]✓ File exists[/green]")
-                    console.print(f"  Size: {settings_path.stat().st_size} bytes")
+                    console.print(f"  Size: {signature[1]} bytes")
                 else:
                     console.print(f"  [yellow]⚠ File does not exist[/yellow]")
                     
@@ -435,6 +582,8 @@ def run_settings_command(
         console.print("\n[yellow]Settings management cancelled by user[/yellow]")
         sys.exit(1)
     except Exception as e:
+        from ..ui.styles import create_command_error
+        
         error_panel = create_command_error(
             "settings",
             e,
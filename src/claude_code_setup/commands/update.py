@@ -1,6 +1,7 @@
 """Update command implementation for claude-code-setup."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Set
 
@@ -10,6 +11,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ..core.registry import register_command
+from ..types import Template
 from ..utils.template import get_all_templates_sync, get_template_sync
 from ..utils.template_installer import TemplateInstaller, InstallationResult
 from ..utils.fs import read_template_sync, template_exists_sync, get_default_settings
@@ -21,6 +23,23 @@ from ..ui.styles import create_error_banner, create_panel
 
 console = Console()
 
+# Upper bound on threads used to check installed templates concurrently
+_MAX_UPDATE_WORKERS = 16
+
+
+def _templates_by_name() -> Dict[str, Template]:
+    """Load the template registry once as a name-to-template index.
+    
+    Returns:
+        Dictionary mapping template names to templates, empty if the
+        templates could not be loaded
+    """
+    try:
+        return get_all_templates_sync().templates
+    except Exception as e:
+        error(f"Failed to load templates: {e}")
+        return {}
+
 
 def compare_template_content(
     template_name: str, category: str, target_dir: Path
@@ -68,13 +87,20 @@ def find_installed_templates(target_dir: Path) -> Dict[str, List[str]]:
         Dictionary mapping categories to list of template names
     """
     installed = {}
-    template_registry = get_all_templates_sync()
+    templates = list(get_all_templates_sync().templates.values())
+    if not templates:
+        return installed
     
-    for template in template_registry.templates.values():
-        if template_exists_sync(template.name, template.category.value, str(target_dir)):
-            if template.category.value not in installed:
-                installed[template.category.value] = []
-            installed[template.category.value].append(template.name)
+    target = str(target_dir)
+    # The existence checks are independent stats, so overlap them
+    with ThreadPoolExecutor(max_workers=min(_MAX_UPDATE_WORKERS, len(templates))) as executor:
+        exists = executor.map(
+            lambda template: template_exists_sync(template.name, template.category.value, target),
+            templates,
+        )
+        for template, is_installed in zip(templates, exists):
+            if is_installed:
+                installed.setdefault(template.category.value, []).append(template.name)
             
     return installed
 
@@ -91,14 +117,22 @@ def get_updatable_templates(
     Returns:
         List of tuples (template_name, category, needs_update)
     """
-    updatable = []
-    installed = find_installed_templates(target_dir)
+    updatable: List[Tuple[str, str, bool]] = []
+    installed = [
+        (template_name, category)
+        for category, template_names in find_installed_templates(target_dir).items()
+        for template_name in template_names
+    ]
+    if not installed:
+        return updatable
     
-    for category, template_names in installed.items():
-        for template_name in template_names:
-            needs_update, _, _ = compare_template_content(
-                template_name, category, target_dir
-            )
+    # Each comparison reads one installed file; map keeps the results in order
+    with ThreadPoolExecutor(max_workers=min(_MAX_UPDATE_WORKERS, len(installed))) as executor:
+        comparisons = executor.map(
+            lambda item: compare_template_content(item[0], item[1], target_dir),
+            installed,
+        )
+        for (template_name, category), (needs_update, _, _) in zip(installed, comparisons):
             if needs_update or force:
                 updatable.append((template_name, category, needs_update))
                 
@@ -123,13 +157,14 @@ def update_templates_batch(
         Tuple of (results, errors)
     """
     installer = TemplateInstaller(target_dir, dry_run=dry_run, force=force)
+    templates_by_name = _templates_by_name()
     results = []
     errors = []
     
     for template_name, category in templates:
         try:
             # Get the template
-            template = get_template_sync(template_name)
+            template = templates_by_name.get(template_name)
             if not template:
                 errors.append(f"Template '{template_name}' not found")
                 continue
@@ -235,6 +270,10 @@ def show_update_selection(
         return None
         
     # Parse selected templates
+    category_by_name: Dict[str, str] = {}
+    for name, category, _ in updatable:
+        category_by_name.setdefault(name, category)
+    
     result = []
     for item in selected:
         if item.startswith("  "):
@@ -242,11 +281,9 @@ def show_update_selection(
             parts = item.strip().split(" ", 1)
             if len(parts) == 2:
                 template_name = parts[1]
-                # Find category
-                for name, category, _ in updatable:
-                    if name == template_name:
-                        result.append((template_name, category))
-                        break
+                template_category = category_by_name.get(template_name)
+                if template_category is not None:
+                    result.append((template_name, template_category))
                         
     return result
 
@@ -391,13 +428,14 @@ def update(
     with progress:
         results, errors = [], []
         installer = TemplateInstaller(target_dir, dry_run=dry_run, force=force)
+        templates_by_name = _templates_by_name()
         
         for i, (template_name, category) in enumerate(templates_to_update):
             progress.start_step(i)
             
             try:
                 # Get the template
-                template = get_template_sync(template_name)
+                template = templates_by_name.get(template_name)
                 if not template:
                     errors.append(f"Template '{template_name}' not found")
                     progress.complete_step(i, success=False)
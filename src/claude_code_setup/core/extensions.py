@@ -4,10 +4,16 @@ This module demonstrates how the command registration system can be extended
 to support dynamic loading of external commands and plugins.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from importlib.machinery import ModuleSpec
 from pathlib import Path
+import importlib.abc
 import importlib.util
+import os
 import sys
+from types import CodeType
 
 import click
 from rich.console import Console
@@ -17,6 +23,9 @@ from .loader import CommandLoader
 
 console = Console()
 
+# Upper bound on threads used to read and compile extension files
+_MAX_COMPILE_WORKERS = 8
+
 
 class ExtensionManager:
     """Manages external command extensions and plugins."""
@@ -41,20 +50,63 @@ class ExtensionManager:
         Returns:
             True if extension was loaded successfully
         """
-        try:
-            if not file_path.exists() or not file_path.suffix == '.py':
-                console.print(f"[yellow]Warning: {file_path} is not a valid Python file[/yellow]")
-                return False
+        if not file_path.exists() or not file_path.suffix == '.py':
+            console.print(f"[yellow]Warning: {file_path} is not a valid Python file[/yellow]")
+            return False
+        
+        return self._register_extension(file_path, lambda: self._compile_extension(file_path))
+    
+    @staticmethod
+    def _compile_extension(
+        file_path: Path,
+    ) -> Optional[Tuple[ModuleSpec, Optional[CodeType]]]:
+        """Read and compile an extension file without executing it.
+        
+        This touches no shared state, so files can be compiled concurrently.
+        
+        Args:
+            file_path: Path to the extension Python file
             
+        Returns:
+            Module spec and compiled code, or None if no spec could be created.
+            The code is None when the loader cannot provide it up front.
+        """
+        spec = importlib.util.spec_from_file_location(f"extension_{file_path.stem}", file_path)
+        if spec is None or spec.loader is None:
+            return None
+        if not isinstance(spec.loader, importlib.abc.InspectLoader):
+            return spec, None
+        return spec, spec.loader.get_code(spec.name)
+    
+    def _register_extension(
+        self,
+        file_path: Path,
+        compiled: Callable[[], Optional[Tuple[ModuleSpec, Optional[CodeType]]]],
+    ) -> bool:
+        """Execute a compiled extension and register its commands.
+        
+        Args:
+            file_path: Path to the extension Python file
+            compiled: Returns the compiled extension, raising if compiling failed
+            
+        Returns:
+            True if extension was loaded successfully
+        """
+        try:
             # Load the module
-            spec = importlib.util.spec_from_file_location(f"extension_{file_path.stem}", file_path)
-            if spec is None or spec.loader is None:
+            result = compiled()
+            if result is None:
                 console.print(f"[red]Error: Could not load spec from {file_path}[/red]")
                 return False
             
+            spec, code = result
             module = importlib.util.module_from_spec(spec)
             sys.modules[spec.name] = module
-            spec.loader.exec_module(module)
+            if code is not None:
+                # What the loader's exec_module does, with the compile done up front
+                exec(code, module.__dict__)
+            elif spec.loader is not None:
+                spec.loader.exec_module(module)
             
             # Look for commands and groups in the module
             loaded_count = 0
@@ -114,13 +166,25 @@ class ExtensionManager:
             console.print(f"[yellow]Warning: Extension directory {directory} does not exist[/yellow]")
             return 0
         
+        # One scandir pass; the directory entries already know which are files
+        with os.scandir(directory) as entries:
+            extension_files = sorted(
+                entry.path for entry in entries
+                if fnmatch(entry.name, pattern)
+                and entry.name.endswith('.py')
+                and not entry.name.startswith(('_', '.'))  # Skip private and hidden files
+                and entry.is_file()
+            )
+        
         loaded_count = 0
-        for file_path in directory.glob(pattern):
-            if file_path.stem.startswith('_'):
-                continue  # Skip private files
-            
-            if self.load_extension_from_file(file_path):
-                loaded_count += 1
+        if extension_files:
+            # Reading and compiling overlap; executing and registering stay serial
+            paths = [Path(file_path) for file_path in extension_files]
+            with ThreadPoolExecutor(max_workers=min(_MAX_COMPILE_WORKERS, len(paths))) as executor:
+                futures = [executor.submit(self._compile_extension, path) for path in paths]
+                for path, future in zip(paths, futures):
+                    if self._register_extension(path, future.result):
+                        loaded_count += 1
         
         if loaded_count > 0:
             console.print(f"[green]✓ Loaded {loaded_count} extensions from {directory}[/green]")
@@ -4,12 +4,13 @@ This module handles plugin discovery, validation, loading, and activation
 within the Claude Code Setup plugin system.
 """
 
+import hashlib
+import os
 import shutil
-import tempfile
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List
 
 import yaml
 from pydantic import ValidationError
@@ -36,12 +37,15 @@ class PluginLoader:
     
     def __init__(self, 
                  plugin_dir: Path,
-                 registry: PluginRegistry) -> None:
+                 registry: PluginRegistry,
+                 lazy: bool = False) -> None:
         """Initialize plugin loader.
         
         Args:
             plugin_dir: Base directory for plugins (usually .claude/plugins)
             registry: Plugin registry instance
+            lazy: Defer creating the plugin directories until discovery or
+                installation needs them
         """
         self.plugin_dir = plugin_dir
         self.registry = registry
@@ -51,9 +55,19 @@ class PluginLoader:
         self.installed_dir = plugin_dir / "installed"
         self.temp_dir = plugin_dir / "temp"
         
+        self._directories_ready = False
+        if not lazy:
+            self._ensure_directories()
+    
+    def _ensure_directories(self) -> None:
+        """Create the plugin directory structure if not done already."""
+        if self._directories_ready:
+            return
+        
         ensure_directory(self.repository_dir)
         ensure_directory(self.installed_dir)
         ensure_directory(self.temp_dir)
+        self._directories_ready = True
     
     def discover_repository_plugins(self) -> Dict[str, Plugin]:
         """Discover available plugins from the repository.
@@ -119,6 +133,8 @@ class PluginLoader:
     
     def sync_with_registry(self) -> None:
         """Sync discovered plugins with registry."""
+        self._ensure_directories()
+        
         # Discover all plugins
         repository_plugins = self.discover_repository_plugins()
         installed_plugins = self.discover_installed_plugins()
@@ -146,6 +162,61 @@ class PluginLoader:
             except Exception as e:
                 error(f"Failed to register plugin {plugin.name}: {e}")
     
+    def sync_with_registry_if_changed(self) -> bool:
+        """Sync with the registry only if the plugin directories changed.
+        
+        The registry file persists the result of the last sync together with
+        a fingerprint of the repository and installed directories, so repeated
+        CLI invocations can skip rediscovering every plugin manifest. Set
+        CLAUDE_SETUP_REFRESH_CACHE=1 to force a full sync.
+        
+        Returns:
+            True if a sync was performed, False if the registry was current
+        """
+        self.registry.load()
+        token = self._discovery_fingerprint()
+        
+        if (
+            os.environ.get("CLAUDE_SETUP_REFRESH_CACHE") != "1"
+            and self.registry.sync_token == token
+        ):
+            debug("Plugin registry is up to date, skipping discovery")
+            return False
+        
+        self.sync_with_registry()
+        self.registry.sync_token = token
+        self.registry.save()
+        return True
+    
+    def _discovery_fingerprint(self) -> str:
+        """Fingerprint the files plugin discovery reads.
+        
+        Returns:
+            Hash of the package version and the modification times of the
+            plugin directories and their manifests
+        """
+        from .. import __version__
+        
+        parts = [__version__]
+        for base_dir in (self.repository_dir, self.installed_dir):
+            try:
+                parts.append(f"{base_dir}:{base_dir.stat().st_mtime_ns}")
+                with os.scandir(base_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        parts.append(f"{entry.path}:{entry.stat().st_mtime_ns}")
+                        for name in ("plugin.yaml", ".install.json"):
+                            try:
+                                stat = os.stat(os.path.join(entry.path, name))
+                            except OSError:
+                                continue
+                            parts.append(f"{entry.path}/{name}:{stat.st_mtime_ns}:{stat.st_size}")
+            except OSError:
+                parts.append(f"{base_dir}:missing")
+        
+        return hashlib.sha1("\n".join(sorted(parts)).encode()).hexdigest()
+    
     def install_plugin(self, plugin_name: str) -> Plugin:
         """Install a plugin from the repository.
         
@@ -175,6 +246,7 @@ class PluginLoader:
             )
         
         # Install from repository
+        self._ensure_directories()
         source_path = self.repository_dir / plugin_name
         if not source_path.exists():
             raise PluginLoadError(
@@ -332,6 +404,8 @@ class PluginLoader:
         if not plugin_path.exists():
             raise PluginLoadError(f"Plugin path does not exist: {plugin_path}")
         
+        self._ensure_directories()
+        
         # Extract to temporary directory if zip
         if plugin_path.is_file() and plugin_path.suffix == ".zip":
             temp_extract = self.temp_dir / f"extract_{plugin_path.stem}"
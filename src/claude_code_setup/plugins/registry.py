@@ -4,23 +4,20 @@ This module provides a centralized registry for tracking plugin installations,
 versions, dependencies, and status.
 """
 
-import json
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import ValidationError
 
 from ..exceptions import ClaudeSetupError
 from ..utils.fs import ensure_directory, read_json_file, write_json_file
-from ..utils.logger import debug, error, info, warning
+from ..utils.logger import debug, error, info
 from .types import (
     Plugin,
     PluginBundle,
-    PluginManifest,
     PluginStatus,
-    PluginVersion,
 )
 
 
@@ -43,6 +40,8 @@ class PluginRegistry:
         self._bundles: Dict[str, PluginBundle] = {}
         self._lock = threading.RLock()
         self._loaded = False
+        # Fingerprint of the plugin directories the registry was last synced with
+        self.sync_token: Optional[str] = None
         
         # Ensure registry directory exists
         ensure_directory(registry_path.parent)
@@ -56,6 +55,7 @@ class PluginRegistry:
             if self.registry_path.exists():
                 try:
                     data = read_json_file(self.registry_path)
+                    self.sync_token = data.get("sync_token")
                     
                     # Load plugins
                     for plugin_data in data.get("plugins", []):
@@ -80,6 +80,7 @@ class PluginRegistry:
                     # Start with empty registry on error
                     self._plugins = {}
                     self._bundles = {}
+                    self.sync_token = None
             
             self._loaded = True
     
@@ -89,6 +90,7 @@ class PluginRegistry:
             data = {
                 "version": "1.0.0",
                 "updated": datetime.utcnow().isoformat(),
+                "sync_token": self.sync_token,
                 "plugins": [
                     plugin.model_dump(mode="json")
                     for plugin in self._plugins.values()
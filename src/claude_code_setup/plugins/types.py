@@ -6,7 +6,7 @@ including plugin manifests, capabilities, dependencies, and bundles.
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -422,11 +422,17 @@ class HookInstaller:
         
         return errors
     
-    def uninstall_hook(self, hook_name: str) -> HookInstallationResult:
+    def uninstall_hook(
+        self,
+        hook_name: str,
+        path_hint: Optional[Path] = None,
+    ) -> HookInstallationResult:
         """Uninstall a hook.
         
         Args:
             hook_name: Name of hook to uninstall
+            path_hint: Known installation directory of the hook, which skips
+                the search through the category directories
             
         Returns:
             HookInstallationResult with uninstallation details
@@ -436,14 +442,18 @@ class HookInstaller:
             hook_found = False
             hook_install_dir = None
             
-            # Check each category directory
-            for category_dir in self.hooks_dir.iterdir():
-                if category_dir.is_dir():
-                    potential_hook_dir = category_dir / hook_name
-                    if potential_hook_dir.exists():
-                        hook_install_dir = potential_hook_dir
-                        hook_found = True
-                        break
+            if path_hint is not None and path_hint.is_dir():
+                hook_install_dir = path_hint
+                hook_found = True
+            else:
+                # Check each category directory
+                for category_dir in self.hooks_dir.iterdir():
+                    if category_dir.is_dir():
+                        potential_hook_dir = category_dir / hook_name
+                        if potential_hook_dir.exists():
+                            hook_install_dir = potential_hook_dir
+                            hook_found = True
+                            break
             
             if not hook_found:
                 return HookInstallationResult(
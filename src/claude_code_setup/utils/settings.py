@@ -6,8 +6,12 @@ bundled settings files and Pydantic models for validation.
 """
 
 import json
+import os
+import shutil
+import tempfile
+from functools import cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 try:
     # Python 3.9+
@@ -355,9 +359,7 @@ async def read_settings(settings_path: Optional[Path] = None) -> Optional[Claude
     
     try:
         if settings_path.exists():
-            content = settings_path.read_text(encoding='utf-8')
-            data = json.loads(content)
-            return ClaudeSettings(**data)
+            return ClaudeSettings.model_validate_json(settings_path.read_bytes())
         
         return None
         
@@ -380,9 +382,7 @@ def read_settings_sync(settings_path: Optional[Path] = None) -> Optional[ClaudeS
     
     try:
         if settings_path.exists():
-            content = settings_path.read_text(encoding='utf-8')
-            data = json.loads(content)
-            return ClaudeSettings(**data)
+            return ClaudeSettings.model_validate_json(settings_path.read_bytes())
         
         return None
         
@@ -519,6 +519,31 @@ def merge_settings_sync(
     return ClaudeSettings(**merged)
 
 
+def _write_atomically(path: Path, content: str) -> None:
+    """Write a text file by swapping in a fully written temporary file.
+    
+    A crash or failed write leaves the previous file in place instead of a
+    truncated one. Symlinks are followed so the link target is updated, and
+    an existing file keeps its permission bits.
+    
+    Args:
+        path: File to write
+        content: Text content to write
+    """
+    target = path.resolve()
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+            tmp_file.write(content)
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 async def save_settings(
     settings: ClaudeSettings,
     settings_path: Optional[Path] = None
@@ -539,10 +564,8 @@ async def save_settings(
         # Create directory if it doesn't exist
         settings_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convert to dictionary and save as JSON
-        settings_dict = settings.model_dump()
-        content = json.dumps(settings_dict, indent=2, ensure_ascii=False)
-        settings_path.write_text(content, encoding='utf-8')
+        # Serialize straight to JSON without an intermediate dictionary
+        _write_atomically(settings_path, settings.model_dump_json(indent=2))
         
     except Exception as error:
         log_error(f"Error saving settings to {settings_path}: {error}")
@@ -569,10 +592,8 @@ def save_settings_sync(
         # Create directory if it doesn't exist
         settings_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convert to dictionary and save as JSON
-        settings_dict = settings.model_dump()
-        content = json.dumps(settings_dict, indent=2, ensure_ascii=False)
-        settings_path.write_text(content, encoding='utf-8')
+        # Serialize straight to JSON without an intermediate dictionary
+        _write_atomically(settings_path, settings.model_dump_json(indent=2))
         
     except Exception as error:
         log_error(f"Error saving settings to {settings_path}: {error}")
@@ -604,6 +625,31 @@ async def get_available_themes() -> list[str]:
         return []
 
 
+@cache
+def _bundled_settings_names(subdirectory: str) -> Tuple[str, ...]:
+    """List the JSON settings files bundled in a package settings subdirectory.
+    
+    The bundled settings never change while the process runs, so the sorted
+    names are cached after the first lookup.
+    
+    Args:
+        subdirectory: Name of the directory under settings/ (e.g. "themes")
+        
+    Returns:
+        Sorted tuple of file names without the .json extension
+    """
+    package_dir = files("claude_code_setup") / "settings" / subdirectory
+    
+    if not package_dir.is_dir():
+        return ()
+    
+    return tuple(sorted(
+        entry.name.replace('.json', '')
+        for entry in package_dir.iterdir()
+        if entry.name.endswith('.json')
+    ))
+
+
 def get_available_themes_sync() -> list[str]:
     """Synchronous version of get_available_themes.
     
@@ -611,18 +657,7 @@ def get_available_themes_sync() -> list[str]:
         List of available theme names
     """
     try:
-        themes_package = files("claude_code_setup") / "settings" / "themes"
-        
-        if not themes_package.is_dir():
-            return []
-        
-        theme_names = [
-            theme_file.name.replace('.json', '')
-            for theme_file in themes_package.iterdir()
-            if theme_file.name.endswith('.json')
-        ]
-        
-        return sorted(theme_names)
+        return list(_bundled_settings_names("themes"))
         
     except Exception as error:
         log_error(f"Error loading available themes: {error}")
@@ -661,18 +696,7 @@ def get_available_permission_sets_sync() -> list[str]:
         List of available permission set names  
     """
     try:
-        permissions_package = files("claude_code_setup") / "settings" / "permissions"
-        
-        if not permissions_package.is_dir():
-            return []
-        
-        permission_set_names = [
-            perm_file.name.replace('.json', '')
-            for perm_file in permissions_package.iterdir()
-            if perm_file.name.endswith('.json')
-        ]
-        
-        return sorted(permission_set_names)
+        return list(_bundled_settings_names("permissions"))
         
     except Exception as error:
         log_error(f"Error loading available permission sets: {error}")
@@ -5,6 +5,7 @@ converted from TypeScript template.ts. Uses importlib.resources to access
 bundled templates in the Python package.
 """
 
+import os
 import re
 import time
 from pathlib import Path
@@ -29,6 +30,7 @@ from ..types import Template, TemplateCategory, TemplateRegistry
 _template_registry: Optional[TemplateRegistry] = None
 _cache_timestamp: float = 0
 _cache_ttl: int = 300  # 5 minutes cache TTL
+_cache_mtime_token: Optional[Tuple[int, ...]] = None
 _cache_lock = Lock()
 
 
@@ -270,13 +272,60 @@ def load_templates_from_files_sync() -> TemplateRegistry:
         raise TemplateLoadError(f"Failed to load templates: {e}")
 
 
+def _templates_mtime_token() -> Optional[Tuple[int, ...]]:
+    """Build a modification token for the packaged template files.
+    
+    Returns:
+        Tuple of mtimes for the templates directory, its category
+        directories and their files, or None if they cannot be stat'ed
+    """
+    try:
+        templates_dir = get_templates_directory()
+        token = [os.stat(templates_dir).st_mtime_ns]
+        
+        with os.scandir(templates_dir) as categories:
+            category_dirs = sorted(
+                (entry for entry in categories if entry.is_dir()),
+                key=lambda entry: entry.name,
+            )
+        
+        for category_dir in category_dirs:
+            token.append(category_dir.stat().st_mtime_ns)
+            with os.scandir(category_dir.path) as template_files:
+                token.extend(sorted(
+                    entry.stat().st_mtime_ns for entry in template_files
+                ))
+        
+        return tuple(token)
+    except (ImportError, OSError):
+        return None
+
+
 def _is_cache_valid() -> bool:
-    """Check if the template cache is still valid."""
+    """Check if the template cache is still valid.
+    
+    Once the TTL has passed, the cached registry is kept (and its TTL
+    renewed) as long as the template files are unchanged on disk, so
+    long-running sessions don't rescan and reparse identical templates.
+    """
+    global _cache_timestamp
+    
     if _template_registry is None:
         return False
     
     cache_age = time.time() - _cache_timestamp
-    return cache_age < _cache_ttl
+    if cache_age < _cache_ttl:
+        return True
+    
+    if (
+        _cache_ttl > 0
+        and _cache_mtime_token is not None
+        and _templates_mtime_token() == _cache_mtime_token
+    ):
+        _cache_timestamp = time.time()
+        return True
+    
+    return False
 
 
 async def get_all_templates(force_reload: bool = False) -> TemplateRegistry:
@@ -288,7 +337,7 @@ async def get_all_templates(force_reload: bool = False) -> TemplateRegistry:
     Returns:
         TemplateRegistry containing all templates
     """
-    global _template_registry, _cache_timestamp
+    global _template_registry, _cache_timestamp, _cache_mtime_token
     
     with _cache_lock:
         if not force_reload and _is_cache_valid():
@@ -298,6 +347,7 @@ async def get_all_templates(force_reload: bool = False) -> TemplateRegistry:
         
         from .logger import debug
         debug("Loading template registry from files")
+        _cache_mtime_token = _templates_mtime_token()
         _template_registry = await load_templates_from_files()
         _cache_timestamp = time.time()
         
@@ -313,7 +363,7 @@ def get_all_templates_sync(force_reload: bool = False) -> TemplateRegistry:
     Returns:
         TemplateRegistry containing all templates
     """
-    global _template_registry, _cache_timestamp
+    global _template_registry, _cache_timestamp, _cache_mtime_token
     
     with _cache_lock:
         if not force_reload and _is_cache_valid():
@@ -323,6 +373,7 @@ def get_all_templates_sync(force_reload: bool = False) -> TemplateRegistry:
         
         from .logger import debug
         debug("Loading template registry from files")
+        _cache_mtime_token = _templates_mtime_token()
         _template_registry = load_templates_from_files_sync()
         _cache_timestamp = time.time()
         
@@ -578,10 +629,11 @@ def clear_template_cache() -> None:
     
     Useful for testing or when templates are updated.
     """
-    global _template_registry, _cache_timestamp
+    global _template_registry, _cache_timestamp, _cache_mtime_token
     with _cache_lock:
         _template_registry = None
         _cache_timestamp = 0
+        _cache_mtime_token = None
         _category_string_to_enum.cache_clear()
         from .logger import debug
         debug("Template cache cleared")
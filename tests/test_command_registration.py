@@ -294,4 +294,79 @@ class TestIntegration:
         assert isinstance(info['registered_commands'], int)
         assert isinstance(info['registered_groups'], int)
         assert isinstance(info['commands'], list)
-        assert isinstance(info['groups'], list)
\ No newline at end of file
+        assert isinstance(info['groups'], list)
+
+
+EXTENSION_SOURCE = '''
+import click
+
+
+@click.command(name="{name}")
+def {name}_command():
+    """Say hello."""
+'''
+
+
+class TestExtensionManager:
+    """Test loading extensions from files and directories."""
+    
+    def _create_manager(self):
+        """Create an extension manager with a fresh registry."""
+        from claude_code_setup.core.extensions import ExtensionManager
+        
+        registry = CommandRegistry()
+        return ExtensionManager(registry, CommandLoader(registry))
+    
+    def test_load_extensions_from_directory_skips_non_extensions(self, tmp_path):
+        """Test only public Python files are loaded from a directory."""
+        (tmp_path / "hello.py").write_text(EXTENSION_SOURCE.format(name="hello"))
+        (tmp_path / "_private.py").write_text(EXTENSION_SOURCE.format(name="private"))
+        (tmp_path / ".hidden.py").write_text(EXTENSION_SOURCE.format(name="hidden"))
+        (tmp_path / "notes.txt").write_text("not an extension")
+        (tmp_path / "package.py").mkdir()
+        manager = self._create_manager()
+        
+        assert manager.load_extensions_from_directory(tmp_path) == 1
+        assert manager.registry.list_commands() == ["hello"]
+        assert manager.get_extension_info()['extension_files'] == [str(tmp_path / "hello.py")]
+    
+    def test_load_extension_from_missing_file(self, tmp_path):
+        """Test a missing extension file is rejected."""
+        manager = self._create_manager()
+        
+        assert manager.load_extension_from_file(tmp_path / "missing.py") is False
+    
+    def test_load_extensions_from_directory_reports_broken_files(self, tmp_path):
+        """Test a file that fails to compile does not stop the others loading."""
+        (tmp_path / "alpha.py").write_text(EXTENSION_SOURCE.format(name="alpha"))
+        (tmp_path / "broken.py").write_text("def broken(:\n")
+        (tmp_path / "gamma.py").write_text(EXTENSION_SOURCE.format(name="gamma"))
+        manager = self._create_manager()
+        
+        assert manager.load_extensions_from_directory(tmp_path) == 2
+        assert sorted(manager.registry.list_commands()) == ["alpha", "gamma"]
+        assert manager.get_extension_info()['extension_files'] == [
+            str(tmp_path / "alpha.py"),
+            str(tmp_path / "gamma.py"),
+        ]
+    
+    def test_load_extension_with_non_inspect_loader(self, tmp_path):
+        """Test a loader without get_code still executes through exec_module."""
+        import importlib.abc
+        from importlib.machinery import ModuleSpec
+        
+        class CommandLoaderStub(importlib.abc.Loader):
+            def exec_module(self, module):
+                exec(EXTENSION_SOURCE.format(name="stub"), module.__dict__)
+        
+        file_path = tmp_path / "stub.py"
+        file_path.write_text("")
+        manager = self._create_manager()
+        
+        with patch(
+            "claude_code_setup.core.extensions.importlib.util.spec_from_file_location",
+            return_value=ModuleSpec("extension_stub", CommandLoaderStub()),
+        ):
+            assert manager.load_extension_from_file(file_path) is True
+        
+        assert manager.registry.list_commands() == ["stub"]
@@ -313,6 +313,23 @@ class TestHookInstaller:
         assert "successfully" in result.message.lower()
         assert not hook_dir.exists()
         
+    def test_uninstall_hook_with_path_hint(self, temp_claude_dir, mock_hook):
+        """Test uninstalling a hook from a known directory skips the search."""
+        installer = HookInstaller(target_dir=temp_claude_dir)
+        
+        with patch('claude_code_setup.utils.hook_installer.get_hook_sync') as mock_get:
+            mock_get.return_value = mock_hook
+            installer.install_hook("test-hook")
+        
+        hook_dir = temp_claude_dir / "hooks" / "testing" / "test-hook"
+        
+        with patch.object(Path, "iterdir") as mock_iterdir:
+            result = installer.uninstall_hook("test-hook", path_hint=hook_dir)
+            mock_iterdir.assert_not_called()
+        
+        assert result.success
+        assert not hook_dir.exists()
+        
     def test_uninstall_hook_not_found(self, temp_claude_dir):
         """Test uninstalling a hook that doesn't exist."""
         installer = HookInstaller(target_dir=temp_claude_dir)
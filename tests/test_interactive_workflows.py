@@ -14,6 +14,9 @@ from claude_code_setup.commands.interactive import (
     search_templates_interactive,
     preview_template_interactive,
     create_configuration_summary,
+    build_template_index,
+    run_interactive_mode,
+    _digit_range_validator,
 )
 from claude_code_setup.utils.dependency_validator import DependencyValidator
 from claude_code_setup.utils.template_validator import TemplateValidator, ValidationSeverity
@@ -84,6 +87,70 @@ class TestInteractiveMenus:
             
             assert result == "change-theme"
 
+    def test_run_interactive_mode_dispatches_actions(self, tmp_path):
+        """Test main and settings menu selections reach their handlers."""
+        with patch("claude_code_setup.commands.interactive.show_main_menu") as mock_menu, \
+             patch("claude_code_setup.commands.interactive.settings_configuration_menu") as mock_settings, \
+             patch("claude_code_setup.commands.interactive.warning") as mock_warning:
+            mock_menu.side_effect = ["manage-hooks", "configure-settings", None]
+            mock_settings.side_effect = ["reset-settings", "main-menu"]
+            
+            run_interactive_mode(MagicMock(), tmp_path)
+            
+            assert mock_menu.call_count == 3
+            assert mock_settings.call_count == 2
+            assert mock_warning.call_count == 2
+
+    def test_run_interactive_mode_removes_templates(self, tmp_path):
+        """Test the remove templates action invokes the remove command."""
+        from claude_code_setup.commands.remove import remove
+        
+        ctx = MagicMock()
+        with patch("claude_code_setup.commands.interactive.show_main_menu") as mock_menu, \
+             patch("claude_code_setup.commands.interactive.template_management_menu") as mock_templates:
+            mock_menu.side_effect = ["manage-templates", None]
+            mock_templates.side_effect = ["remove-templates", "main-menu"]
+        
+            run_interactive_mode(ctx, tmp_path)
+        
+        ctx.invoke.assert_called_once_with(
+            remove,
+            items=(),
+            type="template",
+            all=False,
+            permission=None,
+            test_dir=tmp_path,
+            dry_run=False,
+            force=False,
+        )
+
+    def test_run_interactive_mode_command_actions(self, tmp_path):
+        """Test menu actions call the command entry points with their signatures."""
+        with patch("claude_code_setup.commands.interactive.show_main_menu") as mock_menu, \
+             patch("claude_code_setup.commands.interactive.template_management_menu") as mock_templates, \
+             patch("claude_code_setup.commands.init.run_init_command", autospec=True) as mock_init, \
+             patch("claude_code_setup.commands.add.run_add_command", autospec=True) as mock_add, \
+             patch("claude_code_setup.commands.list.run_list_command", autospec=True) as mock_list:
+            mock_menu.side_effect = ["quick-setup", "manage-templates", "view-config", None]
+            mock_templates.side_effect = ["add-templates", "main-menu"]
+        
+            run_interactive_mode(MagicMock(), tmp_path)
+        
+        assert mock_init.call_args.kwargs["test_dir"] == str(tmp_path)
+        assert mock_init.call_args.kwargs["quick"] is True
+        assert mock_add.call_args.kwargs["type_arg"] == "template"
+        assert mock_add.call_args.kwargs["test_dir"] == str(tmp_path)
+        assert mock_list.call_args.kwargs["interactive"] is False
+
+    def test_digit_range_validator(self):
+        """Test menu choice validation."""
+        validate = _digit_range_validator(1, 6)
+        
+        assert validate("1") == (True, None)
+        assert validate("6") == (True, None)
+        assert validate("7") == (False, "Please enter a number between 1-6")
+        assert validate("abc") == (False, "Please enter a number between 1-6")
+
 
 class TestSearchAndPreview:
     """Test search and preview functionality."""
@@ -108,6 +175,34 @@ class TestSearchAndPreview:
             
             assert result is None
             
+    def test_search_templates_casefold_match(self):
+        """Test search matching is Unicode case-insensitive."""
+        templates = [
+            Template(
+                name="strasse",
+                content="# Test",
+                category="general",
+                description="Straße helpers",
+            ),
+        ]
+        with patch("claude_code_setup.commands.interactive.ValidatedPrompt") as mock_prompt:
+            with patch("claude_code_setup.commands.interactive.MultiSelectPrompt") as mock_select:
+                mock_prompt.return_value.ask.return_value = "STRASSE HELP"
+                mock_select.return_value.ask.return_value = ["  strasse - Straße helpers"]
+                
+                result = search_templates_interactive(templates)
+                
+                assert result == ["strasse"]
+            
+    def test_search_templates_query_longer_than_fields(self, mock_templates):
+        """Test a query longer than any template field matches nothing."""
+        with patch("claude_code_setup.commands.interactive.ValidatedPrompt") as mock_prompt:
+            mock_prompt.return_value.ask.return_value = "x" * 200
+            
+            result = search_templates_interactive(mock_templates)
+            
+            assert result is None
+            
     def test_preview_template_interactive(self, mock_templates):
         """Test interactive template preview."""
         with patch("claude_code_setup.commands.interactive.ValidatedPrompt") as mock_prompt:
@@ -118,6 +213,14 @@ class TestSearchAndPreview:
                 result = preview_template_interactive(mock_templates)
                 
                 assert result is True  # Continue browsing
+
+    def test_build_template_index(self, mock_templates):
+        """Test templates are presorted and grouped by category."""
+        index = build_template_index(mock_templates)
+        
+        assert [t.name for t in index.sorted_templates] == ["node-app", "python-script"]
+        assert list(index.by_category) == ["node", "python"]
+        assert index.by_category["python"] == [mock_templates[0]]
                 
 
 class TestDependencyValidation:
@@ -230,6 +333,21 @@ class TestEnhancedValidation:
         assert panel is not None
         assert isinstance(panel.renderable, str)
 
+    def test_configuration_summary_cached_until_change(self, tmp_path):
+        """Test the summary panel is reused until templates change on disk."""
+        claude_dir = tmp_path / ".claude"
+        general_dir = claude_dir / "commands" / "general"
+        general_dir.mkdir(parents=True)
+        
+        first = create_configuration_summary(claude_dir)
+        assert create_configuration_summary(claude_dir) is first
+        
+        (general_dir / "test.md").write_text("# Test")
+        
+        updated = create_configuration_summary(claude_dir)
+        assert updated is not first
+        assert "1 installed" in updated.renderable
+
 
 class TestCLIInteractiveCommand:
     """Test the CLI interactive command."""
@@ -13,6 +13,7 @@ from claude_code_setup.commands.list import (
     show_templates,
     show_hooks,
     show_settings,
+    show_all_resources,
 )
 from claude_code_setup.utils import CLAUDE_HOME
 
@@ -188,6 +189,19 @@ class TestListCommand:
                 # Should show settings table and current status
                 mock_console.print.assert_called()
 
+    @patch('claude_code_setup.commands.list.console')
+    def test_show_all_resources_single_render(self, mock_console):
+        """Test the resources overview is rendered in a single print."""
+        with patch('claude_code_setup.commands.list.get_available_themes_sync') as mock_themes, \
+             patch('claude_code_setup.commands.list.get_available_permission_sets_sync') as mock_perms:
+            
+            mock_themes.return_value = ["default"]
+            mock_perms.return_value = ["python"]
+            
+            show_all_resources()
+            
+            mock_console.print.assert_called_once()
+
     def test_run_list_command_templates(self):
         """Test running list command for templates."""
         with patch('claude_code_setup.commands.list.show_templates') as mock_show:
@@ -0,0 +1,90 @@
+"""Test plugin loader registry syncing."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from claude_code_setup.plugins.registry import PluginRegistry
+from claude_code_setup.plugins.loader import PluginLoader
+
+
+def create_test_plugin(plugin_dir: Path, plugin_name: str):
+    """Create a minimal test plugin."""
+    plugin_dir.mkdir(parents=True, exist_ok=True)
+    
+    manifest = {
+        "metadata": {
+            "name": plugin_name,
+            "display_name": f"Test {plugin_name}",
+            "description": f"Test plugin {plugin_name}",
+            "version": "1.0.0",
+            "author": "Test Author",
+            "category": "testing"
+        },
+        "provides": {},
+        "dependencies": []
+    }
+    
+    with open(plugin_dir / "plugin.yaml", "w") as f:
+        yaml.dump(manifest, f)
+
+
+def create_loader(plugins_dir: Path) -> PluginLoader:
+    """Create a loader backed by a fresh registry instance."""
+    registry = PluginRegistry(plugins_dir / "registry.json")
+    return PluginLoader(plugins_dir, registry)
+
+
+def test_sync_if_changed_skips_unchanged_directories(tmp_path):
+    """Test a second invocation reuses the persisted registry."""
+    plugins_dir = tmp_path / "plugins"
+    create_test_plugin(plugins_dir / "repository" / "test-plugin", "test-plugin")
+    
+    assert create_loader(plugins_dir).sync_with_registry_if_changed() is True
+    
+    loader = create_loader(plugins_dir)
+    with patch.object(loader, "sync_with_registry") as mock_sync:
+        assert loader.sync_with_registry_if_changed() is False
+        mock_sync.assert_not_called()
+    
+    assert loader.registry.get_plugin("test-plugin") is not None
+
+
+def test_sync_if_changed_detects_new_plugin(tmp_path):
+    """Test adding a plugin to the repository triggers a new sync."""
+    plugins_dir = tmp_path / "plugins"
+    create_test_plugin(plugins_dir / "repository" / "first-plugin", "first-plugin")
+    create_loader(plugins_dir).sync_with_registry_if_changed()
+    
+    create_test_plugin(plugins_dir / "repository" / "second-plugin", "second-plugin")
+    
+    loader = create_loader(plugins_dir)
+    assert loader.sync_with_registry_if_changed() is True
+    assert loader.registry.get_plugin("second-plugin") is not None
+
+
+def test_sync_if_changed_refresh_env_forces_sync(tmp_path, monkeypatch):
+    """Test CLAUDE_SETUP_REFRESH_CACHE forces a full sync."""
+    plugins_dir = tmp_path / "plugins"
+    create_test_plugin(plugins_dir / "repository" / "test-plugin", "test-plugin")
+    create_loader(plugins_dir).sync_with_registry_if_changed()
+    
+    monkeypatch.setenv("CLAUDE_SETUP_REFRESH_CACHE", "1")
+    
+    assert create_loader(plugins_dir).sync_with_registry_if_changed() is True
+
+
+def test_lazy_loader_creates_directories_on_sync(tmp_path):
+    """Test a lazy loader defers creating directories until discovery."""
+    plugins_dir = tmp_path / "plugins"
+    registry = PluginRegistry(plugins_dir / "registry.json")
+    loader = PluginLoader(plugins_dir, registry, lazy=True)
+    
+    assert not loader.installed_dir.exists()
+    
+    loader.sync_with_registry()
+    
+    assert loader.repository_dir.is_dir()
+    assert loader.installed_dir.is_dir()
+    assert loader.temp_dir.is_dir()
@@ -0,0 +1,177 @@
+"""Tests for plugins command functionality."""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from claude_code_setup.cli import cli
+from claude_code_setup.plugins.types import (
+    Plugin,
+    PluginCapabilities,
+    PluginManifest,
+    PluginStatus,
+)
+from claude_code_setup.commands.plugins import (
+    _bucket_by_status,
+    _capability_items,
+    _render_provides,
+    _with_cancel,
+    _get_loader,
+    _get_registry,
+    plugins_group,
+)
+
+
+def make_plugin(name: str, status: PluginStatus) -> Plugin:
+    """Create a plugin with a minimal manifest."""
+    manifest = PluginManifest(
+        metadata={
+            "name": name,
+            "display_name": name,
+            "version": "1.0.0",
+            "description": "Test plugin",
+            "author": "Test Author",
+            "category": "development"
+        }
+    )
+    return Plugin(name=name, manifest=manifest, status=status)
+
+
+@pytest.fixture
+def runner():
+    """Create a CLI test runner."""
+    return CliRunner()
+
+
+class TestPluginsCommand:
+    """Test plugins command functionality."""
+
+    def test_plugins_list_with_test_dir(self, runner, tmp_path):
+        """Test the top-level plugins list command runs against a test dir."""
+        result = runner.invoke(
+            cli,
+            ["plugins", "list", "--test-dir", str(tmp_path), "--no-interactive"],
+        )
+        
+        assert result.exit_code == 0
+        assert "No all plugins found" in result.output
+        assert (tmp_path / ".claude" / "plugins" / "registry.json").exists()
+
+    def test_plugins_list_installed_skips_discovery(self, runner, tmp_path):
+        """Test listing installed plugins reads the registry without a sync."""
+        with patch(
+            "claude_code_setup.plugins.loader.PluginLoader.sync_with_registry_if_changed"
+        ) as mock_sync:
+            result = runner.invoke(
+                cli,
+                [
+                    "plugins", "list", "--status", "installed",
+                    "--test-dir", str(tmp_path), "--no-interactive",
+                ],
+            )
+        
+        assert result.exit_code == 0
+        assert "No installed plugins found" in result.output
+        mock_sync.assert_not_called()
+
+    def test_batch_add_requires_plugin_name(self, runner, tmp_path):
+        """Test batch mode fails instead of prompting for a plugin."""
+        result = runner.invoke(
+            plugins_group,
+            ["--test-dir", str(tmp_path), "--batch", "add"],
+        )
+        
+        assert result.exit_code == 1
+        assert "required in batch mode" in result.output
+
+    def test_batch_mode_from_environment(self, runner, tmp_path):
+        """Test CLAUDE_SETUP_BATCH enables batch mode for remove."""
+        result = runner.invoke(
+            plugins_group,
+            ["--test-dir", str(tmp_path), "remove"],
+            env={"CLAUDE_SETUP_BATCH": "1"},
+        )
+        
+        assert result.exit_code == 1
+        assert "required in batch mode" in result.output
+
+    def test_top_level_batch_flag(self, runner, tmp_path):
+        """Test --batch on the top-level plugins group reaches subcommands."""
+        result = runner.invoke(
+            cli,
+            ["plugins", "--batch", "add", "--test-dir", str(tmp_path)],
+        )
+        
+        assert result.exit_code == 1
+        assert "required in batch mode" in result.output
+
+    def test_plugins_info_unknown_plugin(self, runner, tmp_path):
+        """Test plugin info exits with an error for an unknown plugin."""
+        result = runner.invoke(
+            cli,
+            ["plugins", "info", "missing-plugin", "--test-dir", str(tmp_path)],
+        )
+        
+        assert result.exit_code == 1
+        assert "missing-plugin not found" in result.output
+
+    def test_activate_does_not_create_plugin_tree(self, runner, tmp_path):
+        """Test activation fails cleanly without creating plugin directories."""
+        result = runner.invoke(
+            plugins_group,
+            ["--test-dir", str(tmp_path), "activate", "missing-plugin"],
+        )
+        
+        assert result.exit_code == 1
+        assert "missing-plugin not found" in result.output
+        assert not (tmp_path / ".claude" / "plugins" / "repository").exists()
+
+    def test_registry_and_loader_shared_in_context(self, tmp_path):
+        """Test subcommands reuse one registry and loader per context."""
+        ctx = plugins_group.make_context("plugins", ["--test-dir", str(tmp_path)])
+        with ctx:
+            ctx.invoke(plugins_group.callback, **ctx.params)
+            
+            registry = _get_registry(ctx)
+            loader = _get_loader(ctx)
+            
+            assert _get_registry(ctx) is registry
+            assert _get_loader(ctx) is loader
+            assert loader.registry is registry
+
+    def test_bucket_by_status(self):
+        """Test plugins are grouped by status with every bucket present."""
+        plugins = {
+            "one": make_plugin("one", PluginStatus.AVAILABLE),
+            "two": make_plugin("two", PluginStatus.ACTIVE),
+            "three": make_plugin("three", PluginStatus.AVAILABLE),
+        }
+        
+        buckets = _bucket_by_status(plugins)
+        
+        assert set(buckets) == set(PluginStatus)
+        assert list(buckets[PluginStatus.AVAILABLE]) == ["one", "three"]
+        assert list(buckets[PluginStatus.ACTIVE]) == ["two"]
+        assert buckets[PluginStatus.DISABLED] == {}
+
+    def test_capability_items_skips_empty_fields(self):
+        """Test only provided capabilities are listed, in display order."""
+        caps = PluginCapabilities(commands=["deploy"], templates=["a", "b"])
+        
+        assert _capability_items(caps) == [
+            ("templates", ["a", "b"]),
+            ("commands", ["deploy"]),
+        ]
+
+    def test_render_provides(self):
+        """Test capabilities are rendered as indented labelled lines."""
+        caps = PluginCapabilities(hooks=["guard"], agents=["a1", "a2"])
+        
+        assert _render_provides(caps) == ["  Hooks: guard", "  Agents: a1, a2"]
+
+    def test_with_cancel_appends_cancel(self):
+        """Test picker choices keep plugin order and end with Cancel."""
+        plugins = {"one": None, "two": None}
+        
+        assert _with_cancel(plugins) == ["one", "two", "Cancel"]
@@ -9,10 +9,15 @@ from click.testing import CliRunner
 
 from claude_code_setup.cli import cli
 from claude_code_setup.commands.remove import (
+    find_installed_hooks_for_removal,
     find_installed_templates_for_removal,
+    handle_hook_removal,
+    perform_template_removal,
     remove_template_file,
     remove_templates_batch,
     remove_permission_from_settings,
+    show_removal_selection,
+    show_removal_summary,
 )
 from claude_code_setup.types import ClaudeSettings
 
@@ -68,6 +73,74 @@ class TestRemoveCommand:
         assert "general" in categories
         assert "python" in categories
     
+    def test_find_installed_templates_skips_non_templates(self, setup_templates_for_removal):
+        """Test only markdown files inside category directories are returned."""
+        commands_dir = setup_templates_for_removal / "commands"
+        (commands_dir / "README.md").write_text("# Not in a category")
+        (commands_dir / "general" / "notes.txt").write_text("notes")
+        (commands_dir / "general" / "drafts.md").mkdir()
+        
+        installed = find_installed_templates_for_removal(setup_templates_for_removal)
+        
+        assert sorted(name for name, _, _ in installed) == [
+            "code-review", "fix-issue", "optimization"
+        ]
+        for name, category, path in installed:
+            assert path == commands_dir / category / f"{name}.md"
+    
+    def test_find_installed_hooks_for_removal(self, tmp_path):
+        """Test only hook directories with metadata.json are returned."""
+        security_dir = tmp_path / "hooks" / "security"
+        (security_dir / "validate-command").mkdir(parents=True)
+        (security_dir / "validate-command" / "metadata.json").write_text("{}")
+        (security_dir / "incomplete-hook").mkdir()
+        (security_dir / "stray.json").write_text("{}")
+        
+        installed = find_installed_hooks_for_removal(tmp_path)
+        
+        assert installed == [
+            ("validate-command", "security", security_dir / "validate-command")
+        ]
+    
+    def test_show_removal_selection_groups_by_category(self, setup_templates_for_removal):
+        """Test selection choices are grouped under sorted category headers."""
+        installed = find_installed_templates_for_removal(setup_templates_for_removal)
+        
+        with patch("claude_code_setup.ui.prompts.MultiSelectPrompt") as mock_prompt:
+            mock_prompt.return_value.ask.return_value = [
+                "[dim]GENERAL[/dim]", "  fix-issue", "  optimization"
+            ]
+            selected = show_removal_selection(installed)
+        
+        assert mock_prompt.call_args.kwargs["choices"] == [
+            "[dim]GENERAL[/dim]",
+            "  code-review",
+            "  fix-issue",
+            "[dim]PYTHON[/dim]",
+            "  optimization",
+        ]
+        assert [(name, category) for name, category, _ in selected] == [
+            ("fix-issue", "general"),
+            ("optimization", "python"),
+        ]
+    
+    def test_handle_hook_removal_reports_missing_hooks(self, tmp_path):
+        """Test hook removal reports unknown names and removes the rest."""
+        hook_path = tmp_path / "hooks" / "security" / "validate-command"
+        installed = [("validate-command", "security", hook_path)]
+        
+        with patch("claude_code_setup.commands.remove.perform_hook_removal") as mock_perform, \
+                patch("claude_code_setup.commands.remove.console") as mock_console:
+            removed = handle_hook_removal(
+                installed, ("validate-command", "missing"), False, True, False, tmp_path
+            )
+        
+        assert removed == installed
+        mock_perform.assert_called_once_with(installed, tmp_path, False)
+        banner = mock_console.print.call_args.args[0]
+        assert "Hooks Not Found" in str(banner.renderable)
+        assert "missing" in str(banner.renderable)
+    
     def test_remove_template_file(self, tmp_path):
         """Test removing a single template file."""
         # Create template file
@@ -123,6 +196,71 @@ class TestRemoveCommand:
         for _, _, path in templates_to_remove:
             assert not path.exists()
     
+    def test_remove_templates_batch_cleans_up_categories(self, setup_templates_for_removal):
+        """Test batch removal reports missing files and prunes empty categories."""
+        commands_dir = setup_templates_for_removal / "commands"
+        installed = find_installed_templates_for_removal(setup_templates_for_removal)
+        installed.append(("missing", "general", commands_dir / "general" / "missing.md"))
+        
+        successes, errors = remove_templates_batch(installed)
+        
+        assert len(successes) == 3
+        assert errors == ["missing (general): File not found"]
+        assert not (commands_dir / "general").exists()
+        assert not (commands_dir / "python").exists()
+    
+    def test_remove_templates_batch_dry_run(self, setup_templates_for_removal):
+        """Test batch dry run leaves every template in place."""
+        installed = find_installed_templates_for_removal(setup_templates_for_removal)
+        
+        successes, errors = remove_templates_batch(installed, dry_run=True)
+        
+        assert len(successes) == 3
+        assert errors == []
+        assert all(path.exists() for _, _, path in installed)
+    
+    def test_perform_template_removal(self, setup_templates_for_removal):
+        """Test concurrent removal deletes every file and prunes categories once."""
+        commands_dir = setup_templates_for_removal / "commands"
+        installed = find_installed_templates_for_removal(setup_templates_for_removal)
+        installed.append(("missing", "general", commands_dir / "general" / "missing.md"))
+        
+        with patch("claude_code_setup.commands.remove.show_removal_summary") as mock_summary:
+            perform_template_removal(installed, dry_run=False)
+        
+        successes, errors, item_type = mock_summary.call_args.args
+        assert len(successes) == 3
+        assert errors == ["missing (general): File not found"]
+        assert item_type == "template"
+        assert list(commands_dir.iterdir()) == []
+    
+    def test_perform_template_removal_opens_each_directory_once(self, setup_templates_for_removal):
+        """Test removal unlinks each category's files through one directory handle."""
+        from claude_code_setup.commands import remove as remove_module
+        
+        installed = find_installed_templates_for_removal(setup_templates_for_removal)
+        
+        with patch.object(
+            remove_module, "_open_directory", wraps=remove_module._open_directory
+        ) as mock_open, patch("claude_code_setup.commands.remove.show_removal_summary"):
+            perform_template_removal(installed, dry_run=False)
+        
+        opened = sorted(call.args[0] for call in mock_open.call_args_list)
+        assert opened == sorted({str(path.parent) for _, _, path in installed})
+        assert all(not path.exists() for _, _, path in installed)
+
+    def test_show_removal_summary_lists_errors(self):
+        """Test the summary panel lists every failed removal."""
+        with patch("claude_code_setup.commands.remove.console") as mock_console:
+            show_removal_summary(["a (general)"], ["b (general): boom"], "template")
+        
+        panel = mock_console.print.call_args.args[0]
+        assert panel.renderable == (
+            "[green]✓ Successfully removed 1 template(s)[/green]\n"
+            "[red]✗ Failed to remove 1 template(s)[/red]\n"
+            "  • b (general): boom"
+        )
+    
     def test_remove_permission_from_settings(self, setup_templates_for_removal):
         """Test removing a permission from settings."""
         success = remove_permission_from_settings(
@@ -137,6 +275,30 @@ class TestRemoveCommand:
         assert "Bash(npm:*)" not in settings["allowedTools"]
         assert len(settings["allowedTools"]) == 2  # Two permissions remain
     
+    def test_remove_permission_from_nested_settings(self, tmp_path):
+        """Test removing a permission from the nested permissions.allow format."""
+        settings = {"permissions": {"allow": ["Bash(npm:*)", "Bash(git:*)"]}}
+        (tmp_path / "settings.json").write_text(json.dumps(settings))
+        
+        success = remove_permission_from_settings("Bash(npm:*)", tmp_path)
+        
+        assert success is True
+        settings = json.loads((tmp_path / "settings.json").read_text())
+        assert settings["permissions"]["allow"] == ["Bash(git:*)"]
+    
+    def test_remove_permission_dry_run(self, setup_templates_for_removal):
+        """Test dry run reports the permission without rewriting settings."""
+        settings_path = setup_templates_for_removal / "settings.json"
+        original = settings_path.read_text()
+        
+        assert remove_permission_from_settings(
+            "Bash(npm:*)", setup_templates_for_removal, dry_run=True
+        ) is True
+        assert remove_permission_from_settings(
+            "Bash(missing:*)", setup_templates_for_removal, dry_run=True
+        ) is False
+        assert settings_path.read_text() == original
+    
     def test_remove_permission_not_found(self, setup_templates_for_removal):
         """Test removing a non-existent permission."""
         success = remove_permission_from_settings(
@@ -145,6 +307,15 @@ class TestRemoveCommand:
         
         assert success is False
     
+    def test_remove_permission_without_permission_list(self, tmp_path):
+        """Test settings without any permission list report not found."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"theme": "default"}))
+        
+        assert remove_permission_from_settings("Bash(npm:*)", tmp_path) is False
+        assert remove_permission_from_settings("Bash(npm:*)", tmp_path, dry_run=True) is False
+        assert json.loads(settings_path.read_text()) == {"theme": "default"}
+    
     def test_cli_remove_specific_template(self, runner, setup_templates_for_removal):
         """Test removing a specific template via CLI."""
         result = runner.invoke(
@@ -283,4 +454,26 @@ class TestRemoveCommand:
         
         # Check template still exists
         template_file = setup_templates_for_removal / "commands" / "general" / "code-review.md"
-        assert template_file.exists()
\ No newline at end of file
+        assert template_file.exists()
+    
+    def test_cli_remove_name_in_multiple_categories(self, runner, setup_templates_for_removal):
+        """Test a name installed in two categories is removed from both."""
+        commands_dir = setup_templates_for_removal / "commands"
+        (commands_dir / "python" / "code-review.md").write_text("# Python Review")
+        
+        result = runner.invoke(
+            cli,
+            [
+                "remove",
+                "code-review",
+                "missing",
+                "--test-dir",
+                str(setup_templates_for_removal),
+                "--force",
+            ],
+        )
+        
+        assert result.exit_code == 0
+        assert "missing" in result.output
+        assert not (commands_dir / "general" / "code-review.md").exists()
+        assert not (commands_dir / "python" / "code-review.md").exists()
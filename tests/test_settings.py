@@ -3,6 +3,7 @@
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -142,6 +143,13 @@ class TestThemeLoading:
         assert themes == sorted(themes)
         assert "default" in themes
 
+    def test_get_available_themes_sync_returns_copy(self):
+        """Test cached theme names cannot be mutated by callers."""
+        themes = get_available_themes_sync()
+        themes.append("mutated")
+
+        assert "mutated" not in get_available_themes_sync()
+
 
 class TestDefaultSettings:
     """Test default settings loading."""
@@ -261,6 +269,58 @@ class TestSettingsFileOperations:
             assert loaded_settings is not None
             assert isinstance(loaded_settings, ClaudeSettings)
 
+    def test_save_settings_sync_output_format(self):
+        """Test saved settings are indented JSON with unescaped unicode."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings_path = Path(temp_dir) / "settings.json"
+            settings = get_settings_sync(permission_sets=['git'])
+            settings.env = {"GREETING": "héllo"}
+        
+            save_settings_sync(settings, settings_path)
+        
+            expected = json.dumps(settings.model_dump(), indent=2, ensure_ascii=False)
+            assert settings_path.read_text(encoding='utf-8') == expected
+            assert read_settings_sync(settings_path) == settings
+
+    def test_save_settings_sync_failure_keeps_previous_file(self):
+        """Test a failed save leaves the previous file and no temp file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings_path = Path(temp_dir) / "settings.json"
+            settings_path.write_text('{"theme": "dark"}', encoding='utf-8')
+        
+            with patch('claude_code_setup.utils.settings.os.replace', side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    save_settings_sync(get_settings_sync(), settings_path)
+        
+            assert settings_path.read_text(encoding='utf-8') == '{"theme": "dark"}'
+            assert list(Path(temp_dir).iterdir()) == [settings_path]
+
+    def test_save_settings_sync_follows_symlink(self):
+        """Test saving through a symlink updates the link target."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target_path = Path(temp_dir) / "dotfiles" / "settings.json"
+            target_path.parent.mkdir()
+            target_path.write_text('{"theme": "dark"}', encoding='utf-8')
+            settings_path = Path(temp_dir) / "settings.json"
+            settings_path.symlink_to(target_path)
+            settings = get_settings_sync(permission_sets=['git'])
+            
+            save_settings_sync(settings, settings_path)
+            
+            assert settings_path.is_symlink()
+            assert read_settings_sync(target_path) == settings
+
+    def test_save_settings_sync_keeps_file_mode(self):
+        """Test saving keeps the permission bits of an existing file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings_path = Path(temp_dir) / "settings.json"
+            settings_path.write_text('{"theme": "dark"}', encoding='utf-8')
+            settings_path.chmod(0o600)
+            
+            save_settings_sync(get_settings_sync(), settings_path)
+            
+            assert settings_path.stat().st_mode & 0o777 == 0o600
+
     @pytest.mark.asyncio
     async def test_save_settings_creates_directory(self):
         """Test that save_settings creates parent directories."""
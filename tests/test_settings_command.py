@@ -6,12 +6,15 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from claude_code_setup.commands.settings import (
+    _group_permissions,
+    _read_settings_cached,
+    _save_settings,
     determine_settings_path,
     show_current_settings,
     manage_theme,
     run_settings_command,
 )
-from claude_code_setup.utils.settings import get_settings_sync
+from claude_code_setup.utils.settings import get_settings_sync, read_settings_sync
 from claude_code_setup.types import ClaudeSettings, PermissionsSettings
 
 
@@ -77,6 +80,104 @@ class TestShowCurrentSettings:
         assert "2 allowed" in call_args  # Permissions count
 
 
+class TestShowCurrentSettingsRender:
+    """Test the rendering of the current settings view."""
+
+    @patch('claude_code_setup.commands.settings.console')
+    def test_show_current_settings_single_render(self, mock_console, tmp_path):
+        """Test the header and table are printed in one call."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"theme": "dark"}))
+        
+        show_current_settings(settings_path)
+        
+        mock_console.print.assert_called_once()
+
+    def test_show_current_settings_counts_hooks(self, tmp_path):
+        """Test hooks are counted across every event group."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({
+            "hooks": {
+                "PreToolUse": [
+                    {"matcher": "Bash", "hooks": [
+                        {"type": "command", "command": "a.sh"},
+                        {"type": "command", "command": "b.sh"},
+                    ]},
+                ],
+                "Stop": [
+                    {"matcher": "*", "hooks": [{"type": "command", "command": "c.sh"}]},
+                ],
+            }
+        }))
+        
+        from rich.console import Console
+        output = Console(record=True, width=120)
+        with patch('claude_code_setup.commands.settings.console', output):
+            show_current_settings(settings_path)
+        
+        assert "3 registered" in output.export_text()
+
+    @patch('claude_code_setup.commands.settings.console')
+    def test_show_current_settings_reuses_view(self, mock_console, tmp_path):
+        """Test an unchanged file is shown without rebuilding the table."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"theme": "dark"}))
+        
+        show_current_settings(settings_path)
+        with patch('claude_code_setup.commands.settings.create_table') as mock_table:
+            show_current_settings(settings_path)
+            mock_table.assert_not_called()
+        
+        first, second = mock_console.print.call_args_list
+        assert first[0][0] is second[0][0]
+
+    @patch('claude_code_setup.commands.settings.console')
+    def test_save_settings_invalidates_view(self, mock_console, tmp_path):
+        """Test saving through the command rebuilds the next view."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"theme": "dark"}))
+        show_current_settings(settings_path)
+        
+        _save_settings(ClaudeSettings(theme="light"), settings_path)
+        show_current_settings(settings_path)
+        
+        first, second = mock_console.print.call_args_list
+        assert first[0][0] is not second[0][0]
+
+
+class TestSettingsCache:
+    """Test the in-process settings cache."""
+
+    def test_read_settings_cached_reuses_unchanged_file(self, tmp_path):
+        """Test an unchanged file is parsed only once."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"theme": "dark"}))
+        
+        with patch(
+            'claude_code_setup.commands.settings.read_settings_sync',
+            wraps=read_settings_sync,
+        ) as mock_read:
+            first = _read_settings_cached(settings_path)
+            first.theme = "edited"
+            second = _read_settings_cached(settings_path)
+        
+        assert mock_read.call_count == 1
+        assert second.theme == "dark"
+
+    def test_save_settings_refreshes_cache(self, tmp_path):
+        """Test saved settings are served without re-reading the file."""
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps({"theme": "dark"}))
+        settings = _read_settings_cached(settings_path)
+        settings.theme = "light"
+        
+        _save_settings(settings, settings_path)
+        
+        with patch('claude_code_setup.commands.settings.read_settings_sync') as mock_read:
+            assert _read_settings_cached(settings_path).theme == "light"
+            mock_read.assert_not_called()
+
+
 class TestManageTheme:
     """Test theme management."""
 
@@ -130,6 +231,163 @@ class TestManageTheme:
         
         assert result is False
 
+    @patch('claude_code_setup.commands.settings.error')
+    @patch('claude_code_setup.commands.settings.get_available_themes_sync')
+    @patch('claude_code_setup.commands.settings.console')
+    def test_manage_theme_reports_errors(self, mock_console, mock_get_themes, mock_error):
+        """Test unexpected errors are reported and return False."""
+        mock_get_themes.side_effect = RuntimeError("boom")
+        
+        assert manage_theme(Path("/tmp/settings.json")) is False
+        mock_error.assert_called_once_with("Failed to update theme: boom")
+
+    @patch('claude_code_setup.commands.settings.get_available_themes_sync')
+    @patch('claude_code_setup.commands.settings.console')
+    def test_manage_theme_propagates_cancel(self, mock_console, mock_get_themes):
+        """Test cancelling is left to the calling menu."""
+        mock_get_themes.side_effect = KeyboardInterrupt
+        
+        with pytest.raises(KeyboardInterrupt):
+            manage_theme(Path("/tmp/settings.json"))
+
+
+class TestManageEnvironmentVariables:
+    """Test environment variable management."""
+
+    @patch('claude_code_setup.commands.settings._save_settings')
+    @patch('claude_code_setup.commands.settings._read_settings_cached')
+    @patch('claude_code_setup.commands.settings.Prompt.ask')
+    @patch('claude_code_setup.commands.settings.console')
+    def test_view_only_does_not_save(self, mock_console, mock_prompt, mock_read, mock_save):
+        """Test leaving the menu without edits skips the save."""
+        mock_read.return_value = ClaudeSettings(env={"FOO": "bar"})
+        mock_prompt.return_value = "4"
+        
+        from claude_code_setup.commands.settings import manage_environment_variables
+        assert manage_environment_variables(Path("/tmp/settings.json")) is True
+        
+        mock_save.assert_not_called()
+
+    @patch('claude_code_setup.commands.settings._read_settings_cached')
+    @patch('claude_code_setup.commands.settings.Prompt.ask')
+    def test_long_values_are_masked(self, mock_prompt, mock_read):
+        """Test values longer than 20 characters are shortened for display."""
+        mock_read.return_value = ClaudeSettings(
+            env={"SHORT": "visible", "TOKEN": "abcdefghij0123456789XYZWV"}
+        )
+        mock_prompt.return_value = "4"
+        
+        from rich.console import Console
+        from claude_code_setup.commands.settings import manage_environment_variables
+        output = Console(record=True, width=120)
+        with patch('claude_code_setup.commands.settings.console', output):
+            manage_environment_variables(Path("/tmp/settings.json"))
+        
+        text = output.export_text()
+        assert "visible" in text
+        assert "abcdefghij...XYZWV" in text
+        assert "0123456789" not in text
+
+    @patch('claude_code_setup.commands.settings._save_settings')
+    @patch('claude_code_setup.commands.settings._read_settings_cached')
+    @patch('claude_code_setup.commands.settings.Prompt.ask')
+    @patch('claude_code_setup.commands.settings.console')
+    def test_edit_saves_once(self, mock_console, mock_prompt, mock_read, mock_save):
+        """Test edits are saved once when leaving the menu."""
+        mock_read.return_value = ClaudeSettings(env={"FOO": "bar"})
+        mock_prompt.side_effect = ["1", "BAZ", "qux", "2", "FOO", "4"]
+        
+        from claude_code_setup.commands.settings import manage_environment_variables
+        assert manage_environment_variables(Path("/tmp/settings.json")) is True
+        
+        mock_save.assert_called_once()
+        assert mock_save.call_args[0][0].env == {"BAZ": "qux"}
+
+
+class TestManagePermissions:
+    """Test permission management."""
+
+    def test_group_permissions(self):
+        """Test Bash permissions are grouped by command prefix."""
+        groups = _group_permissions([
+            "Bash(git:*)", "Read(*)", "Bash(ls)", "Bash(git status:*)", "Bash(npm:*)",
+        ])
+        
+        assert groups == {
+            "git": ["Bash(git:*)"],
+            "misc": ["Bash(ls)"],
+            "git status": ["Bash(git status:*)"],
+            "npm": ["Bash(npm:*)"],
+        }
+
+    @patch('claude_code_setup.commands.settings._save_settings')
+    @patch('claude_code_setup.commands.settings._read_settings_cached')
+    @patch('claude_code_setup.commands.settings.Prompt.ask')
+    @patch('claude_code_setup.commands.settings.console')
+    def test_add_custom_permission_skips_duplicates(self, mock_console, mock_prompt, mock_read, mock_save):
+        """Test an already allowed custom permission is not added again."""
+        mock_read.return_value = ClaudeSettings(
+            permissions=PermissionsSettings(allow=["Bash(git:*)", "Bash(ls:*)"])
+        )
+        mock_prompt.side_effect = [
+            "2", " Bash(git:*) ",
+            "2", "Bash(docker:*)",
+            "5",
+        ]
+        
+        from claude_code_setup.commands.settings import manage_permissions
+        assert manage_permissions(Path("/tmp/settings.json")) is True
+        
+        mock_save.assert_called_once()
+        saved_settings = mock_save.call_args[0][0]
+        assert saved_settings.permissions.allow == [
+            "Bash(git:*)", "Bash(ls:*)", "Bash(docker:*)"
+        ]
+
+    @patch('claude_code_setup.ui.prompts.MultiSelectPrompt')
+    @patch('claude_code_setup.commands.settings._save_settings')
+    @patch('claude_code_setup.commands.settings._read_settings_cached')
+    @patch('claude_code_setup.commands.settings.Prompt.ask')
+    @patch('claude_code_setup.commands.settings.console')
+    def test_remove_permissions_keeps_order(self, mock_console, mock_prompt, mock_read, mock_save, mock_multi_select):
+        """Test removing several permissions keeps the remaining order."""
+        mock_read.return_value = ClaudeSettings(
+            permissions=PermissionsSettings(
+                allow=["Bash(git:*)", "Bash(ls:*)", "Bash(cat:*)", "Bash(rm:*)"]
+            )
+        )
+        mock_prompt.side_effect = ["3", "3", "5"]
+        mock_multi_select.return_value.ask.side_effect = [
+            ["Bash(rm:*)", "Bash(git:*)"],
+            [],
+        ]
+        
+        from claude_code_setup.commands.settings import manage_permissions
+        assert manage_permissions(Path("/tmp/settings.json")) is True
+        
+        saved_settings = mock_save.call_args[0][0]
+        assert saved_settings.permissions.allow == ["Bash(ls:*)", "Bash(cat:*)"]
+        second_options = mock_multi_select.call_args_list[1].kwargs["options"]
+        assert [option.value for option in second_options] == ["Bash(ls:*)", "Bash(cat:*)"]
+
+
+class TestShowSettingsMenu:
+    """Test the interactive settings menu."""
+
+    @patch('claude_code_setup.commands.settings.Prompt.ask')
+    @patch('claude_code_setup.commands.settings.console')
+    def test_menu_printed_in_one_call(self, mock_console, mock_prompt):
+        """Test the header and actions are printed together."""
+        mock_prompt.return_value = "6"
+        
+        from claude_code_setup.commands.settings import show_settings_menu
+        show_settings_menu(Path("/tmp/settings.json"))
+        
+        menu = mock_console.print.call_args_list[0][0][0]
+        assert "Configuration: /tmp/settings.json" in menu
+        assert "6. ❌ Exit" in menu
+        assert mock_console.print.call_count == 2
+
 
 class TestRunSettingsCommand:
     """Test the main settings command entry point."""
@@ -1,5 +1,8 @@
 """Tests for template utilities."""
 
+import time
+from unittest.mock import patch
+
 import pytest
 
 from claude_code_setup.utils.template import (
@@ -15,6 +18,7 @@ from claude_code_setup.utils.template import (
     get_templates_directory,
     load_templates_from_files,
     load_templates_from_files_sync,
+    set_cache_ttl,
     validate_template_content,
     validate_template_content_sync,
 )
@@ -310,4 +314,19 @@ class TestTemplateCaching:
         
         # Content should be the same but objects should be different
         assert len(templates1.templates) == len(templates2.templates)
-        # Note: We can't test object identity easily since the cache is internal
\ No newline at end of file
+        # Note: We can't test object identity easily since the cache is internal
+
+    def test_expired_cache_reused_when_templates_unchanged(self):
+        """Test an expired cache is kept while template files are unchanged."""
+        clear_template_cache()
+        templates1 = get_all_templates_sync()
+        
+        try:
+            # Expire the TTL immediately; files on disk have not changed
+            set_cache_ttl(1)
+            with patch("claude_code_setup.utils.template.time.time", return_value=time.time() + 10):
+                templates2 = get_all_templates_sync()
+        finally:
+            set_cache_ttl(300)
+        
+        assert templates1 is templates2
@@ -13,6 +13,7 @@ from claude_code_setup.commands.update import (
     compare_template_content,
     find_installed_templates,
     get_updatable_templates,
+    show_update_selection,
     update_settings,
     update_templates_batch,
 )
@@ -129,6 +130,15 @@ class TestUpdateCommand:
         assert "test-template-2" in installed["python"]
         assert "node" not in installed  # Not installed
     
+    def test_find_installed_templates_empty_registry(self, tmp_path):
+        """Test an empty registry finds nothing without starting workers."""
+        with patch("claude_code_setup.commands.update.get_all_templates_sync") as mock_get_all:
+            mock_get_all.return_value = self._create_mock_registry([])
+            
+            with patch("claude_code_setup.commands.update.ThreadPoolExecutor") as MockExecutor:
+                assert find_installed_templates(tmp_path / ".claude") == {}
+                MockExecutor.assert_not_called()
+    
     def test_get_updatable_templates(self, setup_installed_templates, mock_templates):
         """Test getting list of updatable templates."""
         from claude_code_setup.utils.template import TemplateRegistry
@@ -175,10 +185,8 @@ class TestUpdateCommand:
             ("test-template-2", "python"),
         ]
         
-        with patch("claude_code_setup.commands.update.get_template_sync") as mock_get:
-            mock_get.side_effect = lambda name: next(
-                (t for t in mock_templates if t.name == name), None
-            )
+        with patch("claude_code_setup.commands.update.get_all_templates_sync") as mock_get_all:
+            mock_get_all.return_value = self._create_mock_registry(mock_templates)
             
             with patch("claude_code_setup.commands.update.TemplateInstaller") as MockInstaller:
                 mock_installer = MockInstaller.return_value
@@ -193,6 +201,41 @@ class TestUpdateCommand:
         assert len(results) == 2
         assert len(errors) == 0
         assert mock_installer.install_template.call_count == 2
+        mock_get_all.assert_called_once()
+    
+    def test_update_templates_batch_reports_missing(self, tmp_path, mock_templates):
+        """Test templates missing from the registry are reported as errors."""
+        with patch("claude_code_setup.commands.update.get_all_templates_sync") as mock_get_all:
+            mock_get_all.return_value = self._create_mock_registry(mock_templates)
+            
+            with patch("claude_code_setup.commands.update.TemplateInstaller"):
+                results, errors = update_templates_batch(
+                    [("missing-template", "general")], tmp_path / ".claude"
+                )
+                
+        assert results == []
+        assert errors == ["Template 'missing-template' not found"]
+    
+    def test_show_update_selection_maps_categories(self):
+        """Test selected template lines are mapped back to their categories."""
+        updatable = [
+            ("test-template-1", "general", True),
+            ("test-template-2", "python", False),
+        ]
+        
+        with patch("claude_code_setup.commands.update.MultiSelectPrompt") as MockPrompt:
+            MockPrompt.return_value.ask.return_value = [
+                "[dim]PYTHON[/dim]",
+                "  [green]✓[/green] test-template-2",
+                "  [red]•[/red] test-template-1",
+            ]
+            
+            selected = show_update_selection(updatable, Path("/tmp"))
+            
+        assert selected == [
+            ("test-template-2", "python"),
+            ("test-template-1", "general"),
+        ]
     
     def test_update_settings(self, tmp_path):
         """Test updating settings file."""